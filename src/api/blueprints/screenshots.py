@@ -7,6 +7,7 @@ from flask import request, Response, abort
 from flask_restx import Namespace, Resource, fields
 
 from src.infrastructure.dependency_injection import get_container
+from src.utils.image_format import image_format, image_mime_type
 
 
 def run_async(coro):
@@ -140,7 +141,7 @@ class ScreenshotTake(Resource):
 @screenshots_bp.route('/preview')
 class ScreenshotPreview(Resource):
     def get(self):
-        """Get preview screenshot (returns PNG image data)"""
+        """Get preview screenshot (returns PNG or JPEG image data)"""
         try:
             container = get_container()
             screenshot_controller = container.get(ScreenshotController)
@@ -148,12 +149,13 @@ class ScreenshotPreview(Resource):
             result = run_async(screenshot_controller.get_preview({}))
             
             if result and isinstance(result, bytes):
+                mime_type = image_mime_type(image_format(result))
                 return Response(
                     result,
-                    mimetype='image/png',
+                    mimetype=mime_type,
                     headers={
                         'Cache-Control': 'no-cache',
-                        'Content-Type': 'image/png'
+                        'Content-Type': mime_type
                     }
                 )
             else:
@@ -188,12 +190,13 @@ class ScreenshotImage(Resource):
             image_data = run_async(screenshot_controller.get_screenshot_image(screenshot_id))
             
             if image_data:
+                mime_type = image_mime_type(image_format(image_data))
                 return Response(
                     image_data,
-                    mimetype='image/png',
+                    mimetype=mime_type,
                     headers={
                         'Cache-Control': 'public, max-age=3600',  # Cache for 1 hour
-                        'Content-Type': 'image/png'
+                        'Content-Type': mime_type
                     }
                 )
             else:
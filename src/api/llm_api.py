@@ -7,6 +7,8 @@ import os
 from typing import Optional, Dict, Any, List, Tuple
 from PIL import Image
 
+from src.utils.image_format import image_format, image_mime_type
+
 
 class LLMAnalyzer:
     """Handles AI-powered analysis of screenshots"""
@@ -231,18 +233,19 @@ class LLMAnalyzer:
             provider = next(iter(self._clients.keys()))
         
         try:
-            # Convert image to base64
+            # Convert image to base64; captures may be PNG or JPEG
             image_base64 = base64.b64encode(image_data).decode('utf-8')
+            mime_type = image_mime_type(image_format(image_data))
             
             # Use custom prompt or default
             prompt = custom_prompt or self.llm_prompt
             
             if provider == 'azure':
-                return self._analyze_with_azure(image_base64, prompt, model)
+                return self._analyze_with_azure(image_base64, prompt, model, mime_type)
             elif provider == 'github':
-                return self._analyze_with_github(image_base64, prompt, model)
+                return self._analyze_with_github(image_base64, prompt, model, mime_type)
             elif provider == 'openai':
-                return self._analyze_with_openai(image_base64, prompt, model)
+                return self._analyze_with_openai(image_base64, prompt, model, mime_type)
             else:
                 return None
                 
@@ -250,7 +253,8 @@ class LLMAnalyzer:
             print(f"Error analyzing image with {provider}: {e}")
             return None
     
-    def _analyze_with_azure(self, image_base64: str, prompt: str, model: str = None) -> Optional[str]:
+    def _analyze_with_azure(self, image_base64: str, prompt: str, model: str = None,
+                            mime_type: str = 'image/png') -> Optional[str]:
         """Analyze image using Azure AI"""
         try:
             from azure.ai.inference.models import (
@@ -271,7 +275,7 @@ class LLMAnalyzer:
                     TextContentItem(text=prompt),
                     ImageContentItem(
                         image_url=ImageUrl(
-                            url=f"data:image/png;base64,{image_base64}",
+                            url=f"data:{mime_type};base64,{image_base64}",
                             detail=ImageDetailLevel.HIGH,
                         ),
                     ),
@@ -296,7 +300,8 @@ class LLMAnalyzer:
         
         return None
     
-    def _analyze_with_github(self, image_base64: str, prompt: str, model: str = None) -> Optional[str]:
+    def _analyze_with_github(self, image_base64: str, prompt: str, model: str = None,
+                             mime_type: str = 'image/png') -> Optional[str]:
         """Analyze image using GitHub Models"""
         try:
             from azure.ai.inference.models import (
@@ -317,7 +322,7 @@ class LLMAnalyzer:
                     TextContentItem(text=prompt),
                     ImageContentItem(
                         image_url=ImageUrl(
-                            url=f"data:image/png;base64,{image_base64}",
+                            url=f"data:{mime_type};base64,{image_base64}",
                             detail=ImageDetailLevel.HIGH,
                         ),
                     ),
@@ -342,7 +347,8 @@ class LLMAnalyzer:
         
         return None
     
-    def _analyze_with_openai(self, image_base64: str, prompt: str, model: str = None) -> Optional[str]:
+    def _analyze_with_openai(self, image_base64: str, prompt: str, model: str = None,
+                             mime_type: str = 'image/png') -> Optional[str]:
         """Analyze image using OpenAI"""
         try:
             client = self._clients['openai']
@@ -364,7 +370,7 @@ class LLMAnalyzer:
                             {
                                 "type": "image_url",
                                 "image_url": {
-                                    "url": f"data:image/png;base64,{image_base64}"
+                                    "url": f"data:{mime_type};base64,{image_base64}"
                                 }
                             }
                         ]
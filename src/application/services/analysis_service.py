@@ -12,6 +12,7 @@ import io
 from src.domain.interfaces.analysis_service import IAnalysisService
 from src.domain.interfaces.storage_service import IRepository
 from src.domain.interfaces.event_service import IEventService
+from src.domain.interfaces.change_detection_strategy import IChangeDetectionStrategy
 from src.domain.entities.screenshot import Screenshot
 from src.domain.entities.analysis_result import AnalysisResult
 from src.domain.entities.roi_region import ROIRegion
@@ -22,15 +23,21 @@ logger = logging.getLogger(__name__)
 
 
 class AnalysisService(IAnalysisService):
-    """Concrete implementation of analysis service"""
+    """Concrete implementation of analysis service
+    
+    detect_changes delegates frames that are not byte-identical to
+    change_detector. Without one it falls back to comparing encoded sizes.
+    """
     
     def __init__(
         self,
         analysis_repository: IRepository[AnalysisResult],
-        event_service: IEventService
+        event_service: IEventService,
+        change_detector: Optional[IChangeDetectionStrategy] = None
     ):
         self._analysis_repository = analysis_repository
         self._event_service = event_service
+        self._change_detector = change_detector
         
     async def compare_screenshots(
         self, 
@@ -110,10 +117,30 @@ class AnalysisService(IAnalysisService):
     ) -> Tuple[bool, float]:
         """Detect if changes occurred between screenshots"""
         try:
-            # TODO: Implement actual change detection
-            # For now, simulate change detection based on simple heuristics
+            # Identical encoded frames mean identical pixels (PNG encoding is
+            # deterministic), so settle the common static-screen case exactly.
+            # bytes equality compares lengths before any content.
+            reference_data = reference_screenshot.data
+            current_data = current_screenshot.data
+            if reference_data is not None and current_data is not None:
+                if reference_data is current_data or reference_data == current_data:
+                    return False, 0.0
+                
+                if self._change_detector is not None:
+                    # The detector keeps one baseline; nothing awaits between
+                    # setting it and detecting, so sessions cannot interleave
+                    detector = self._change_detector
+                    if detector.initialize(reference_data):
+                        result = detector.detect_changes(current_data, threshold)
+                        if 'error' not in result:
+                            logger.debug(
+                                f"Change detection ({detector.get_strategy_name()}): "
+                                f"score={result['change_score']:.2f}, detected={result['has_changes']}"
+                            )
+                            return result['has_changes'], result['change_score']
+                        logger.warning(f"Change detector failed, comparing sizes: {result['error']}")
             
-            # Calculate simple difference score (placeholder)
+            # Without a detector, or without the image data, compare encoded sizes
             size_diff = abs(reference_screenshot.size_bytes - current_screenshot.size_bytes)
             max_size = max(reference_screenshot.size_bytes, current_screenshot.size_bytes)
             
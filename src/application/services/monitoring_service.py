@@ -269,8 +269,19 @@ class MonitoringService(IMonitoringService):
         session: MonitoringSession, 
         on_change_callback: Optional[Callable]
     ) -> None:
-        """Main monitoring loop for ROI region"""
+        """Main monitoring loop for ROI region
+        
+        The next capture is scheduled as soon as the current one arrives, so
+        the check interval and that capture run while the current frame is
+        compared and the session saved. Captures are timed against a fixed
+        schedule on the loop's monotonic clock, so capture time does not
+        stretch the period; after falling more than two intervals behind the
+        schedule restarts from now instead of bursting to catch up.
+        """
         reference_screenshot = None
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
+        next_capture = asyncio.create_task(self._capture_after(session, 0))
         
         try:
             while session.status == "running":
@@ -279,9 +290,18 @@ class MonitoringService(IMonitoringService):
                     continue
                 
                 # Capture current screenshot
-                current_screenshot = await self._screenshot_service.capture_roi(
-                    session.roi_region,
-                    metadata={"session_id": session.id}
+                current_screenshot = await next_capture
+                if session.status != "running":
+                    break
+                
+                # Start the next interval now rather than after processing
+                interval = session.check_interval
+                deadline += interval
+                now = loop.time()
+                if now - deadline > 2 * interval:
+                    deadline = now
+                next_capture = asyncio.create_task(
+                    self._capture_after(session, deadline - now)
                 )
                 
                 session.screenshots_captured += 1
@@ -307,7 +327,7 @@ class MonitoringService(IMonitoringService):
                             screenshot_triggered=True,
                             screenshot_id=current_screenshot.id
                         )
-                        await self._event_service.publish(event)
+                        self._event_service.publish_nowait(event)
                         
                         # Call change callback if provided
                         if on_change_callback:
@@ -325,9 +345,6 @@ class MonitoringService(IMonitoringService):
                 # Update session in repository
                 await self._session_repository.update(session)
                 
-                # Wait for next check
-                await asyncio.sleep(session.check_interval)
-                
         except asyncio.CancelledError:
             logger.info(f"Monitoring loop cancelled for session: {session.id}")
             raise
@@ -348,3 +365,17 @@ class MonitoringService(IMonitoringService):
             session.status = "error"
             session.end_time = datetime.now()
             await self._session_repository.update(session)
+        finally:
+            if not next_capture.done():
+                next_capture.cancel()
+            elif not next_capture.cancelled():
+                next_capture.exception()  # consumed here if it failed after the loop ended
+    
+    async def _capture_after(self, session: MonitoringSession, delay: float) -> Screenshot:
+        """Capture the session's ROI after waiting delay seconds"""
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return await self._screenshot_service.capture_roi(
+            session.roi_region,
+            metadata={"session_id": session.id}
+        )
@@ -11,15 +11,17 @@ from datetime import datetime
 import logging
 
 from src.domain.interfaces.screenshot_service import IScreenshotService
-from src.domain.interfaces.storage_service import IFileStorageService, IRepository
+from src.domain.interfaces.storage_service import IFileStorageService
 from src.domain.interfaces.event_service import IEventService
 from src.domain.interfaces.capture_service import ICaptureService
+from src.domain.repositories.screenshot_repository import IScreenshotRepository
 from src.domain.entities.screenshot import Screenshot
 from src.domain.entities.roi_region import ROIRegion
 from src.domain.value_objects.coordinates import Rectangle
 from src.domain.value_objects.timestamp import Timestamp
 from src.domain.value_objects.file_path import FilePath
 from src.domain.events.screenshot_captured import ScreenshotCaptured
+from src.utils.image_format import image_format, image_extension
 
 
 logger = logging.getLogger(__name__)
@@ -31,7 +33,7 @@ class ScreenshotService(IScreenshotService):
     def __init__(
         self,
         file_storage: IFileStorageService,
-        screenshot_repository: IRepository[Screenshot],
+        screenshot_repository: IScreenshotRepository,
         event_service: IEventService,
         capture_service: ICaptureService
     ):
@@ -79,10 +81,11 @@ class ScreenshotService(IScreenshotService):
             # Create screenshot entity
             screenshot_id = str(uuid.uuid4())
             timestamp = Timestamp.now()
-            file_path = FilePath(f"screenshot_{screenshot_id}.png")
+            capture_metadata = capture_result.metadata or {}
+            image_fmt = image_format(capture_result.data, capture_metadata.get('format'))
+            file_path = FilePath(f"screenshot_{screenshot_id}{image_extension(image_fmt)}")
             
             # Get dimensions from capture metadata or use defaults
-            capture_metadata = capture_result.metadata or {}
             width = capture_metadata.get('width', 1920)
             height = capture_metadata.get('height', 1080)
             
@@ -92,7 +95,7 @@ class ScreenshotService(IScreenshotService):
                 timestamp=timestamp,
                 width=width,
                 height=height,
-                format="PNG",
+                format=image_fmt.upper(),
                 size_bytes=len(capture_result.data),
                 metadata=metadata or {},
                 data=capture_result.data  # Store binary data
@@ -117,7 +120,7 @@ class ScreenshotService(IScreenshotService):
                     width=screenshot.width,
                     height=screenshot.height
                 )
-                await self._event_service.publish(event)
+                self._event_service.publish_nowait(event)
             else:
                 logger.info(f"Created temporary preview screenshot: {screenshot_id}")
             
@@ -144,7 +147,8 @@ class ScreenshotService(IScreenshotService):
             
             screenshot_id = str(uuid.uuid4())
             timestamp = Timestamp.now()
-            file_path = FilePath(f"region_{screenshot_id}.png")
+            image_fmt = image_format(capture_result.data, (capture_result.metadata or {}).get('format'))
+            file_path = FilePath(f"region_{screenshot_id}{image_extension(image_fmt)}")
             
             # Create screenshot entity
             screenshot = Screenshot(
@@ -153,7 +157,7 @@ class ScreenshotService(IScreenshotService):
                 timestamp=timestamp,
                 width=region.width,
                 height=region.height,
-                format="PNG",
+                format=image_fmt.upper(),
                 size_bytes=len(capture_result.data),
                 metadata=metadata or {},
                 data=capture_result.data
@@ -185,7 +189,7 @@ class ScreenshotService(IScreenshotService):
                 width=screenshot.width,
                 height=screenshot.height
             )
-            await self._event_service.publish(event)
+            self._event_service.publish_nowait(event)
             
             logger.info(f"Captured region screenshot: {screenshot_id}")
             return screenshot
@@ -219,7 +223,7 @@ class ScreenshotService(IScreenshotService):
             
             screenshot = await self.capture_region(region, metadata=roi_metadata)
             
-            logger.info(f"Captured ROI screenshot: {roi.id}")
+            logger.debug(f"Captured ROI screenshot: {roi.id}")
             return screenshot
             
         except Exception as e:
@@ -249,7 +253,7 @@ class ScreenshotService(IScreenshotService):
             elif isinstance(screenshot.file_path, str):
                 filename = Path(screenshot.file_path).name
             else:
-                filename = f"screenshot_{screenshot.id}.png"
+                filename = f"screenshot_{screenshot.id}{image_extension(image_format(screenshot.data, screenshot.format))}"
                 
             # Save the file using storage service
             full_path = await self._file_storage.save_file(
@@ -301,6 +305,14 @@ class ScreenshotService(IScreenshotService):
             logger.error(f"Failed to list screenshots: {e}")
             return []
     
+    async def count_screenshots(self) -> int:
+        """Count stored screenshots without listing them"""
+        try:
+            return await self._screenshot_repository.get_total_count()
+        except Exception as e:
+            logger.error(f"Failed to count screenshots: {e}")
+            return 0
+    
     async def delete_screenshot(self, screenshot_id: str) -> bool:
         """Delete screenshot by ID"""
         try:
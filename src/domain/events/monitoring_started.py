@@ -6,10 +6,10 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Dict, Optional
 import uuid
-from .screenshot_captured import BaseDomainEvent
+from .screenshot_captured import BaseDomainEvent, _SLOTS
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class MonitoringStarted(BaseDomainEvent):
     """Event fired when ROI monitoring starts"""
     
@@ -21,7 +21,7 @@ class MonitoringStarted(BaseDomainEvent):
     configuration: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class MonitoringStopped(BaseDomainEvent):
     """Event fired when ROI monitoring stops"""
     
@@ -33,7 +33,7 @@ class MonitoringStopped(BaseDomainEvent):
     reason: str = "manual"  # manual, error, system
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class MonitoringPaused(BaseDomainEvent):
     """Event fired when ROI monitoring is paused"""
     
@@ -42,7 +42,7 @@ class MonitoringPaused(BaseDomainEvent):
     reason: str = "manual"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class MonitoringResumed(BaseDomainEvent):
     """Event fired when ROI monitoring is resumed"""
     
@@ -50,7 +50,7 @@ class MonitoringResumed(BaseDomainEvent):
     roi_id: str = ""
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ChangeDetected(BaseDomainEvent):
     """Event fired when a change is detected in ROI"""
     
@@ -63,7 +63,7 @@ class ChangeDetected(BaseDomainEvent):
     detection_method: str = "threshold"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ROIUpdated(BaseDomainEvent):
     """Event fired when ROI configuration is updated"""
     
@@ -75,7 +75,7 @@ class ROIUpdated(BaseDomainEvent):
     updated_by: str = "system"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class MonitoringError(BaseDomainEvent):
     """Event fired when monitoring encounters an error"""
     
@@ -5,14 +5,33 @@ Events represent something important that happened in the domain
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Dict, Optional
-import uuid
+import itertools
+import os
+import sys
+import time
 
 
-@dataclass
+# Events are slotted where dataclasses support it (3.10+): no per-instance
+# __dict__, which matters with a thousand of them held in the event history
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+# Event ids are a per-process prefix plus a counter: unique within the
+# process and far cheaper than a uuid4 per event
+_EVENT_ID_BASE = f"{os.getpid():x}-{time.time_ns():x}-"
+_event_id_counter = itertools.count()
+
+
+def _next_event_id() -> str:
+    """Generate an event id that is unique within this process"""
+    return _EVENT_ID_BASE + format(next(_event_id_counter), 'x')
+
+
+@dataclass(**_SLOTS)
 class BaseDomainEvent:
     """Base class for all domain events"""
     
-    event_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    event_id: str = field(default_factory=_next_event_id)
     occurred_at: datetime = field(default_factory=datetime.now)
     event_type: str = field(init=False)
     aggregate_id: str = ""
@@ -23,7 +42,7 @@ class BaseDomainEvent:
         self.event_type = self.__class__.__name__
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ScreenshotCaptured(BaseDomainEvent):
     """Event fired when a screenshot is captured"""
     
@@ -37,7 +56,7 @@ class ScreenshotCaptured(BaseDomainEvent):
     height: int = 0
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ScreenshotAnalysisStarted(BaseDomainEvent):
     """Event fired when screenshot analysis begins"""
     
@@ -48,7 +67,7 @@ class ScreenshotAnalysisStarted(BaseDomainEvent):
     prompt: str = ""
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ScreenshotAnalysisCompleted(BaseDomainEvent):
     """Event fired when screenshot analysis completes"""
     
@@ -61,7 +80,7 @@ class ScreenshotAnalysisCompleted(BaseDomainEvent):
     success: bool = True
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ScreenshotAnalysisFailed(BaseDomainEvent):
     """Event fired when screenshot analysis fails"""
     
@@ -6,10 +6,10 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Dict, Optional, List
 import uuid
-from .screenshot_captured import BaseDomainEvent
+from .screenshot_captured import BaseDomainEvent, _SLOTS
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class SystemStarted(BaseDomainEvent):
     """Event fired when the system starts up"""
     
@@ -19,7 +19,7 @@ class SystemStarted(BaseDomainEvent):
     startup_time_ms: float = 0.0
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class SystemShutdown(BaseDomainEvent):
     """Event fired when the system shuts down"""
     
@@ -29,7 +29,7 @@ class SystemShutdown(BaseDomainEvent):
     files_cleaned: int = 0
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ConfigurationChanged(BaseDomainEvent):
     """Event fired when system configuration changes"""
     
@@ -40,7 +40,7 @@ class ConfigurationChanged(BaseDomainEvent):
     restart_required: bool = False
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class StorageCleanup(BaseDomainEvent):
     """Event fired when storage cleanup occurs"""
     
@@ -50,7 +50,7 @@ class StorageCleanup(BaseDomainEvent):
     cleanup_type: str = "scheduled"  # scheduled, manual, low_space
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class HealthCheckPerformed(BaseDomainEvent):
     """Event fired when health check is performed"""
     
@@ -61,7 +61,7 @@ class HealthCheckPerformed(BaseDomainEvent):
     issues: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ResourceLimit(BaseDomainEvent):
     """Event fired when resource limits are approached/exceeded"""
     
@@ -72,7 +72,7 @@ class ResourceLimit(BaseDomainEvent):
     action_taken: str = "none"  # none, warning, cleanup, throttle
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ServiceError(BaseDomainEvent):
     """Event fired when a service encounters an error"""
     
@@ -85,7 +85,7 @@ class ServiceError(BaseDomainEvent):
     context: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ChangeDetectionEvent(BaseDomainEvent):
     """Event fired when a change is detected in monitoring"""
     
@@ -97,7 +97,7 @@ class ChangeDetectionEvent(BaseDomainEvent):
     baseline_updated: bool = False
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ChangeDetectionStartedEvent(BaseDomainEvent):
     """Event fired when change detection monitoring starts"""
     
@@ -108,7 +108,7 @@ class ChangeDetectionStartedEvent(BaseDomainEvent):
     baseline_initialized: bool = False
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ChangeDetectionStoppedEvent(BaseDomainEvent):
     """Event fired when change detection monitoring stops"""
     
@@ -119,7 +119,7 @@ class ChangeDetectionStoppedEvent(BaseDomainEvent):
     reason: str = "manual"  # manual, error, shutdown
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ChangeDetectionStrategyChangedEvent(BaseDomainEvent):
     """Event fired when the change detection strategy is changed"""
     
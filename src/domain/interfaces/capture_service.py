@@ -58,13 +58,15 @@ class ICaptureService(ABC):
     @abstractmethod
     async def capture_roi(
         self, 
-        roi: Tuple[int, int, int, int]
+        roi: Tuple[int, int, int, int],
+        scale: float = 1.0
     ) -> CaptureResult:
         """
         Capture screenshot of specific ROI coordinates
         
         Args:
             roi: ROI coordinates as (left, top, right, bottom)
+            scale: Downsampling factor in (0, 1] applied before encoding
             
         Returns:
             CaptureResult with captured ROI data
@@ -25,6 +25,19 @@ class IEventService(ABC):
         """
         pass
     
+    @abstractmethod
+    def publish_nowait(self, event: BaseDomainEvent) -> None:
+        """
+        Queue domain event for publishing without waiting for subscribers
+        
+        Safe to call from any thread or event loop. Events are delivered in
+        the order they were queued.
+        
+        Args:
+            event: Domain event to publish
+        """
+        pass
+    
     @abstractmethod
     def subscribe(
         self, 
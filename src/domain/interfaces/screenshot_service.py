@@ -121,6 +121,18 @@ class IScreenshotService(ABC):
         """
         pass
     
+    async def count_screenshots(self) -> int:
+        """
+        Count stored screenshots
+        
+        Implementations backed by a repository with a cheap count should
+        override this; the default lists every screenshot.
+        
+        Returns:
+            Number of screenshots
+        """
+        return len(await self.list_screenshots())
+    
     @abstractmethod
     async def delete_screenshot(self, screenshot_id: str) -> bool:
         """
@@ -1,9 +1,19 @@
 """
 Infrastructure Package
 Infrastructure layer implementations and utilities
+
+Subpackages are imported on first access; importing any infrastructure
+module no longer builds the whole DI container's import graph.
 """
+import importlib
+
+_SUBPACKAGES = ("repositories", "dependency_injection")
+
+
+def __getattr__(name):
+    if name not in _SUBPACKAGES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return importlib.import_module(f".{name}", __name__)
 
-from . import repositories
-from . import dependency_injection
 
 __all__ = ["repositories", "dependency_injection"]
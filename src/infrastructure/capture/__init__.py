@@ -2,21 +2,121 @@
 Infrastructure layer capture interfaces and base classes
 Provides platform-agnostic interfaces for screenshot capture
 """
+import asyncio
+import io
+import threading
 from abc import ABC, abstractmethod
-from typing import Optional, Tuple, Dict, Any, List
+from concurrent.futures import Future
+from typing import Optional, Tuple, Dict, Any, List, Union, Callable
 from dataclasses import dataclass
 from enum import Enum
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# zlib level for PNGs encoded on the Python side. Screenshots are short-lived,
+# so level 1 trades a few percent of file size for a much cheaper encode.
+DEFAULT_PNG_COMPRESS_LEVEL = 1
+
+# libjpeg quality for JPEG captures; previews do not need more
+DEFAULT_JPEG_QUALITY = 85
+
+# Encoded formats every PIL-backed handler can produce
+IMAGE_FORMATS = ('png', 'jpeg')
+
+# PNG encoders for PIL images: Pillow's zlib encoder, or the SIMD fpnge
+PNG_ENCODERS = ('pil', 'fpnge')
+
+
+def pil_save_options(output_format: str, png_compress_level: int = DEFAULT_PNG_COMPRESS_LEVEL,
+                     jpeg_quality: int = DEFAULT_JPEG_QUALITY) -> Dict[str, Any]:
+    """Keyword arguments for PIL's Image.save in the given output format"""
+    if output_format == 'jpeg':
+        # 4:2:0 baseline JPEG, the cheapest libjpeg-turbo path
+        return {'format': 'JPEG', 'quality': jpeg_quality, 'subsampling': 2}
+    if output_format == 'png':
+        return {'format': 'PNG', 'compress_level': png_compress_level}
+    raise ValueError(f"Unsupported image format: {output_format}")
+
+
+def fast_png_encoder(png_encoder: str = 'pil') -> Optional[Callable[[Any], bytes]]:
+    """Return fpnge's PIL image encoder if png_encoder selects it and it is installed"""
+    if png_encoder not in PNG_ENCODERS:
+        raise ValueError(f"Unsupported PNG encoder: {png_encoder}")
+    if png_encoder != 'fpnge':
+        return None
+    
+    try:
+        import fpnge
+        return fpnge.fromPIL
+    except ImportError:
+        print("⚠️  fpnge is not installed, using Pillow's PNG encoder")
+        return None
+
+
+def palettize_few_colors(image: Any, max_colors: int = 256) -> Any:
+    """Losslessly convert an RGB image with few distinct colors to palette mode
+    
+    Flat UI content often has no more than 256 colors; as an 8-bit palette
+    PNG it is a fraction of the size. Images with more colors, or any
+    image when NumPy is unavailable, are returned unchanged.
+    """
+    if np is None or image.mode != 'RGB':
+        return image
+    colors = image.getcolors(max_colors)  # None as soon as there are too many
+    if colors is None:
+        return image
+    
+    from PIL import Image
+    
+    keys = np.sort(np.array([(r << 16) | (g << 8) | b for _, (r, g, b) in colors], dtype=np.uint32))
+    pixels = np.asarray(image).astype(np.uint32)
+    packed = (pixels[..., 0] << 16) | (pixels[..., 1] << 8) | pixels[..., 2]
+    palettized = Image.fromarray(np.searchsorted(keys, packed).astype(np.uint8), 'P')
+    palette = np.stack([(keys >> 16) & 0xFF, (keys >> 8) & 0xFF, keys & 0xFF], axis=1)
+    palettized.putpalette(palette.astype(np.uint8).tobytes())
+    return palettized
+
 
 class CaptureResult:
-    """Result of a screenshot capture operation"""
+    """Result of a screenshot capture operation
     
-    def __init__(self, success: bool, data: Optional[bytes] = None, 
+    data may be given as a Future when the handler encodes in the background;
+    it is resolved the first time data is read.
+    """
+    
+    __slots__ = ('success', '_data', 'error', 'metadata')
+    
+    def __init__(self, success: bool, data: Optional[Union[bytes, Future]] = None,
                  error: Optional[str] = None, metadata: Optional[Dict[str, Any]] = None):
         self.success = success
-        self.data = data
+        self._data = data
         self.error = error
         self.metadata = metadata or {}
+    
+    @property
+    def data(self) -> Optional[bytes]:
+        """Captured data, waiting for a deferred encode if necessary"""
+        if isinstance(self._data, Future):
+            try:
+                self._data = self._data.result()
+            except Exception as e:
+                self._data = None
+                self.success = False
+                self.error = f"Deferred encode failed: {e}"
+        return self._data
+    
+    @data.setter
+    def data(self, value: Optional[Union[bytes, Future]]) -> None:
+        self._data = value
+    
+    @property
+    def pending(self) -> Optional[Future]:
+        """The deferred encode still backing data, if any"""
+        return self._data if isinstance(self._data, Future) else None
         
     @property
     def size(self) -> int:
@@ -31,6 +131,7 @@ class CaptureResult:
 class CaptureMethod(Enum):
     """Available screenshot capture methods"""
     WINDOWS_NATIVE = "windows_native"
+    WINDOWS_GDI = "windows_gdi"
     LINUX_X11 = "linux_x11"
     LINUX_WAYLAND = "linux_wayland"
     WSL_POWERSHELL = "wsl_powershell"
@@ -54,10 +155,21 @@ class CaptureCapabilities:
 class ICaptureHandler(ABC):
     """Interface for capture handlers in the chain of responsibility"""
     
+    MIN_ROI_WIDTH = 10
+    MIN_ROI_HEIGHT = 10
+    
     def __init__(self):
         self._next_handler: Optional['ICaptureHandler'] = None
         self._capabilities: Optional[CaptureCapabilities] = None
         self._initialized = False
+        self._init_attempted = False
+        self._init_lock = threading.Lock()
+        self._min_roi_width = self.MIN_ROI_WIDTH
+        self._min_roi_height = self.MIN_ROI_HEIGHT
+        # Encoding used by the default _capture_scaled_roi; handlers with a
+        # configurable output format set both
+        self._output_format = 'png'
+        self._save_options = pil_save_options('png')
     
     @property
     def capabilities(self) -> Optional[CaptureCapabilities]:
@@ -84,9 +196,33 @@ class ICaptureHandler(ABC):
         """Initialize the capture handler"""
         pass
     
+    def ensure_initialized(self) -> bool:
+        """Initialize on first use if the chain deferred it
+        
+        Initialization is attempted at most once; a handler that fails it
+        is skipped from then on.
+        """
+        if self._initialized:
+            return True
+        
+        with self._init_lock:
+            if self._initialized or self._init_attempted:
+                return self._initialized
+            self._init_attempted = True
+            
+            method = self._capabilities.method.value if self._capabilities else type(self).__name__
+            try:
+                if self.initialize():
+                    print(f"✅ Initialized fallback capture handler: {method}")
+                else:
+                    print(f"⚠️  Failed to initialize fallback handler: {method}")
+            except Exception as e:
+                print(f"❌ Error initializing fallback handler {method}: {e}")
+            return self._initialized
+    
     def handle_full_screen(self) -> CaptureResult:
         """Handle full screen capture request"""
-        if self.can_handle() and self._initialized:
+        if self.can_handle() and self.ensure_initialized():
             result = self._capture_full_screen()
             if result.success:
                 return result
@@ -97,17 +233,39 @@ class ICaptureHandler(ABC):
         
         return CaptureResult(False, error="No capture handler available")
     
-    def handle_roi(self, roi: Tuple[int, int, int, int]) -> CaptureResult:
-        """Handle ROI capture request"""
-        if self.can_handle() and self._initialized:
+    def handle_roi(self, roi: Tuple[int, int, int, int], scale: float = 1.0) -> CaptureResult:
+        """Handle ROI capture request, optionally downsampled by scale"""
+        if self.can_handle() and self.ensure_initialized():
             if self._validate_roi(roi):
-                result = self._capture_roi(roi)
+                if scale == 1.0:
+                    result = self._capture_roi(roi)
+                else:
+                    result = self._capture_scaled_roi(roi, scale)
                 if result.success:
                     return result
         
         # Try next handler in chain
         if self._next_handler:
-            return self._next_handler.handle_roi(roi)
+            return self._next_handler.handle_roi(roi, scale)
+        
+        return CaptureResult(False, error="No ROI capture handler available")
+    
+    async def handle_roi_async(self, roi: Tuple[int, int, int, int]) -> CaptureResult:
+        """Handle ROI capture request without blocking the event loop"""
+        if self.can_handle():
+            initialized = self._initialized
+            if not initialized:
+                # A deferred initialize can start subprocesses or load libraries
+                loop = asyncio.get_running_loop()
+                initialized = await loop.run_in_executor(None, self.ensure_initialized)
+            if initialized and self._validate_roi(roi):
+                result = await self._capture_roi_async(roi)
+                if result.success:
+                    return result
+        
+        # Try next handler in chain
+        if self._next_handler:
+            return await self._next_handler.handle_roi_async(roi)
         
         return CaptureResult(False, error="No ROI capture handler available")
     
@@ -121,6 +279,47 @@ class ICaptureHandler(ABC):
         """Implement platform-specific ROI capture"""
         pass
     
+    def _capture_scaled_roi(self, roi: Tuple[int, int, int, int], scale: float) -> CaptureResult:
+        """Capture ROI and downsample it by scale
+        
+        The default resizes the encoded full-resolution capture and encodes
+        it again in the handler's output format; handlers with access to the
+        raw pixels override this to shrink before encoding.
+        """
+        result = self._capture_roi(roi)
+        if not result.success:
+            return result
+        
+        try:
+            from PIL import Image
+            
+            image = Image.open(io.BytesIO(result.data))
+            image = image.resize(self._scaled_size(image.width, image.height, scale), Image.BILINEAR)
+            if self._output_format == 'jpeg' and image.mode not in ('RGB', 'L'):
+                image = image.convert('RGB')
+            buffer = io.BytesIO()
+            image.save(buffer, **self._save_options)
+        except Exception as e:
+            return CaptureResult(False, error=f"ROI downsampling failed: {e}")
+        
+        image_data = buffer.getvalue()
+        metadata = dict(result.metadata)
+        metadata.update({'scale': scale, 'size': len(image_data), 'format': self._output_format})
+        return CaptureResult(True, image_data, metadata=metadata)
+    
+    @staticmethod
+    def _scaled_size(width: int, height: int, scale: float) -> Tuple[int, int]:
+        """Output size of a width x height capture downsampled by scale"""
+        return max(1, round(width * scale)), max(1, round(height * scale))
+    
+    async def _capture_roi_async(self, roi: Tuple[int, int, int, int]) -> CaptureResult:
+        """Run the blocking ROI capture on the loop's default executor
+        
+        Handlers with a natively asynchronous capture path override this.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._capture_roi, roi)
+    
     def _validate_roi(self, roi: Tuple[int, int, int, int]) -> bool:
         """Validate ROI coordinates"""
         left, top, right, bottom = roi
@@ -130,7 +329,7 @@ class ICaptureHandler(ABC):
             return False
         
         # Check minimum size (default 10x10 pixels)
-        if (right - left) < 10 or (bottom - top) < 10:
+        if (right - left) < self._min_roi_width or (bottom - top) < self._min_roi_height:
             return False
         
         return True
@@ -189,6 +388,12 @@ from .capture_chain import CaptureChainBuilder
 from .platform_detector import PlatformDetector
 
 __all__ = [
+    'DEFAULT_PNG_COMPRESS_LEVEL',
+    'IMAGE_FORMATS',
+    'PNG_ENCODERS',
+    'pil_save_options',
+    'fast_png_encoder',
+    'palettize_few_colors',
     'CaptureResult',
     'CaptureMethod', 
     'CaptureCapabilities',
@@ -2,11 +2,15 @@
 Capture chain builder implementing chain of responsibility pattern
 Builds and manages the chain of capture handlers
 """
+from dataclasses import asdict
 from typing import List, Optional, Tuple, Dict, Any
 
-from . import ICaptureChain, ICaptureHandler, CaptureMethod, CaptureResult
+from . import (
+    ICaptureChain, ICaptureHandler, CaptureMethod, CaptureResult,
+    DEFAULT_PNG_COMPRESS_LEVEL, DEFAULT_JPEG_QUALITY
+)
 from .platform_detector import PlatformDetector
-from .windows_capture import WindowsNativeCapture, WindowsMSSCapture
+from .windows_capture import WindowsNativeCapture, WindowsGDICapture, WindowsMSSCapture
 from .linux_capture import LinuxX11Capture, LinuxWaylandCapture
 from .wsl_capture import WSLPowerShellCapture, WSLPyAutoGUICapture
 
@@ -14,9 +18,26 @@ from .wsl_capture import WSLPowerShellCapture, WSLPyAutoGUICapture
 class CaptureChainBuilder(ICaptureChain):
     """Builds capture handler chain based on platform and availability"""
     
-    def __init__(self):
+    # Handlers whose encoder is fixed to PNG (external tools, native API)
+    _PNG_ONLY_METHODS = (
+        CaptureMethod.WINDOWS_NATIVE, CaptureMethod.LINUX_X11, CaptureMethod.LINUX_WAYLAND
+    )
+    
+    def __init__(self, png_compress_level: int = DEFAULT_PNG_COMPRESS_LEVEL,
+                 output_format: str = 'png', jpeg_quality: int = DEFAULT_JPEG_QUALITY,
+                 png_encoder: str = 'pil', wsl_transfer_format: str = 'png',
+                 encode_workers: Optional[int] = None, gpu_encode: bool = False,
+                 png_quantize: bool = False):
         self.platform_detector = PlatformDetector()
         self._chain_cache: Optional[ICaptureHandler] = None
+        self._png_compress_level = png_compress_level
+        self._output_format = output_format
+        self._jpeg_quality = jpeg_quality
+        self._png_encoder = png_encoder
+        self._wsl_transfer_format = wsl_transfer_format
+        self._encode_workers = encode_workers
+        self._gpu_encode = gpu_encode
+        self._png_quantize = png_quantize
     
     def build_chain(self) -> ICaptureHandler:
         """Build and return the capture chain for current platform"""
@@ -36,31 +57,34 @@ class CaptureChainBuilder(ICaptureChain):
         if not available_handlers:
             raise RuntimeError("No capture handlers available for current platform")
         
-        # Initialize handlers
-        initialized_handlers = []
-        for handler in available_handlers:
+        # Initialize handlers up to the first one that works. The fallbacks
+        # behind it initialize themselves the first time a capture reaches
+        # them, so a healthy primary never pays for their probes.
+        chain_handlers = []
+        for index, handler in enumerate(available_handlers):
             try:
                 if handler.initialize():
-                    initialized_handlers.append(handler)
                     print(f"✅ Initialized capture handler: {handler.capabilities.method.value}")
-                else:
-                    print(f"⚠️  Failed to initialize handler: {handler.capabilities.method.value}")
+                    chain_handlers = [handler] + available_handlers[index + 1:]
+                    break
+                print(f"⚠️  Failed to initialize handler: {handler.capabilities.method.value}")
             except Exception as e:
                 print(f"❌ Error initializing handler {handler.capabilities.method.value}: {e}")
         
-        if not initialized_handlers:
+        if not chain_handlers:
             raise RuntimeError("No capture handlers could be initialized")
         
         # Build chain of responsibility
-        chain_head = initialized_handlers[0]
+        chain_head = chain_handlers[0]
         current = chain_head
         
-        for handler in initialized_handlers[1:]:
+        for handler in chain_handlers[1:]:
             current.set_next(handler)
             current = handler
         
         self._chain_cache = chain_head
-        print(f"✅ Built capture chain with {len(initialized_handlers)} handlers")
+        print(f"✅ Built capture chain with {len(chain_handlers)} handlers "
+              f"({len(chain_handlers) - 1} initialized on demand)")
         
         return chain_head
     
@@ -80,18 +104,39 @@ class CaptureChainBuilder(ICaptureChain):
         try:
             print(f"Creating handler for: {method.value}")
             
+            level = self._png_compress_level
+            encoding = {
+                'output_format': self._output_format,
+                'jpeg_quality': self._jpeg_quality,
+                'png_compress_level': level,
+                'png_encoder': self._png_encoder
+            }
+            # Handlers with an encode pool keep their own default unless configured
+            pooled = {} if self._encode_workers is None else {'encode_workers': self._encode_workers}
+            
+            if method in self._PNG_ONLY_METHODS and self._output_format != 'png':
+                print(f"⚠️  {method.value} captures are always PNG, ignoring output format "
+                      f"'{self._output_format}'")
+            
             if method == CaptureMethod.WINDOWS_NATIVE:
                 return WindowsNativeCapture()
+            elif method == CaptureMethod.WINDOWS_GDI:
+                return WindowsGDICapture(**encoding, png_quantize=self._png_quantize)
             elif method == CaptureMethod.MSS:
-                return WindowsMSSCapture()
+                return WindowsMSSCapture(**encoding, **pooled, gpu_encode=self._gpu_encode)
             elif method == CaptureMethod.LINUX_X11:
-                return LinuxX11Capture()
+                return LinuxX11Capture(png_compress_level=level)
             elif method == CaptureMethod.LINUX_WAYLAND:
                 return LinuxWaylandCapture()
             elif method == CaptureMethod.WSL_POWERSHELL:
-                return WSLPowerShellCapture()
+                return WSLPowerShellCapture(
+                    transfer_format=self._wsl_transfer_format,
+                    png_quantize=self._png_quantize,
+                    **encoding,
+                    **pooled
+                )
             elif method == CaptureMethod.PYAUTOGUI:
-                return WSLPyAutoGUICapture()  # Can be used on any platform
+                return WSLPyAutoGUICapture(**encoding, png_quantize=self._png_quantize)  # Can be used on any platform
             else:
                 print(f"⚠️  Unknown capture method: {method}")
                 return None
@@ -137,7 +182,7 @@ class CaptureChainBuilder(ICaptureChain):
                 'position': position,
                 'method': current.capabilities.method.value if current.capabilities else 'unknown',
                 'initialized': current.is_initialized,
-                'capabilities': current.capabilities.__dict__ if current.capabilities else {}
+                'capabilities': asdict(current.capabilities) if current.capabilities else {}
             }
             handlers_info.append(handler_info)
             current = current._next_handler
@@ -156,11 +201,22 @@ class CaptureChainBuilder(ICaptureChain):
             return CaptureResult(False, error="Capture chain not initialized")
         return self._chain_cache.handle_full_screen()
     
-    def capture_roi(self, roi: Tuple[int, int, int, int]) -> CaptureResult:
-        """Compatibility method for CaptureServiceImpl"""
+    def capture_roi(self, roi: Tuple[int, int, int, int], scale: float = 1.0) -> CaptureResult:
+        """Compatibility method for CaptureServiceImpl
+        
+        scale in (0, 1] downsamples the capture before it is encoded.
+        """
+        if not self._chain_cache:
+            return CaptureResult(False, error="Capture chain not initialized")
+        if not 0 < scale <= 1:
+            return CaptureResult(False, error=f"Invalid ROI scale {scale}, expected 0 < scale <= 1")
+        return self._chain_cache.handle_roi(roi, scale)
+    
+    async def capture_roi_async(self, roi: Tuple[int, int, int, int]) -> CaptureResult:
+        """Capture ROI from within an asyncio event loop"""
         if not self._chain_cache:
             return CaptureResult(False, error="Capture chain not initialized")
-        return self._chain_cache.handle_roi(roi)
+        return await self._chain_cache.handle_roi_async(roi)
     
     def cleanup(self) -> None:
         """Clean up the capture chain"""
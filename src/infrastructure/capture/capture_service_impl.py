@@ -7,15 +7,59 @@ from typing import Optional, Tuple, Dict, Any
 
 from src.domain.interfaces.capture_service import ICaptureService, CaptureResult
 from src.domain.value_objects.coordinates import Rectangle
+from . import DEFAULT_PNG_COMPRESS_LEVEL, DEFAULT_JPEG_QUALITY
 from .capture_chain import CaptureChainBuilder
 
 
 class CaptureServiceImpl(ICaptureService):
     """Implementation of capture service using capture chain"""
     
-    def __init__(self):
+    def __init__(self, png_compress_level: int = DEFAULT_PNG_COMPRESS_LEVEL,
+                 output_format: str = 'png', jpeg_quality: int = DEFAULT_JPEG_QUALITY,
+                 png_encoder: str = 'pil', wsl_transfer_format: str = 'png',
+                 encode_workers: Optional[int] = None, gpu_encode: bool = False,
+                 png_quantize: bool = False):
         self._capture_chain = None
         self._initialized = False
+        self._png_compress_level = png_compress_level
+        self._output_format = output_format
+        self._jpeg_quality = jpeg_quality
+        self._png_encoder = png_encoder
+        self._wsl_transfer_format = wsl_transfer_format
+        self._encode_workers = encode_workers
+        self._gpu_encode = gpu_encode
+        self._png_quantize = png_quantize
+
+    @classmethod
+    def from_config(cls, capture_config: Dict[str, Any]) -> 'CaptureServiceImpl':
+        """Create the service from the container's capture settings
+
+        Keys are the capture.* configuration settings without the prefix
+        (format, png_compress_level, jpeg_quality, ...); missing keys keep
+        the defaults.
+        """
+        return cls(
+            png_compress_level=capture_config.get("png_compress_level", DEFAULT_PNG_COMPRESS_LEVEL),
+            output_format=capture_config.get("format", "png"),
+            jpeg_quality=capture_config.get("jpeg_quality", DEFAULT_JPEG_QUALITY),
+            png_encoder=capture_config.get("png_encoder", "pil"),
+            wsl_transfer_format=capture_config.get("wsl_transfer_format", "png"),
+            encode_workers=capture_config.get("encode_workers"),
+            gpu_encode=capture_config.get("use_gpu_encode", False),
+            png_quantize=capture_config.get("png_quantize", False)
+        )
+
+    @staticmethod
+    async def _encoded(result):
+        """Wait for a deferred encode without blocking the event loop
+        
+        Handlers with an encode pool return as soon as the pixels are
+        grabbed; reading data on the loop would then block on the encode.
+        """
+        pending = result.pending
+        if pending is not None:
+            await asyncio.wrap_future(pending)
+        return result
     
     async def capture_full_screen(
         self, 
@@ -33,7 +77,7 @@ class CaptureServiceImpl(ICaptureService):
             def capture_sync():
                 return self._capture_chain.capture_full_screen()
             
-            result = await loop.run_in_executor(None, capture_sync)
+            result = await self._encoded(await loop.run_in_executor(None, capture_sync))
             
             if result.success and result.data:
                 return CaptureResult(
@@ -64,13 +108,8 @@ class CaptureServiceImpl(ICaptureService):
             # Convert Rectangle to ROI tuple
             roi = (region.left, region.top, region.right, region.bottom)
             
-            # Run capture in thread pool
-            loop = asyncio.get_event_loop()
-            
-            def capture_sync():
-                return self._capture_chain.capture_roi(roi)
-            
-            result = await loop.run_in_executor(None, capture_sync)
+            # Handlers run the blocking part off the event loop themselves
+            result = await self._encoded(await self._capture_chain.capture_roi_async(roi))
             
             if result.success and result.data:
                 return CaptureResult(
@@ -89,7 +128,8 @@ class CaptureServiceImpl(ICaptureService):
     
     async def capture_roi(
         self, 
-        roi: Tuple[int, int, int, int]
+        roi: Tuple[int, int, int, int],
+        scale: float = 1.0
     ) -> CaptureResult:
         """Capture screenshot of specific ROI coordinates"""
         if not self._initialized:
@@ -97,13 +137,17 @@ class CaptureServiceImpl(ICaptureService):
                 return CaptureResult(False, error="Capture service not initialized")
         
         try:
-            # Run capture in thread pool
-            loop = asyncio.get_event_loop()
-            
-            def capture_sync():
-                return self._capture_chain.capture_roi(roi)
-            
-            result = await loop.run_in_executor(None, capture_sync)
+            if scale == 1.0:
+                # Handlers run the blocking part off the event loop themselves
+                result = await self._encoded(await self._capture_chain.capture_roi_async(roi))
+            else:
+                # Downsampled captures only have a blocking path; run it in thread pool
+                loop = asyncio.get_event_loop()
+                
+                def capture_sync():
+                    return self._capture_chain.capture_roi(roi, scale)
+                
+                result = await self._encoded(await loop.run_in_executor(None, capture_sync))
             
             if result.success and result.data:
                 return CaptureResult(
@@ -124,7 +168,16 @@ class CaptureServiceImpl(ICaptureService):
         """Initialize the capture service"""
         try:
             print("🔧 Initializing capture service...")
-            builder = CaptureChainBuilder()
+            builder = CaptureChainBuilder(
+                png_compress_level=self._png_compress_level,
+                output_format=self._output_format,
+                jpeg_quality=self._jpeg_quality,
+                png_encoder=self._png_encoder,
+                wsl_transfer_format=self._wsl_transfer_format,
+                encode_workers=self._encode_workers,
+                gpu_encode=self._gpu_encode,
+                png_quantize=self._png_quantize
+            )
             
             # Check if we're in WSL
             import os
@@ -146,7 +199,9 @@ class CaptureServiceImpl(ICaptureService):
             if is_wsl:
                 print("ℹ️ Using WSL-specific capture methods")
             
-            self._capture_chain = builder.build_chain()
+            # Keep the builder: its capture methods fall back along the chain
+            builder.build_chain()
+            self._capture_chain = builder
             self._initialized = True
             print("✅ Capture service initialized successfully")
             return True
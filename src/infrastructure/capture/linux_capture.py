@@ -8,13 +8,16 @@ import subprocess
 import shutil
 from typing import Tuple, Dict, Any, Optional
 
-from . import ICaptureHandler, CaptureResult, CaptureMethod, CaptureCapabilities
+from . import (
+    ICaptureHandler, CaptureResult, CaptureMethod, CaptureCapabilities,
+    DEFAULT_PNG_COMPRESS_LEVEL
+)
 
 
 class LinuxX11Capture(ICaptureHandler):
     """Linux X11 screenshot capture using imagemagick/scrot"""
     
-    def __init__(self):
+    def __init__(self, png_compress_level: int = DEFAULT_PNG_COMPRESS_LEVEL):
         super().__init__()
         self._capabilities = CaptureCapabilities(
             method=CaptureMethod.LINUX_X11,
@@ -26,6 +29,9 @@ class LinuxX11Capture(ICaptureHandler):
             platform_specific=True
         )
         self._capture_tool = None
+        # ImageMagick reads the PNG zlib level from the tens digit of -quality
+        # (ones digit 0 = no row filter); a bare 0 would mean "default"
+        self._png_quality = str(max(png_compress_level * 10, 1))
     
     def can_handle(self) -> bool:
         """Check if X11 capture is available"""
@@ -183,7 +189,7 @@ class LinuxX11Capture(ICaptureHandler):
         """Capture full screen using ImageMagick import"""
         try:
             result = subprocess.run(
-                ['import', '-window', 'root', 'png:-'],
+                ['import', '-window', 'root', '-quality', self._png_quality, 'png:-'],
                 capture_output=True,
                 timeout=30
             )
@@ -214,7 +220,8 @@ class LinuxX11Capture(ICaptureHandler):
             crop_spec = f'{width}x{height}+{left}+{top}'
             
             result = subprocess.run(
-                ['import', '-window', 'root', '-crop', crop_spec, 'png:-'],
+                ['import', '-window', 'root', '-crop', crop_spec,
+                 '-quality', self._png_quality, 'png:-'],
                 capture_output=True,
                 timeout=30
             )
@@ -12,10 +12,16 @@ from . import IPlatformDetector, CaptureMethod
 
 
 class PlatformDetector(IPlatformDetector):
-    """Platform detection implementation"""
+    """Platform detection implementation
+    
+    Detection results are shared by all instances, so building another
+    capture chain does not re-run the PowerShell probe.
+    """
+    
+    _shared_cache: Dict[str, Any] = {}
     
     def __init__(self):
-        self._cache: Dict[str, Any] = {}
+        self._cache = PlatformDetector._shared_cache
     
     def is_windows(self) -> bool:
         """Check if running on Windows"""
@@ -125,9 +131,11 @@ class PlatformDetector(IPlatformDetector):
             # Never add X11 or Wayland methods for WSL even if DISPLAY is set
             
         elif self.is_windows():
-            # Native Windows environment
-            methods.append(CaptureMethod.WINDOWS_NATIVE)
+            # Native Windows environment. GDI and MSS copy only the ROI's
+            # pixels in-process; the PowerShell path starts a process per capture
+            methods.append(CaptureMethod.WINDOWS_GDI)
             methods.append(CaptureMethod.MSS)
+            methods.append(CaptureMethod.WINDOWS_NATIVE)
             methods.append(CaptureMethod.PYAUTOGUI)
             
         elif self.is_linux():
@@ -137,9 +145,10 @@ class PlatformDetector(IPlatformDetector):
                 methods.append(CaptureMethod.MSS)
                 methods.append(CaptureMethod.PYAUTOGUI)
             elif self.has_x11():
-                # X11 environment
-                methods.append(CaptureMethod.LINUX_X11)
+                # X11 environment. MSS reads just the ROI with XGetImage; the
+                # X11 tools run a process and ImageMagick crops a full grab
                 methods.append(CaptureMethod.MSS)
+                methods.append(CaptureMethod.LINUX_X11)
                 methods.append(CaptureMethod.PYAUTOGUI)
             else:
                 # Headless or unknown environment
@@ -4,11 +4,71 @@ Uses native Windows APIs for optimal performance
 """
 import os
 import io
+import ctypes
 import subprocess
-import base64
-from typing import Tuple, Dict, Any, Optional
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Tuple, Dict, Any, Optional, Callable, Union, List
 
-from . import ICaptureHandler, CaptureResult, CaptureMethod, CaptureCapabilities
+try:
+    import pybase64  # SIMD-accelerated base64, same API as stdlib
+except ImportError:
+    import base64 as pybase64
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    # libspng bindings; only releases that ship an encoder are used
+    import pyspng
+    _spng_encode = getattr(pyspng, 'encode', None)
+except ImportError:
+    _spng_encode = None
+
+try:
+    # OpenCV hands a contiguous BGR array straight to libpng
+    import cv2
+    
+    def _cv2_encode_png(bgra, compress_level: int) -> bytes:
+        """Encode an (h, w, 4) BGRA array as an RGB PNG"""
+        bgr = cv2.cvtColor(bgra, cv2.COLOR_BGRA2BGR)
+        ok, encoded = cv2.imencode('.png', bgr, [cv2.IMWRITE_PNG_COMPRESSION, compress_level])
+        if not ok:
+            raise ValueError("cv2.imencode failed")
+        return encoded.tobytes()
+except ImportError:
+    _cv2_encode_png = None
+
+from . import (
+    ICaptureHandler, CaptureResult, CaptureMethod, CaptureCapabilities,
+    DEFAULT_PNG_COMPRESS_LEVEL, DEFAULT_JPEG_QUALITY, pil_save_options, fast_png_encoder,
+    palettize_few_colors
+)
+
+
+class _BITMAPINFOHEADER(ctypes.Structure):
+    _fields_ = [
+        ('biSize', ctypes.c_uint32),
+        ('biWidth', ctypes.c_int32),
+        ('biHeight', ctypes.c_int32),
+        ('biPlanes', ctypes.c_uint16),
+        ('biBitCount', ctypes.c_uint16),
+        ('biCompression', ctypes.c_uint32),
+        ('biSizeImage', ctypes.c_uint32),
+        ('biXPelsPerMeter', ctypes.c_int32),
+        ('biYPelsPerMeter', ctypes.c_int32),
+        ('biClrUsed', ctypes.c_uint32),
+        ('biClrImportant', ctypes.c_uint32)
+    ]
+
+
+class _BITMAPINFO(ctypes.Structure):
+    _fields_ = [
+        ('bmiHeader', _BITMAPINFOHEADER),
+        ('bmiColors', ctypes.c_uint32 * 3)
+    ]
 
 
 class WindowsNativeCapture(ICaptureHandler):
@@ -148,14 +208,13 @@ class WindowsNativeCapture(ICaptureHandler):
             result = subprocess.run(
                 ['powershell.exe', '-Command', script],
                 capture_output=True,
-                timeout=30,
-                text=True
+                timeout=30
             )
             
             if result.returncode == 0 and result.stdout.strip():
-                # Decode base64 data
+                # Decode base64 data straight from the stdout bytes
                 base64_data = result.stdout.strip()
-                image_data = base64.b64decode(base64_data)
+                image_data = pybase64.b64decode(base64_data, validate=False)
                 
                 metadata = {
                     'method': 'windows_native',
@@ -165,7 +224,7 @@ class WindowsNativeCapture(ICaptureHandler):
                 
                 return CaptureResult(True, image_data, metadata=metadata)
             else:
-                error_msg = result.stderr if result.stderr else "PowerShell script failed"
+                error_msg = result.stderr.decode('utf-8', errors='replace') if result.stderr else "PowerShell script failed"
                 return CaptureResult(False, error=f"Windows native {operation} failed: {error_msg}")
                 
         except subprocess.TimeoutExpired:
@@ -191,11 +250,271 @@ class WindowsNativeCapture(ICaptureHandler):
         self._initialized = False
 
 
+class WindowsGDICapture(ICaptureHandler):
+    """Windows screenshot capture calling GDI directly through ctypes
+    
+    The screen DC, memory DC, bitmap and pixel buffer are created once and
+    reused across captures; the bitmap and buffer are only recreated when a
+    larger capture is requested.
+    """
+    
+    SRCCOPY = 0x00CC0020
+    CAPTUREBLT = 0x40000000
+    DIB_RGB_COLORS = 0
+    BI_RGB = 0
+    SM_XVIRTUALSCREEN = 76
+    SM_YVIRTUALSCREEN = 77
+    SM_CXVIRTUALSCREEN = 78
+    SM_CYVIRTUALSCREEN = 79
+    
+    def __init__(self, png_compress_level: int = DEFAULT_PNG_COMPRESS_LEVEL,
+                 output_format: str = 'png', jpeg_quality: int = DEFAULT_JPEG_QUALITY,
+                 png_encoder: str = 'pil', png_quantize: bool = False):
+        super().__init__()
+        self._capabilities = CaptureCapabilities(
+            method=CaptureMethod.WINDOWS_GDI,
+            supports_roi=True,
+            supports_multi_monitor=True,
+            requires_elevated=False,
+            performance_rating=5,
+            reliability_rating=4,
+            platform_specific=True
+        )
+        self._output_format = output_format
+        self._save_options = pil_save_options(output_format, png_compress_level, jpeg_quality)
+        self._fast_png = fast_png_encoder(png_encoder) if output_format == 'png' else None
+        self._png_compress_level = png_compress_level
+        self._png_quantize = png_quantize and output_format == 'png'
+        self._user32 = None
+        self._gdi32 = None
+        self._screen_dc = None
+        self._memory_dc = None
+        self._bitmap = None
+        self._bitmap_size = (0, 0)
+        self._pixels = None
+        self._encode_buffer = io.BytesIO()
+        self._lock = threading.Lock()
+    
+    def can_handle(self) -> bool:
+        """Check if GDI is reachable through ctypes"""
+        return os.name == 'nt' and hasattr(ctypes, 'WinDLL')
+    
+    def initialize(self) -> bool:
+        """Initialize GDI capture"""
+        try:
+            from PIL import Image
+            self._frombuffer = Image.frombuffer
+            
+            # Private WinDLL instances so the signatures below don't leak into
+            # other users of ctypes.windll
+            user32 = ctypes.WinDLL('user32')
+            gdi32 = ctypes.WinDLL('gdi32')
+            handle = ctypes.c_void_p
+            
+            user32.GetDC.argtypes = [handle]
+            user32.GetDC.restype = handle
+            user32.ReleaseDC.argtypes = [handle, handle]
+            user32.GetSystemMetrics.argtypes = [ctypes.c_int]
+            gdi32.CreateCompatibleDC.argtypes = [handle]
+            gdi32.CreateCompatibleDC.restype = handle
+            gdi32.CreateCompatibleBitmap.argtypes = [handle, ctypes.c_int, ctypes.c_int]
+            gdi32.CreateCompatibleBitmap.restype = handle
+            gdi32.SelectObject.argtypes = [handle, handle]
+            gdi32.SelectObject.restype = handle
+            gdi32.DeleteObject.argtypes = [handle]
+            gdi32.DeleteDC.argtypes = [handle]
+            gdi32.BitBlt.argtypes = [handle, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+                                     handle, ctypes.c_int, ctypes.c_int, ctypes.c_uint32]
+            gdi32.GetDIBits.argtypes = [handle, handle, ctypes.c_uint, ctypes.c_uint,
+                                        ctypes.c_void_p, ctypes.c_void_p, ctypes.c_uint]
+            
+            self._user32 = user32
+            self._gdi32 = gdi32
+            self._screen_dc = user32.GetDC(None)
+            self._memory_dc = gdi32.CreateCompatibleDC(self._screen_dc)
+            
+            if not self._screen_dc or not self._memory_dc:
+                self.cleanup()
+                return False
+            
+            self._initialized = True
+            return True
+            
+        except Exception as e:
+            print(f"Windows GDI capture initialization failed: {e}")
+            self.cleanup()
+            return False
+    
+    def _ensure_bitmap(self, width: int, height: int) -> None:
+        """Make sure the selected bitmap matches the capture size
+        
+        The bitmap must be exactly width x height: GetDIBits reads its rows
+        bottom-up, so a taller bitmap would hand back the wrong rows. The
+        pixel buffer only grows, since any buffer large enough will do.
+        """
+        if (width, height) == self._bitmap_size:
+            return
+        
+        bitmap = self._gdi32.CreateCompatibleBitmap(self._screen_dc, width, height)
+        if not bitmap:
+            raise OSError("CreateCompatibleBitmap failed")
+        
+        self._gdi32.SelectObject(self._memory_dc, bitmap)
+        if self._bitmap:
+            self._gdi32.DeleteObject(self._bitmap)
+        
+        self._bitmap = bitmap
+        self._bitmap_size = (width, height)
+        if self._pixels is None or len(self._pixels) < width * height * 4:
+            self._pixels = ctypes.create_string_buffer(width * height * 4)
+    
+    def _grab(self, left: int, top: int, width: int, height: int) -> bytes:
+        """Copy a screen region into the pixel buffer and encode it as PNG"""
+        with self._lock:
+            self._ensure_bitmap(width, height)
+            
+            if not self._gdi32.BitBlt(self._memory_dc, 0, 0, width, height,
+                                      self._screen_dc, left, top,
+                                      self.SRCCOPY | self.CAPTUREBLT):
+                raise OSError("BitBlt failed")
+            
+            info = _BITMAPINFO()
+            info.bmiHeader.biSize = ctypes.sizeof(_BITMAPINFOHEADER)
+            info.bmiHeader.biWidth = width
+            info.bmiHeader.biHeight = -height  # negative height: top-down rows
+            info.bmiHeader.biPlanes = 1
+            info.bmiHeader.biBitCount = 32
+            info.bmiHeader.biCompression = self.BI_RGB
+            
+            lines = self._gdi32.GetDIBits(self._memory_dc, self._bitmap, 0, height,
+                                          self._pixels, ctypes.byref(info), self.DIB_RGB_COLORS)
+            if lines != height:
+                raise OSError("GetDIBits failed")
+            
+            if (self._fast_png is None and self._output_format == 'png' and not self._png_quantize
+                    and _cv2_encode_png is not None):
+                pixels = np.frombuffer(self._pixels, dtype=np.uint8, count=width * height * 4)
+                pixels = pixels.reshape(height, width, 4)
+                return _cv2_encode_png(pixels, self._png_compress_level)
+            
+            image = self._frombuffer('RGB', (width, height), self._pixels, 'raw', 'BGRX', 0, 1)
+            if self._fast_png is not None:
+                return self._fast_png(image)
+            
+            if self._png_quantize:
+                image = palettize_few_colors(image)
+            
+            buffer = self._encode_buffer
+            buffer.seek(0)
+            image.save(buffer, **self._save_options)
+            # Truncating after the save keeps the buffer's capacity between frames
+            buffer.truncate()
+            return buffer.getvalue()
+    
+    def _capture_full_screen(self) -> CaptureResult:
+        """Capture the whole virtual screen using GDI"""
+        try:
+            left = self._user32.GetSystemMetrics(self.SM_XVIRTUALSCREEN)
+            top = self._user32.GetSystemMetrics(self.SM_YVIRTUALSCREEN)
+            width = self._user32.GetSystemMetrics(self.SM_CXVIRTUALSCREEN)
+            height = self._user32.GetSystemMetrics(self.SM_CYVIRTUALSCREEN)
+            
+            image_data = self._grab(left, top, width, height)
+            
+            metadata = {
+                'method': 'windows_gdi',
+                'operation': 'full_screen',
+                'format': self._output_format,
+                'size': len(image_data)
+            }
+            
+            return CaptureResult(True, image_data, metadata=metadata)
+            
+        except Exception as e:
+            return CaptureResult(False, error=f"Windows GDI full screen capture failed: {str(e)}")
+    
+    def _capture_roi(self, roi: Tuple[int, int, int, int]) -> CaptureResult:
+        """Capture ROI using GDI"""
+        try:
+            left, top, right, bottom = roi
+            image_data = self._grab(left, top, right - left, bottom - top)
+            
+            metadata = {
+                'method': 'windows_gdi',
+                'operation': 'roi_capture',
+                'roi': roi,
+                'format': self._output_format,
+                'size': len(image_data)
+            }
+            
+            return CaptureResult(True, image_data, metadata=metadata)
+            
+        except Exception as e:
+            return CaptureResult(False, error=f"Windows GDI ROI capture failed: {str(e)}")
+    
+    # Add compatibility methods for direct access from CaptureServiceImpl
+    def capture_roi(self, roi: Tuple[int, int, int, int]) -> CaptureResult:
+        """Direct capture ROI method for CaptureServiceImpl"""
+        if not self._initialized:
+            return CaptureResult(False, error="Windows GDI capture not initialized")
+        return self._capture_roi(roi)
+    
+    def capture_full_screen(self) -> CaptureResult:
+        """Direct capture full screen method for CaptureServiceImpl"""
+        if not self._initialized:
+            return CaptureResult(False, error="Windows GDI capture not initialized")
+        return self._capture_full_screen()
+    
+    def cleanup(self) -> None:
+        """Release GDI handles"""
+        with self._lock:
+            if self._gdi32:
+                if self._bitmap:
+                    self._gdi32.DeleteObject(self._bitmap)
+                if self._memory_dc:
+                    self._gdi32.DeleteDC(self._memory_dc)
+            if self._user32 and self._screen_dc:
+                self._user32.ReleaseDC(None, self._screen_dc)
+            
+            self._bitmap = None
+            self._bitmap_size = (0, 0)
+            self._pixels = None
+            self._memory_dc = None
+            self._screen_dc = None
+        self._initialized = False
+
+
 class WindowsMSSCapture(ICaptureHandler):
-    """Windows screenshot capture using MSS library"""
+    """Windows screenshot capture using MSS library
     
-    def __init__(self):
+    Output format is selected at construction time:
+    - 'png': lossless PNG (default, what the screenshot service stores)
+    - 'jpeg': lossy JPEG for previews/streaming, via TurboJPEG when installed,
+      or nvJPEG on a CUDA GPU with gpu_encode=True
+    - 'bgra_raw': the unencoded BGRA buffer from MSS, no encode at all
+    
+    With encode_workers > 0, PNG/JPEG encoding runs on a thread pool and the
+    capture returns as soon as the pixels are grabbed; the result's data is
+    resolved the first time it is read.
+    
+    Encoded frames are fingerprinted so that an unchanged screen returns the
+    previous encoding instead of being encoded again.
+    
+    Each thread that captures gets its own MSS grabber, opened on first use
+    and kept until cleanup: the service captures from executor threads, and
+    older MSS releases tie display handles to the creating thread.
+    """
+    
+    OUTPUT_FORMATS = ('png', 'jpeg', 'bgra_raw')
+    
+    def __init__(self, output_format: str = 'png', jpeg_quality: int = DEFAULT_JPEG_QUALITY,
+                 png_compress_level: int = DEFAULT_PNG_COMPRESS_LEVEL,
+                 encode_workers: int = 0, png_encoder: str = 'pil',
+                 gpu_encode: bool = False):
         super().__init__()
+        if output_format not in self.OUTPUT_FORMATS:
+            raise ValueError(f"Unsupported MSS output format: {output_format}")
+        
         self._capabilities = CaptureCapabilities(
             method=CaptureMethod.MSS,
             supports_roi=True,
@@ -205,7 +524,22 @@ class WindowsMSSCapture(ICaptureHandler):
             reliability_rating=4,
             platform_specific=False
         )
-        self._mss = None
+        self._mss_factory: Optional[Callable[[], Any]] = None
+        self._grabbers = threading.local()
+        self._open_grabbers: List[Any] = []
+        self._grabbers_lock = threading.Lock()
+        self._to_png = None
+        self._fast_png = fast_png_encoder(png_encoder) if output_format == 'png' else None
+        self._frombuffer: Optional[Callable[..., Any]] = None
+        self._buffers = threading.local()  # reusable encode buffers, one set per thread
+        self._output_format = output_format
+        self._jpeg_quality = jpeg_quality
+        self._png_compress_level = png_compress_level
+        self._jpeg_encoder: Optional[Callable[[Any], bytes]] = None
+        self._gpu_encode = gpu_encode
+        self._encode_workers = encode_workers
+        self._encode_pool: Optional[ThreadPoolExecutor] = None
+        self._last_frame: Optional[Tuple[Tuple[int, int], bytearray, Union[bytes, Future]]] = None
     
     def can_handle(self) -> bool:
         """Check if MSS library is available"""
@@ -219,38 +553,225 @@ class WindowsMSSCapture(ICaptureHandler):
         """Initialize MSS capture"""
         try:
             import mss
-            self._mss = mss.mss()
+            import mss.tools
+            self._mss_factory = mss.mss
+            self._grabber()  # Fail initialization here if MSS cannot open the display
+            self._to_png = mss.tools.to_png
+            
+            if self._output_format == 'jpeg':
+                self._jpeg_encoder = self._create_jpeg_encoder()
+            
+            if self._fast_png is not None:
+                from PIL import Image
+                self._frombuffer = Image.frombuffer
+            
+            if self._encode_workers > 0 and self._output_format != 'bgra_raw':
+                self._encode_pool = ThreadPoolExecutor(
+                    max_workers=self._encode_workers,
+                    thread_name_prefix='mss-encode'
+                )
+            
             self._initialized = True
             return True
         except Exception as e:
             print(f"MSS capture initialization failed: {e}")
             return False
     
+    def _grabber(self):
+        """Return the calling thread's MSS instance, opening it on first use"""
+        grabber = getattr(self._grabbers, 'mss', None)
+        if grabber is None:
+            grabber = self._grabbers.mss = self._mss_factory()
+            with self._grabbers_lock:
+                self._open_grabbers.append(grabber)
+        return grabber
+    
+    def _format_info(self, screenshot) -> Dict[str, Any]:
+        """Describe the data produced for a screenshot"""
+        if self._output_format == 'bgra_raw':
+            width, height = screenshot.size
+            return {
+                'format': 'bgra_raw',
+                'width': width,
+                'height': height,
+                'stride': width * 4
+            }
+        return {'format': self._output_format}
+    
+    def _encode_frame(self, screenshot) -> Union[bytes, Future]:
+        """Encode inline, or hand the frame to the encode pool when one is configured"""
+        if self._encode_pool is not None:
+            return self._encode_pool.submit(self._encode, screenshot)
+        return self._encode(screenshot)
+    
+    def _encode(self, screenshot) -> bytes:
+        """Encode an MSS screenshot in the configured output format"""
+        if self._output_format == 'bgra_raw':
+            # Hand out MSS's own buffer, no conversion or copy
+            return screenshot.raw
+        
+        if self._output_format == 'jpeg':
+            return self._jpeg_encoder(screenshot)
+        
+        if self._fast_png is not None:
+            # Pillow only maps RGBX/RGBA buffers in place, so the BGRX->RGB
+            # unpack is the one copy this path makes; the image does not
+            # reference MSS's buffer afterwards
+            return self._fast_png(self._frombuffer('RGB', screenshot.size, screenshot.raw, 'raw', 'BGRX', 0, 1))
+        
+        if _cv2_encode_png is not None:
+            width, height = screenshot.size
+            pixels = np.frombuffer(screenshot.raw, dtype=np.uint8).reshape(height, width, 4)
+            return _cv2_encode_png(pixels, self._png_compress_level)
+        
+        if _spng_encode is not None:
+            width, height = screenshot.size
+            pixels = np.frombuffer(self._rgb_view(screenshot), dtype=np.uint8).reshape(height, width, 3)
+            return _spng_encode(pixels, compress_level=self._png_compress_level)
+        
+        return self._to_png(self._rgb_view(screenshot), screenshot.size,
+                            level=self._png_compress_level)
+    
+    def _rgb_view(self, screenshot) -> memoryview:
+        """Repack BGRA pixels as RGB into a reusable buffer
+        
+        ScreenShot.rgb allocates a fresh bytearray and then copies it into
+        bytes on every frame; this buffer only grows when a larger frame
+        arrives.
+        """
+        raw = screenshot.raw
+        size = len(raw) // 4 * 3
+        buffer = getattr(self._buffers, 'rgb', None)
+        if buffer is None or size > len(buffer):
+            buffer = self._buffers.rgb = bytearray(size)
+        
+        rgb = memoryview(buffer)[:size]
+        if np is not None:
+            # One copy per channel; each is a simple strided loop, several
+            # times faster than a single copy through the reversed [2::-1] view
+            bgra = np.frombuffer(raw, dtype=np.uint8).reshape(-1, 4)
+            pixels = np.frombuffer(rgb, dtype=np.uint8).reshape(-1, 3)
+            pixels[:, 0] = bgra[:, 2]
+            pixels[:, 1] = bgra[:, 1]
+            pixels[:, 2] = bgra[:, 0]
+        else:
+            rgb[0::3] = raw[2::4]
+            rgb[1::3] = raw[1::4]
+            rgb[2::3] = raw[0::4]
+        return rgb
+    
+    def _create_jpeg_encoder(self) -> Callable[[Any], bytes]:
+        """Bind the JPEG backend once so the capture path does no imports"""
+        quality = self._jpeg_quality
+        
+        if self._gpu_encode:
+            gpu_encoder = self._create_gpu_jpeg_encoder()
+            if gpu_encoder is not None:
+                return gpu_encoder
+        
+        try:
+            import numpy as np
+            from turbojpeg import TurboJPEG, TJPF_BGRA
+            turbojpeg = TurboJPEG()
+            
+            def encode_turbojpeg(screenshot) -> bytes:
+                width, height = screenshot.size
+                pixels = np.frombuffer(screenshot.raw, dtype=np.uint8).reshape(height, width, 4)
+                return turbojpeg.encode(pixels, quality=quality, pixel_format=TJPF_BGRA)
+            
+            return encode_turbojpeg
+        except Exception:
+            # PIL's JPEG encoder is used instead
+            pass
+        
+        from PIL import Image
+        frombuffer = Image.frombuffer
+        buffers = self._buffers
+        
+        def encode_pil(screenshot) -> bytes:
+            image = frombuffer('RGB', screenshot.size, screenshot.raw, 'raw', 'BGRX', 0, 1)
+            buffer = getattr(buffers, 'jpeg', None)
+            if buffer is None:
+                buffer = buffers.jpeg = io.BytesIO()
+            buffer.seek(0)
+            image.save(buffer, format='JPEG', quality=quality)
+            buffer.truncate()
+            return buffer.getvalue()
+        
+        return encode_pil
+    
+    def _create_gpu_jpeg_encoder(self) -> Optional[Callable[[Any], bytes]]:
+        """Bind torchvision's nvJPEG encoder if a CUDA device is available"""
+        quality = self._jpeg_quality
+        
+        try:
+            import torch
+            from torchvision.io import encode_jpeg
+            if not torch.cuda.is_available():
+                print("⚠️  No CUDA device for GPU JPEG encoding, using the CPU encoder")
+                return None
+        except ImportError:
+            print("⚠️  torch/torchvision not installed, using the CPU JPEG encoder")
+            return None
+        
+        def encode_gpu(screenshot) -> bytes:
+            width, height = screenshot.size
+            bgra = torch.frombuffer(screenshot.raw, dtype=torch.uint8).view(height, width, 4)
+            # Upload BGRA as-is; the channel swap and CHW layout happen on the GPU
+            rgb = bgra.to('cuda')[..., [2, 1, 0]].permute(2, 0, 1).contiguous()
+            return encode_jpeg(rgb, quality=quality).cpu().numpy().tobytes()
+        
+        return encode_gpu
+    
+    def _build_result(self, screenshot, metadata: Dict[str, Any]) -> CaptureResult:
+        """Wrap an MSS screenshot in a CaptureResult"""
+        if self._output_format == 'bgra_raw':
+            image_data = self._encode(screenshot)
+        else:
+            image_data = self._encode_cached(screenshot, metadata)
+        metadata.update(self._format_info(screenshot))
+        if not isinstance(image_data, Future):
+            metadata['size'] = len(image_data)
+        return CaptureResult(True, image_data, metadata=metadata)
+    
+    def _encode_cached(self, screenshot, metadata: Dict[str, Any]) -> Union[bytes, Future]:
+        """Encode a frame, reusing the previous encoding if the pixels are unchanged
+        
+        The previous raw buffer is kept and compared in full: a memcmp is
+        cheap next to an encode, and unlike a checksum it cannot match two
+        different frames.
+        """
+        last_frame = self._last_frame
+        if last_frame is not None and last_frame[0] == screenshot.size and last_frame[1] == screenshot.raw:
+            metadata['cached'] = True
+            return last_frame[2]
+        
+        image_data = self._encode_frame(screenshot)
+        self._last_frame = (screenshot.size, screenshot.raw, image_data)
+        return image_data
+    
     def _capture_full_screen(self) -> CaptureResult:
         """Capture full screen using MSS"""
         try:
             # Get the first monitor (usually primary)
-            monitor = self._mss.monitors[0]  # Monitor 0 is all monitors combined
+            grabber = self._grabber()
+            monitor = grabber.monitors[0]  # Monitor 0 is all monitors combined
             
             # Capture screenshot
-            screenshot = self._mss.grab(monitor)
-            
-            # Convert to PNG bytes
-            png_data = self._mss.tools.to_png(screenshot.rgb, screenshot.size)
+            screenshot = grabber.grab(monitor)
             
             metadata = {
                 'method': 'mss',
                 'operation': 'full_screen',
-                'monitor': monitor,
-                'size': len(png_data)
+                'monitor': monitor
             }
             
-            return CaptureResult(True, png_data, metadata=metadata)
+            return self._build_result(screenshot, metadata)
             
         except Exception as e:
             return CaptureResult(False, error=f"MSS full screen capture failed: {str(e)}")
     
-    def _capture_roi(self, roi: Tuple[int, int, int, int]) -> CaptureResult:
+    def _capture_roi(self, roi: Tuple[int, int, int, int], scale: float = 1.0) -> CaptureResult:
         """Capture ROI using MSS"""
         try:
             left, top, right, bottom = roi
@@ -264,23 +785,37 @@ class WindowsMSSCapture(ICaptureHandler):
             }
             
             # Capture screenshot
-            screenshot = self._mss.grab(monitor_region)
-            
-            # Convert to PNG bytes
-            png_data = self._mss.tools.to_png(screenshot.rgb, screenshot.size)
+            screenshot = self._grabber().grab(monitor_region)
             
             metadata = {
                 'method': 'mss',
                 'operation': 'roi_capture',
-                'roi': roi,
-                'size': len(png_data)
+                'roi': roi
             }
             
-            return CaptureResult(True, png_data, metadata=metadata)
+            if scale != 1.0:
+                screenshot = self._downsample(screenshot, monitor_region, scale)
+                metadata['scale'] = scale
+            
+            return self._build_result(screenshot, metadata)
             
         except Exception as e:
             return CaptureResult(False, error=f"MSS ROI capture failed: {str(e)}")
     
+    def _capture_scaled_roi(self, roi: Tuple[int, int, int, int], scale: float) -> CaptureResult:
+        """Capture ROI and shrink the raw pixels before they are encoded"""
+        return self._capture_roi(roi, scale)
+    
+    def _downsample(self, screenshot, region: Dict[str, int], scale: float):
+        """Resize an MSS screenshot, keeping it a BGRA ScreenShot for the encoders"""
+        from PIL import Image
+        
+        size = self._scaled_size(region['width'], region['height'], scale)
+        image = Image.frombuffer('RGBA', screenshot.size, screenshot.raw, 'raw', 'BGRA', 0, 1)
+        image = image.resize(size, Image.BILINEAR)
+        region = dict(region, width=size[0], height=size[1])
+        return type(screenshot)(bytearray(image.tobytes('raw', 'BGRA')), region)
+    
     # Add compatibility methods for direct access from CaptureServiceImpl
     def capture_roi(self, roi: Tuple[int, int, int, int]) -> CaptureResult:
         """Direct capture ROI method for CaptureServiceImpl"""
@@ -296,7 +831,15 @@ class WindowsMSSCapture(ICaptureHandler):
     
     def cleanup(self) -> None:
         """Clean up MSS resources"""
-        if self._mss:
-            self._mss.close()
-            self._mss = None
+        with self._grabbers_lock:
+            for grabber in self._open_grabbers:
+                grabber.close()
+            self._open_grabbers = []
+        self._grabbers = threading.local()
+        if self._encode_pool:
+            self._encode_pool.shutdown(wait=True)
+            self._encode_pool = None
+        self._jpeg_encoder = None
+        self._buffers = threading.local()
+        self._last_frame = None
         self._initialized = False
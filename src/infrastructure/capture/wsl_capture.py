@@ -2,19 +2,291 @@
 WSL-specific screenshot capture implementation
 Uses PowerShell bridge to capture Windows desktop from WSL
 """
+import asyncio
+import io
 import os
+import re
+import select
+import struct
 import subprocess
-import base64
-from typing import Tuple, Dict, Any
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Tuple, Dict, Any, Optional, Callable
 
-from . import ICaptureHandler, CaptureResult, CaptureMethod, CaptureCapabilities
+try:
+    import fcntl
+except ImportError:  # Not available on native Windows
+    fcntl = None
+
+try:
+    import pybase64  # SIMD-accelerated base64, same API as stdlib
+except ImportError:
+    import base64 as pybase64
+
+from . import (
+    ICaptureHandler, CaptureResult, CaptureMethod, CaptureCapabilities,
+    DEFAULT_PNG_COMPRESS_LEVEL, DEFAULT_JPEG_QUALITY, pil_save_options, fast_png_encoder,
+    palettize_few_colors
+)
+
+
+@lru_cache(maxsize=None)
+def _powershell_available() -> bool:
+    """Check once per process whether powershell.exe can be started"""
+    try:
+        print("Testing PowerShell availability...")
+        result = subprocess.run(
+            ['powershell.exe', '-Command', 'echo "test"'],
+            capture_output=True,
+            timeout=5,
+            text=True
+        )
+        ps_available = result.returncode == 0
+        if ps_available:
+            print("✅ PowerShell is available")
+        else:
+            print(f"❌ PowerShell test failed: {result.stderr}")
+        return ps_available
+    except Exception as e:
+        print(f"❌ PowerShell test error: {e}")
+        return False
+
+
+@lru_cache(maxsize=None)
+def _powershell_can_capture() -> bool:
+    """Check once per process that PowerShell can load the capture assemblies"""
+    test_script = '''
+    Add-Type -AssemblyName System.Windows.Forms
+    Add-Type -AssemblyName System.Drawing
+    Write-Output "OK"
+    '''
+    
+    try:
+        result = subprocess.run(
+            ['powershell.exe', '-Command', test_script],
+            capture_output=True,
+            timeout=10,
+            text=True
+        )
+    except Exception as e:
+        print(f"PowerShell test error: {e}")
+        return False
+    
+    if result.returncode == 0 and "OK" in result.stdout:
+        return True
+    
+    print(f"PowerShell test failed: {result.stderr}")
+    return False
 
 
 class WSLPowerShellCapture(ICaptureHandler):
-    """WSL screenshot capture using PowerShell bridge"""
+    """WSL screenshot capture using PowerShell bridge
+    
+    With transfer_format='bmp' or 'raw' the PowerShell host sends uncompressed
+    pixels and encoding happens on a Python thread pool instead of on the
+    Windows side; results then resolve their data on first access. 'raw'
+    copies the bitmap's pixels straight out with LockBits, skipping GDI+'s
+    BMP encoder as well. With transfer_format='png' the host (or a one-shot
+    script) encodes output_format itself, JPEG through GDI+'s JPEG encoder.
+    """
+    
+    TRANSFER_FORMATS = ('png', 'bmp', 'raw')
+    
+    # Long-lived PowerShell host: loads the .NET assemblies once, then serves
+    # one request per stdin line: "full" or "left top width height [outW outH]".
+    # An output size downsamples the region before it is encoded. Before the
+    # first request it sends one frame of four int32s: the virtual screen's
+    # left, top, width and height.
+    # Each frame is a little-endian int32 length followed by the image bytes
+    # ($SaveFormat, prepended at startup with $JpegQuality, picks PNG, JPEG,
+    # BMP or Raw: int32 width and height then top-down BGRX rows); a negative
+    # length is followed by a UTF-8 error message instead.
+    _HOST_SCRIPT = '''
+    Add-Type -AssemblyName System.Windows.Forms
+    Add-Type -AssemblyName System.Drawing
+    $stdout = [Console]::OpenStandardOutput()
+    $jpegCodec = [System.Drawing.Imaging.ImageCodecInfo]::GetImageEncoders() |
+        Where-Object { $_.FormatID -eq [System.Drawing.Imaging.ImageFormat]::Jpeg.Guid }
+    $jpegParams = New-Object System.Drawing.Imaging.EncoderParameters 1
+    $jpegParams.Param[0] = New-Object System.Drawing.Imaging.EncoderParameter([System.Drawing.Imaging.Encoder]::Quality, [long]$JpegQuality)
+    
+    function Send-Frame([int]$length, [byte[]]$bytes) {
+        $stdout.Write([BitConverter]::GetBytes($length), 0, 4)
+        $stdout.Write($bytes, 0, $bytes.Length)
+        $stdout.Flush()
+    }
+    
+    function Capture-Region([int]$left, [int]$top, [int]$width, [int]$height, [int]$outWidth, [int]$outHeight) {
+        $bitmap = New-Object System.Drawing.Bitmap $width, $height
+        $graphic = [System.Drawing.Graphics]::FromImage($bitmap)
+        $ms = New-Object System.IO.MemoryStream
+        try {
+            $graphic.CopyFromScreen($left, $top, 0, 0, $bitmap.Size)
+            if ($outWidth -gt 0 -and ($outWidth -ne $width -or $outHeight -ne $height)) {
+                $scaled = New-Object System.Drawing.Bitmap $outWidth, $outHeight
+                $scaledGraphic = [System.Drawing.Graphics]::FromImage($scaled)
+                $scaledGraphic.InterpolationMode = [System.Drawing.Drawing2D.InterpolationMode]::HighQualityBilinear
+                $scaledGraphic.DrawImage($bitmap, 0, 0, $outWidth, $outHeight)
+                $scaledGraphic.Dispose()
+                $bitmap.Dispose()
+                $bitmap = $scaled
+            }
+            if ($SaveFormat -eq 'Raw') {
+                $rect = New-Object System.Drawing.Rectangle 0, 0, $bitmap.Width, $bitmap.Height
+                $data = $bitmap.LockBits($rect, [System.Drawing.Imaging.ImageLockMode]::ReadOnly,
+                                         [System.Drawing.Imaging.PixelFormat]::Format32bppRgb)
+                try {
+                    $size = $data.Stride * $bitmap.Height
+                    $bytes = New-Object byte[] ($size + 8)
+                    [BitConverter]::GetBytes($bitmap.Width).CopyTo($bytes, 0)
+                    [BitConverter]::GetBytes($bitmap.Height).CopyTo($bytes, 4)
+                    [System.Runtime.InteropServices.Marshal]::Copy($data.Scan0, $bytes, 8, $size)
+                } finally {
+                    $bitmap.UnlockBits($data)
+                }
+                return ,$bytes
+            }
+            if ($SaveFormat -eq 'Jpeg') {
+                $bitmap.Save($ms, $jpegCodec, $jpegParams)
+            } else {
+                $bitmap.Save($ms, [System.Drawing.Imaging.ImageFormat]::$SaveFormat)
+            }
+            return ,$ms.ToArray()
+        } finally {
+            $graphic.Dispose()
+            $bitmap.Dispose()
+            $ms.Dispose()
+        }
+    }
+    
+    function Send-Capture([int]$left, [int]$top, [int]$width, [int]$height, [int]$outWidth, [int]$outHeight) {
+        try {
+            $bytes = Capture-Region $left $top $width $height $outWidth $outHeight
+            Send-Frame $bytes.Length $bytes
+        } catch {
+            $message = [System.Text.Encoding]::UTF8.GetBytes($_.Exception.Message)
+            Send-Frame (-$message.Length) $message
+        }
+    }
+    
+    $vs = [System.Windows.Forms.SystemInformation]::VirtualScreen
+    $bounds = New-Object byte[] 16
+    [BitConverter]::GetBytes($vs.Left).CopyTo($bounds, 0)
+    [BitConverter]::GetBytes($vs.Top).CopyTo($bounds, 4)
+    [BitConverter]::GetBytes($vs.Width).CopyTo($bounds, 8)
+    [BitConverter]::GetBytes($vs.Height).CopyTo($bounds, 12)
+    Send-Frame $bounds.Length $bounds
+    
+    while (($line = [Console]::In.ReadLine()) -ne $null) {
+        $parts = $line.Trim().Split(' ')
+        if ($parts[0] -eq 'full') {
+            $vs = [System.Windows.Forms.SystemInformation]::VirtualScreen
+            Send-Capture $vs.Left $vs.Top $vs.Width $vs.Height 0 0
+        } else {
+            Send-Capture ([int]$parts[0]) ([int]$parts[1]) ([int]$parts[2]) ([int]$parts[3]) ([int]$parts[4]) ([int]$parts[5])
+        }
+    }
+    '''
+    _HOST_READ_TIMEOUT = 60  # seconds, same budget as a one-shot capture
+    _HOST_PIPE_SIZE = 1 << 20  # fewer wakeups per multi-megabyte frame
+    _ROI_SCRIPT_CACHE_SIZE = 64  # watched ROIs are few; ad-hoc API captures just cycle the cache
     
-    def __init__(self):
+    # One-shot scripts used when the persistent host is unavailable. The
+    # monitor dump is only spliced into the first script of each instance.
+    _MONITOR_DEBUG_SCRIPT = '''
+            $VirtualScreen = [System.Windows.Forms.SystemInformation]::VirtualScreen
+            $AllScreens = [System.Windows.Forms.Screen]::AllScreens
+            Write-Output "DEBUG_START"
+            Write-Output "Virtual Screen: $($VirtualScreen.Left), $($VirtualScreen.Top), $($VirtualScreen.Width) x $($VirtualScreen.Height)"
+            Write-Output "Number of screens: $($AllScreens.Length)"
+            foreach ($screen in $AllScreens) {
+                Write-Output "Screen: $($screen.Bounds.X), $($screen.Bounds.Y), $($screen.Bounds.Width) x $($screen.Bounds.Height), Primary: $($screen.Primary)"
+            }
+            Write-Output "DEBUG_END"
+    '''
+    _FULL_SCREEN_SCRIPT = '''
+        Add-Type -AssemblyName System.Windows.Forms
+        Add-Type -AssemblyName System.Drawing
+        
+        try {{
+            {monitor_debug}
+            # Get information about the virtual screen (all monitors combined)
+            $VirtualScreen = [System.Windows.Forms.SystemInformation]::VirtualScreen
+            
+            # Create bitmap to hold the screenshot
+            $bitmap = New-Object System.Drawing.Bitmap $VirtualScreen.Width, $VirtualScreen.Height
+            $graphic = [System.Drawing.Graphics]::FromImage($bitmap)
+            
+            # Capture the entire virtual screen
+            $graphic.CopyFromScreen($VirtualScreen.Left, $VirtualScreen.Top, 0, 0, $bitmap.Size)
+            
+            # Encode as PNG or JPEG
+            $ms = New-Object System.IO.MemoryStream
+            {save_image}
+            Write-Output ([Convert]::ToBase64String($ms.ToArray()))
+        }} catch {{
+            Write-Error $_.Exception.Message
+            exit 1
+        }} finally {{
+            if ($graphic) {{ $graphic.Dispose() }}
+            if ($bitmap) {{ $bitmap.Dispose() }}
+            if ($ms) {{ $ms.Dispose() }}
+        }}
+    '''
+    _ROI_SCRIPT = '''
+        Add-Type -AssemblyName System.Windows.Forms
+        Add-Type -AssemblyName System.Drawing
+        
+        try {{
+            {monitor_debug}
+            # Create bitmap to hold the screenshot
+            $bitmap = New-Object System.Drawing.Bitmap {width}, {height}
+            $graphic = [System.Drawing.Graphics]::FromImage($bitmap)
+            
+            # Capture the region (virtual screen coordinates)
+            $graphic.CopyFromScreen({left}, {top}, 0, 0, $bitmap.Size)
+            {downsample}
+            
+            # Encode as PNG or JPEG
+            $ms = New-Object System.IO.MemoryStream
+            {save_image}
+            Write-Output ([Convert]::ToBase64String($ms.ToArray()))
+        }} catch {{
+            Write-Error $_.Exception.Message
+            exit 1
+        }} finally {{
+            if ($graphic) {{ $graphic.Dispose() }}
+            if ($bitmap) {{ $bitmap.Dispose() }}
+            if ($ms) {{ $ms.Dispose() }}
+        }}
+    '''
+    _SAVE_PNG_SCRIPT = '$bitmap.Save($ms, [System.Drawing.Imaging.ImageFormat]::Png)'
+    _SAVE_JPEG_SCRIPT = '''$codec = [System.Drawing.Imaging.ImageCodecInfo]::GetImageEncoders() |
+                Where-Object { $_.FormatID -eq [System.Drawing.Imaging.ImageFormat]::Jpeg.Guid }
+            $params = New-Object System.Drawing.Imaging.EncoderParameters 1
+            $params.Param[0] = New-Object System.Drawing.Imaging.EncoderParameter([System.Drawing.Imaging.Encoder]::Quality, [long]{quality})
+            $bitmap.Save($ms, $codec, $params)'''
+    _VIRTUAL_SCREEN_PATTERN = re.compile(r'Virtual Screen: (-?\d+), (-?\d+), (\d+) x (\d+)')
+    _DOWNSAMPLE_SCRIPT = '''
+            # Downsample before encoding
+            $scaled = New-Object System.Drawing.Bitmap {width}, {height}
+            $scaledGraphic = [System.Drawing.Graphics]::FromImage($scaled)
+            $scaledGraphic.InterpolationMode = [System.Drawing.Drawing2D.InterpolationMode]::HighQualityBilinear
+            $scaledGraphic.DrawImage($bitmap, 0, 0, {width}, {height})
+            $scaledGraphic.Dispose()
+            $bitmap.Dispose()
+            $bitmap = $scaled
+    '''
+    
+    def __init__(self, transfer_format: str = 'png', encode_workers: int = 2,
+                 png_compress_level: int = DEFAULT_PNG_COMPRESS_LEVEL, png_encoder: str = 'pil',
+                 png_quantize: bool = False, output_format: str = 'png',
+                 jpeg_quality: int = DEFAULT_JPEG_QUALITY):
         super().__init__()
+        if transfer_format not in self.TRANSFER_FORMATS:
+            raise ValueError(f"Unsupported PowerShell transfer format: {transfer_format}")
+        
         self._capabilities = CaptureCapabilities(
             method=CaptureMethod.WSL_POWERSHELL,
             supports_roi=True,
@@ -24,9 +296,41 @@ class WSLPowerShellCapture(ICaptureHandler):
             reliability_rating=4,
             platform_specific=True
         )
+        self._host: Optional[subprocess.Popen] = None
+        self._host_lock = threading.Lock()
+        # Set once the host has started; a host that dies is restarted lazily
+        self._host_wanted = False
+        self._transfer_format = transfer_format
+        self._encode_workers = encode_workers
+        self._encode_pool: Optional[ThreadPoolExecutor] = None
+        self._decode_frame: Optional[Callable[[bytearray], Any]] = None
+        self._buffers = threading.local()
+        self._png_compress_level = png_compress_level
+        self._output_format = output_format
+        self._jpeg_quality = jpeg_quality
+        self._save_options = pil_save_options(output_format, png_compress_level, jpeg_quality)
+        python_png = transfer_format != 'png' and output_format == 'png'
+        self._fast_png = fast_png_encoder(png_encoder) if python_png else None
+        self._png_quantize = png_quantize
+        if transfer_format != 'png':
+            self._host_format = transfer_format.capitalize()
+        else:
+            self._host_format = 'Jpeg' if output_format == 'jpeg' else 'Png'
+        if output_format == 'jpeg':
+            self._save_image_script = self._SAVE_JPEG_SCRIPT.replace('{quality}', str(jpeg_quality))
+        else:
+            self._save_image_script = self._SAVE_PNG_SCRIPT
+        self._debug_shown = False
+        self._virtual_bounds: Optional[Tuple[int, int, int, int]] = None
+        self._roi_scripts: Dict[Tuple[Tuple[int, int, int, int], float], str] = {}
     
     def can_handle(self) -> bool:
         """Check if WSL with PowerShell is available"""
+        # A live capture host already proves PowerShell works; don't spawn a
+        # probe process for every capture the chain routes through here
+        if self._host_alive():
+            return True
+        
         # Check for WSL environment
         if 'WSL_DISTRO_NAME' not in os.environ:
             try:
@@ -40,23 +344,7 @@ class WSLPowerShellCapture(ICaptureHandler):
                 return False
         
         # Test PowerShell availability
-        try:
-            print("Testing PowerShell availability...")
-            result = subprocess.run(
-                ['powershell.exe', '-Command', 'echo "test"'],
-                capture_output=True,
-                timeout=5,
-                text=True
-            )
-            ps_available = result.returncode == 0
-            if ps_available:
-                print("✅ PowerShell is available")
-            else:
-                print(f"❌ PowerShell test failed: {result.stderr}")
-            return ps_available
-        except Exception as e:
-            print(f"❌ PowerShell test error: {e}")
-            return False
+        return _powershell_available()
     
     def initialize(self) -> bool:
         """Initialize WSL PowerShell capture"""
@@ -70,205 +358,362 @@ class WSLPowerShellCapture(ICaptureHandler):
                         return False
                 
             # Test PowerShell availability and required assemblies
-            test_script = '''
-            Add-Type -AssemblyName System.Windows.Forms
-            Add-Type -AssemblyName System.Drawing
-            Write-Output "OK"
-            '''
-            
-            result = subprocess.run(
-                ['powershell.exe', '-Command', test_script],
-                capture_output=True,
-                timeout=10,
-                text=True
-            )
+            if not _powershell_can_capture():
+                return False
             
-            if result.returncode == 0 and "OK" in result.stdout:
-                self._initialized = True
-                return True
+            if self._transfer_format != 'png':
+                self._decode_frame = self._create_frame_decoder()
+                self._encode_pool = ThreadPoolExecutor(
+                    max_workers=max(1, self._encode_workers),
+                    thread_name_prefix='wsl-encode'
+                )
+            self._host_wanted = self._start_host()
+            self._initialized = True
+            return True
             
-            print(f"PowerShell test failed: {result.stderr}")
+        except Exception as e:
+            print(f"WSL PowerShell capture initialization failed: {e}")
             return False
+    
+    def _start_host(self) -> bool:
+        """Start the persistent PowerShell capture host"""
+        try:
+            self._host = subprocess.Popen(
+                ['powershell.exe', '-NoProfile', '-NoLogo', '-NonInteractive',
+                 '-Command', f"$SaveFormat = '{self._host_format}'\n$JpegQuality = {self._jpeg_quality}\n"
+                             f"{self._HOST_SCRIPT}"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                bufsize=0
+            )
+            self._grow_pipe(self._host.stdout.fileno())
             
+            # The host reports the virtual screen before serving requests;
+            # one-shot scripts learn it from their monitor dump instead
+            (length,) = struct.unpack('<i', self._read_exact(4))
+            left, top, width, height = struct.unpack('<4i', self._read_exact(length))
+            self._virtual_bounds = (left, top, left + width, top + height)
+            print(f"✅ Started persistent PowerShell capture host (virtual screen {self._virtual_bounds})")
+            return True
         except Exception as e:
-            print(f"WSL PowerShell capture initialization failed: {e}")
+            print(f"⚠️  Persistent PowerShell host unavailable, using one-shot scripts: {e}")
+            if self._host is not None:
+                self._host.kill()
+            self._host = None
             return False
     
-    def _capture_full_screen(self) -> CaptureResult:
-        """Capture full screen using PowerShell from WSL"""
-        ps_script = '''
-        Add-Type -AssemblyName System.Windows.Forms
-        Add-Type -AssemblyName System.Drawing
+    def _host_alive(self) -> bool:
+        """Check whether the persistent PowerShell host is running"""
+        host = self._host
+        return host is not None and host.poll() is None
+    
+    def _stop_host(self) -> None:
+        """Stop the persistent PowerShell capture host"""
+        host, self._host = self._host, None
+        if host is None:
+            return
+        try:
+            host.stdin.close()
+            host.wait(timeout=5)
+        except Exception:
+            host.kill()
+    
+    def _grow_pipe(self, fd: int) -> None:
+        """Enlarge the host's stdout pipe buffer where Linux allows it"""
+        set_pipe_size = getattr(fcntl, 'F_SETPIPE_SZ', 1031) if fcntl else None
+        if set_pipe_size is None:
+            return
+        try:
+            fcntl.fcntl(fd, set_pipe_size, self._HOST_PIPE_SIZE)
+        except OSError:
+            pass  # Capped by /proc/sys/fs/pipe-max-size; the default still works
+    
+    def _read_exact(self, size: int) -> bytearray:
+        """Read exactly size bytes from the host's stdout
         
-        try {
-            # Get information about the virtual screen (all monitors combined)
-            $VirtualScreen = [System.Windows.Forms.SystemInformation]::VirtualScreen
-            $VirtualWidth = $VirtualScreen.Width
-            $VirtualHeight = $VirtualScreen.Height
-            $VirtualLeft = $VirtualScreen.Left
-            $VirtualTop = $VirtualScreen.Top
-            
-            # Get information about all screens
-            $AllScreens = [System.Windows.Forms.Screen]::AllScreens
-            $PrimaryScreen = [System.Windows.Forms.Screen]::PrimaryScreen
-            
-            # Debug output
-            Write-Output "DEBUG_START"
-            Write-Output "Virtual Screen: $VirtualLeft, $VirtualTop, $VirtualWidth x $VirtualHeight"
-            Write-Output "Number of screens: $($AllScreens.Length)"
-            foreach ($screen in $AllScreens) {
-                Write-Output "Screen: $($screen.Bounds.X), $($screen.Bounds.Y), $($screen.Bounds.Width) x $($screen.Bounds.Height), Primary: $($screen.Primary)"
-            }
-            Write-Output "DEBUG_END"
-
-            # Create bitmap to hold the screenshot
-            $bitmap = New-Object System.Drawing.Bitmap $VirtualWidth, $VirtualHeight
-            $graphic = [System.Drawing.Graphics]::FromImage($bitmap)
-            
-            # Set high quality settings
-            $graphic.InterpolationMode = [System.Drawing.Drawing2D.InterpolationMode]::HighQualityBicubic
-            $graphic.PixelOffsetMode = [System.Drawing.Drawing2D.PixelOffsetMode]::HighQuality
-            $graphic.SmoothingMode = [System.Drawing.Drawing2D.SmoothingMode]::HighQuality
-            
-            # Capture the entire virtual screen
-            $graphic.CopyFromScreen($VirtualLeft, $VirtualTop, 0, 0, $bitmap.Size)
-            
-            # Convert to PNG
-            $ms = New-Object System.IO.MemoryStream
-            $bitmap.Save($ms, [System.Drawing.Imaging.ImageFormat]::Png)
-            $bytes = $ms.ToArray()
-            $base64 = [Convert]::ToBase64String($bytes)
-            
-            Write-Output $base64
-        } catch {
-            Write-Error $_.Exception.Message
-            exit 1
-        } finally {
-            if ($graphic) { $graphic.Dispose() }
-            if ($bitmap) { $bitmap.Dispose() }
-            if ($ms) { $ms.Dispose() }
+        Reads straight into one preallocated buffer instead of joining chunks.
+        """
+        fd = self._host.stdout.fileno()
+        buffer = bytearray(size)
+        view = memoryview(buffer)
+        received = 0
+        while received < size:
+            ready, _, _ = select.select([fd], [], [], self._HOST_READ_TIMEOUT)
+            if not ready:
+                raise TimeoutError("PowerShell host did not respond in time")
+            count = os.readv(fd, [view[received:]])
+            if not count:
+                raise EOFError("PowerShell host closed its output")
+            received += count
+        return buffer
+    
+    def _host_capture(self, command: str, operation: str) -> Optional[CaptureResult]:
+        """Run a single capture on the persistent host
+        
+        Returns None if the host is unavailable so callers can fall back.
+        """
+        with self._host_lock:
+            if not self._host_alive():
+                # Restart a host that failed earlier; if that fails too,
+                # stay on one-shot scripts
+                if not self._host_wanted:
+                    return None
+                self._stop_host()
+                self._host_wanted = self._start_host()
+                if not self._host_wanted:
+                    return None
+            try:
+                self._host.stdin.write(f"{command}\n".encode('ascii'))
+                self._host.stdin.flush()
+                (length,) = struct.unpack('<i', self._read_exact(4))
+                payload = self._read_exact(abs(length))
+            except Exception as e:
+                print(f"⚠️  PowerShell host failed during {operation}, restarting on next capture: {e}")
+                self._stop_host()
+                return None
+        
+        if length < 0:
+            error_msg = payload.decode('utf-8', errors='replace')
+            return CaptureResult(False, error=f"WSL PowerShell {operation} failed: {error_msg}")
+        
+        metadata = {
+            'method': 'wsl_powershell',
+            'operation': operation,
+            'environment': 'wsl',
+            'transport': 'persistent_host',
+            'transfer_format': self._transfer_format,
+            'format': self._output_format
         }
-        '''
+        if self._encode_pool is not None:
+            image_data = self._encode_pool.submit(self._encode_frame, payload)
+        else:
+            image_data = bytes(payload)
+            metadata['size'] = len(image_data)
+        return CaptureResult(True, image_data, metadata=metadata)
+    
+    def _create_frame_decoder(self) -> Callable[[bytearray], Any]:
+        """Bind the PIL decoder for uncompressed host frames"""
+        from PIL import Image
+        
+        if self._transfer_format == 'bmp':
+            open_image = Image.open
+            return lambda frame: open_image(io.BytesIO(frame))
+        
+        frombuffer = Image.frombuffer
+        
+        def decode_raw(frame: bytearray):
+            width, height = struct.unpack_from('<ii', frame)
+            return frombuffer('RGB', (width, height), memoryview(frame)[8:], 'raw', 'BGRX', 0, 1)
         
+        return decode_raw
+    
+    def _encode_frame(self, frame: bytearray) -> bytes:
+        """Encode an uncompressed frame received from the host in the output format"""
+        image = self._decode_frame(frame)
+        if self._fast_png is not None:
+            return self._fast_png(image)
+        
+        if self._output_format == 'jpeg':
+            if image.mode not in ('RGB', 'L'):
+                image = image.convert('RGB')  # GDI+ BMPs can carry alpha
+        elif self._png_quantize:
+            image = palettize_few_colors(image)
+        
+        # One buffer per encode thread, reused across frames
+        buffer = getattr(self._buffers, 'encoded', None)
+        if buffer is None:
+            buffer = self._buffers.encoded = io.BytesIO()
+        buffer.seek(0)
+        image.save(buffer, **self._save_options)
+        # Truncating after the save keeps the buffer's capacity between frames
+        buffer.truncate()
+        return buffer.getvalue()
+    
+    def _capture_full_screen(self) -> CaptureResult:
+        """Capture full screen using PowerShell from WSL"""
+        result = self._host_capture("full", "full screen capture")
+        if result is not None:
+            return result
+        
+        ps_script = self._FULL_SCREEN_SCRIPT.format(
+            monitor_debug=self._monitor_debug_script(),
+            save_image=self._save_image_script
+        )
         return self._execute_powershell_script(ps_script, "full screen capture")
     
-    def _capture_roi(self, roi: Tuple[int, int, int, int]) -> CaptureResult:
+    def _capture_roi(self, roi: Tuple[int, int, int, int], scale: float = 1.0) -> CaptureResult:
         """Capture ROI using PowerShell from WSL"""
+        if not self._roi_on_screen(roi):
+            return CaptureResult(False, error=f"ROI {roi} is outside the virtual screen {self._virtual_bounds}")
+        
         left, top, right, bottom = roi
         width = right - left
         height = bottom - top
         
-        ps_script = f'''
-        Add-Type -AssemblyName System.Windows.Forms
-        Add-Type -AssemblyName System.Drawing
+        command = f"{left} {top} {width} {height}"
+        if scale != 1.0:
+            command += " {} {}".format(*self._scaled_size(width, height, scale))
         
-        try {{
-            # Get information about the virtual screen (all monitors combined)
-            $VirtualScreen = [System.Windows.Forms.SystemInformation]::VirtualScreen
-            $VirtualLeft = $VirtualScreen.Left
-            $VirtualTop = $VirtualScreen.Top
-            
-            # Create bitmap to hold the screenshot
-            $bitmap = New-Object System.Drawing.Bitmap {width}, {height}
-            $graphic = [System.Drawing.Graphics]::FromImage($bitmap)
-            
-            # Set high quality settings
-            $graphic.InterpolationMode = [System.Drawing.Drawing2D.InterpolationMode]::HighQualityBicubic
-            $graphic.PixelOffsetMode = [System.Drawing.Drawing2D.PixelOffsetMode]::HighQuality
-            $graphic.SmoothingMode = [System.Drawing.Drawing2D.SmoothingMode]::HighQuality
-
-            # Take into account the virtual screen coordinates offset
-            $captureLeft = {left} 
-            $captureTop = {top}
-            
-            # Debug info
-            Write-Output "DEBUG_START"
-            Write-Output "ROI: {left}, {top}, {width} x {height}"
-            Write-Output "Virtual Screen Offset: $VirtualLeft, $VirtualTop"
-            Write-Output "Capture: $captureLeft, $captureTop, {width} x {height}"
-            Write-Output "DEBUG_END"
-            
-            # Capture the region
-            $graphic.CopyFromScreen($captureLeft, $captureTop, 0, 0, $bitmap.Size)
-            
-            # Convert to PNG
-            $ms = New-Object System.IO.MemoryStream
-            $bitmap.Save($ms, [System.Drawing.Imaging.ImageFormat]::Png)
-            $bytes = $ms.ToArray()
-            $base64 = [Convert]::ToBase64String($bytes)
-            
-            Write-Output $base64
-        }} catch {{
-            Write-Error $_.Exception.Message
-            exit 1
-        }} finally {{
-            if ($graphic) {{ $graphic.Dispose() }}
-            if ($bitmap) {{ $bitmap.Dispose() }}
-            if ($ms) {{ $ms.Dispose() }}
-        }}
-        '''
+        result = self._host_capture(command, f"ROI capture {roi}")
+        if result is None:
+            result = self._execute_powershell_script(self._roi_script(roi, scale), f"ROI capture {roi}")
+        if result.success and scale != 1.0:
+            result.metadata['scale'] = scale
+        return result
+    
+    def _capture_scaled_roi(self, roi: Tuple[int, int, int, int], scale: float) -> CaptureResult:
+        """Capture ROI, downsampled on the Windows side before encoding"""
+        return self._capture_roi(roi, scale)
+    
+    async def _capture_roi_async(self, roi: Tuple[int, int, int, int]) -> CaptureResult:
+        """Capture ROI without blocking the event loop on the PowerShell round trip"""
+        if self._host_wanted:
+            # The persistent host is shared with the synchronous path under a lock
+            return await super()._capture_roi_async(roi)
+        
+        return await self._execute_powershell_script_async(self._roi_script(roi), f"ROI capture {roi}")
+    
+    def _roi_script(self, roi: Tuple[int, int, int, int], scale: float = 1.0) -> str:
+        """Build the one-shot PowerShell script for an ROI capture
+        
+        Monitoring captures the same ROI over and over, so scripts are
+        cached per (roi, scale) once the one-time monitor dump is done.
+        """
+        script = self._roi_scripts.get((roi, scale))
+        if script is not None:
+            return script
+        
+        left, top, right, bottom = roi
+        width = right - left
+        height = bottom - top
         
-        return self._execute_powershell_script(ps_script, f"ROI capture {roi}")
+        downsample = ''
+        if scale != 1.0:
+            scaled_width, scaled_height = self._scaled_size(width, height, scale)
+            downsample = self._DOWNSAMPLE_SCRIPT.format(width=scaled_width, height=scaled_height)
+        
+        monitor_debug = self._monitor_debug_script()
+        script = self._ROI_SCRIPT.format(
+            left=left, top=top, width=width, height=height,
+            monitor_debug=monitor_debug,
+            downsample=downsample,
+            save_image=self._save_image_script
+        )
+        if not monitor_debug:
+            if len(self._roi_scripts) >= self._ROI_SCRIPT_CACHE_SIZE:
+                self._roi_scripts.clear()
+            self._roi_scripts[(roi, scale)] = script
+        return script
+    
+    def _roi_on_screen(self, roi: Tuple[int, int, int, int]) -> bool:
+        """Check the ROI overlaps the virtual screen, once its bounds are known"""
+        if self._virtual_bounds is None:
+            return True
+        left, top, right, bottom = roi
+        screen_left, screen_top, screen_right, screen_bottom = self._virtual_bounds
+        return left < screen_right and right > screen_left and top < screen_bottom and bottom > screen_top
+    
+    def _monitor_debug_script(self) -> str:
+        """Return the monitor dump for the first one-shot script only"""
+        if self._debug_shown:
+            return ''
+        self._debug_shown = True
+        return self._MONITOR_DEBUG_SCRIPT
     
     def _execute_powershell_script(self, script: str, operation: str) -> CaptureResult:
         """Execute PowerShell script from WSL and return capture result"""
         try:
             print(f"📷 Executing PowerShell capture for {operation}...")
+            # Bytes, not text: the base64 payload is decoded straight from stdout
             result = subprocess.run(
                 ['powershell.exe', '-Command', script],
                 capture_output=True,
-                timeout=60,  # Increase timeout for large screenshots
-                text=True
+                timeout=60  # Increase timeout for large screenshots
             )
-            
-            if result.returncode == 0 and result.stdout.strip():
-                output = result.stdout.strip()
-                
-                # Check for debug output and log it
-                debug_start = output.find('DEBUG_START')
-                debug_end = output.find('DEBUG_END')
-                
-                if debug_start >= 0 and debug_end > debug_start:
-                    debug_info = output[debug_start + len('DEBUG_START'):debug_end].strip()
-                    print(f"🖥️ Monitor Configuration:")
-                    for line in debug_info.split('\n'):
-                        print(f"  {line.strip()}")
-                    
-                    # Remove debug info from output
-                    base64_start = debug_end + len('DEBUG_END')
-                    base64_data = output[base64_start:].strip()
-                else:
-                    base64_data = output
-                
-                # Decode base64 data
-                try:
-                    if not base64_data:
-                        print(f"❌ Empty base64 data received from PowerShell")
-                        return CaptureResult(False, error="Empty image data received from PowerShell")
-                    
-                    print(f"📷 Received base64 data (length: {len(base64_data)})")
-                    image_data = base64.b64decode(base64_data)
-                    print(f"✅ Successfully decoded image data (size: {len(image_data)} bytes)")
-                    
-                    metadata = {
-                        'method': 'wsl_powershell',
-                        'operation': operation,
-                        'size': len(image_data),
-                        'environment': 'wsl'
-                    }
-                    
-                    return CaptureResult(True, image_data, metadata=metadata)
-                except Exception as e:
-                    return CaptureResult(False, error=f"Failed to decode base64 data: {e}")
-            else:
-                error_msg = result.stderr if result.stderr else "PowerShell script failed"
-                return CaptureResult(False, error=f"WSL PowerShell {operation} failed: {error_msg}")
+            return self._parse_powershell_output(result.returncode, result.stdout, result.stderr, operation)
                 
         except subprocess.TimeoutExpired:
             return CaptureResult(False, error=f"WSL PowerShell {operation} timed out")
         except Exception as e:
             return CaptureResult(False, error=f"WSL PowerShell {operation} error: {str(e)}")
     
+    async def _execute_powershell_script_async(self, script: str, operation: str) -> CaptureResult:
+        """Execute PowerShell script from WSL as an asyncio subprocess"""
+        proc = None
+        try:
+            print(f"📷 Executing PowerShell capture for {operation}...")
+            proc = await asyncio.create_subprocess_exec(
+                'powershell.exe', '-Command', script,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=60)
+            return self._parse_powershell_output(proc.returncode, stdout, stderr, operation)
+        
+        except asyncio.TimeoutError:
+            if proc and proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+            return CaptureResult(False, error=f"WSL PowerShell {operation} timed out")
+        except Exception as e:
+            return CaptureResult(False, error=f"WSL PowerShell {operation} error: {str(e)}")
+    
+    def _parse_powershell_output(self, returncode: int, stdout: bytes, stderr: bytes,
+                                 operation: str) -> CaptureResult:
+        """Turn the raw output of a one-shot capture script into a capture result
+        
+        Only the small debug block is decoded to text; the base64 image is
+        sliced out of the bytes and decoded directly.
+        """
+        if returncode == 0 and stdout.strip():
+            output = stdout.strip()
+            
+            # Check for debug output and log it
+            debug_start = output.find(b'DEBUG_START')
+            debug_end = output.find(b'DEBUG_END')
+            
+            if debug_start >= 0 and debug_end > debug_start:
+                debug_info = output[debug_start + len(b'DEBUG_START'):debug_end].decode('utf-8', errors='replace').strip()
+                print(f"🖥️ Monitor Configuration:")
+                for line in debug_info.split('\n'):
+                    print(f"  {line.strip()}")
+                    match = self._VIRTUAL_SCREEN_PATTERN.search(line)
+                    if match:
+                        left, top, width, height = map(int, match.groups())
+                        self._virtual_bounds = (left, top, left + width, top + height)
+                
+                # Remove debug info from output
+                base64_start = debug_end + len(b'DEBUG_END')
+                base64_data = output[base64_start:].strip()
+            else:
+                base64_data = output
+            
+            # Decode base64 data
+            try:
+                if not base64_data:
+                    print(f"❌ Empty base64 data received from PowerShell")
+                    return CaptureResult(False, error="Empty image data received from PowerShell")
+                
+                print(f"📷 Received base64 data (length: {len(base64_data)})")
+                image_data = pybase64.b64decode(base64_data, validate=False)
+                print(f"✅ Successfully decoded image data (size: {len(image_data)} bytes)")
+                
+                metadata = {
+                    'method': 'wsl_powershell',
+                    'operation': operation,
+                    'size': len(image_data),
+                    'environment': 'wsl',
+                    'format': self._output_format
+                }
+                
+                return CaptureResult(True, image_data, metadata=metadata)
+            except Exception as e:
+                return CaptureResult(False, error=f"Failed to decode base64 data: {e}")
+        else:
+            error_msg = stderr.decode('utf-8', errors='replace') if stderr else "PowerShell script failed"
+            return CaptureResult(False, error=f"WSL PowerShell {operation} failed: {error_msg}")
+    
     # Add compatibility methods for direct access from CaptureServiceImpl
     def capture_roi(self, roi: Tuple[int, int, int, int]) -> CaptureResult:
         """Direct capture ROI method for CaptureServiceImpl"""
@@ -276,6 +721,12 @@ class WSLPowerShellCapture(ICaptureHandler):
             return CaptureResult(False, error="WSL PowerShell capture not initialized")
         return self._capture_roi(roi)
     
+    async def capture_roi_async(self, roi: Tuple[int, int, int, int]) -> CaptureResult:
+        """Direct asynchronous capture ROI method"""
+        if not self._initialized:
+            return CaptureResult(False, error="WSL PowerShell capture not initialized")
+        return await self._capture_roi_async(roi)
+    
     def capture_full_screen(self) -> CaptureResult:
         """Direct capture full screen method for CaptureServiceImpl"""
         if not self._initialized:
@@ -284,13 +735,22 @@ class WSLPowerShellCapture(ICaptureHandler):
     
     def cleanup(self) -> None:
         """Clean up resources"""
+        with self._host_lock:
+            self._host_wanted = False
+            self._stop_host()
+        if self._encode_pool:
+            self._encode_pool.shutdown(wait=True)
+            self._encode_pool = None
+        self._roi_scripts.clear()
         self._initialized = False
 
 
 class WSLPyAutoGUICapture(ICaptureHandler):
     """WSL screenshot capture using PyAutoGUI fallback"""
     
-    def __init__(self):
+    def __init__(self, png_compress_level: int = DEFAULT_PNG_COMPRESS_LEVEL,
+                 output_format: str = 'png', jpeg_quality: int = DEFAULT_JPEG_QUALITY,
+                 png_encoder: str = 'pil', png_quantize: bool = False):
         super().__init__()
         self._capabilities = CaptureCapabilities(
             method=CaptureMethod.PYAUTOGUI,
@@ -302,6 +762,13 @@ class WSLPyAutoGUICapture(ICaptureHandler):
             platform_specific=False
         )
         self._pyautogui = None
+        self._screenshot: Optional[Callable[..., Any]] = None
+        self._output_format = output_format
+        self._save_options = pil_save_options(output_format, png_compress_level, jpeg_quality)
+        self._fast_png = fast_png_encoder(png_encoder) if output_format == 'png' else None
+        self._png_quantize = png_quantize and output_format == 'png'
+        self._encode_buffer = io.BytesIO()
+        self._encode_lock = threading.Lock()
     
     def can_handle(self) -> bool:
         """Check if PyAutoGUI is available in WSL"""
@@ -334,6 +801,7 @@ class WSLPyAutoGUICapture(ICaptureHandler):
             # Disable fail-safe
             pyautogui.FAILSAFE = False
             self._pyautogui = pyautogui
+            self._screenshot = pyautogui.screenshot
             
             # Test if we can get screen size
             try:
@@ -356,19 +824,16 @@ class WSLPyAutoGUICapture(ICaptureHandler):
     def _capture_full_screen(self) -> CaptureResult:
         """Capture full screen using PyAutoGUI"""
         try:
-            import io
-            
             # Take screenshot
-            screenshot = self._pyautogui.screenshot()
+            screenshot = self._screenshot()
             
-            # Convert to PNG bytes
-            img_buffer = io.BytesIO()
-            screenshot.save(img_buffer, format='PNG')
-            image_data = img_buffer.getvalue()
+            # Encode in the configured output format
+            image_data = self._encode_image(screenshot)
             
             metadata = {
                 'method': 'pyautogui',
                 'operation': 'full_screen',
+                'format': self._output_format,
                 'size': len(image_data),
                 'environment': 'wsl'
             }
@@ -378,36 +843,58 @@ class WSLPyAutoGUICapture(ICaptureHandler):
         except Exception as e:
             return CaptureResult(False, error=f"WSL PyAutoGUI full screen capture failed: {str(e)}")
     
-    def _capture_roi(self, roi: Tuple[int, int, int, int]) -> CaptureResult:
+    def _capture_roi(self, roi: Tuple[int, int, int, int], scale: float = 1.0) -> CaptureResult:
         """Capture ROI using PyAutoGUI"""
         try:
-            import io
-            
             left, top, right, bottom = roi
             width = right - left
             height = bottom - top
             
             # Take screenshot of region
-            screenshot = self._pyautogui.screenshot(region=(left, top, width, height))
+            screenshot = self._screenshot(region=(left, top, width, height))
+            if scale != 1.0:
+                from PIL import Image
+                screenshot = screenshot.resize(self._scaled_size(width, height, scale), Image.BILINEAR)
             
-            # Convert to PNG bytes
-            img_buffer = io.BytesIO()
-            screenshot.save(img_buffer, format='PNG')
-            image_data = img_buffer.getvalue()
+            # Encode in the configured output format
+            image_data = self._encode_image(screenshot)
             
             metadata = {
                 'method': 'pyautogui',
                 'operation': 'roi_capture',
                 'roi': roi,
+                'format': self._output_format,
                 'size': len(image_data),
                 'environment': 'wsl'
             }
+            if scale != 1.0:
+                metadata['scale'] = scale
             
             return CaptureResult(True, image_data, metadata=metadata)
             
         except Exception as e:
             return CaptureResult(False, error=f"WSL PyAutoGUI ROI capture failed: {str(e)}")
     
+    def _capture_scaled_roi(self, roi: Tuple[int, int, int, int], scale: float) -> CaptureResult:
+        """Capture ROI and resize the PIL image before encoding"""
+        return self._capture_roi(roi, scale)
+    
+    def _encode_image(self, image) -> bytes:
+        """Encode a PIL image in the output format into the handler's reusable buffer"""
+        if self._fast_png is not None:
+            return self._fast_png(image)
+        
+        if self._png_quantize:
+            image = palettize_few_colors(image)
+        
+        with self._encode_lock:
+            buffer = self._encode_buffer
+            buffer.seek(0)
+            image.save(buffer, **self._save_options)
+            # Truncating after the save keeps the buffer's capacity between frames
+            buffer.truncate()
+            return buffer.getvalue()
+    
     # Add compatibility methods for direct access from CaptureServiceImpl
     def capture_roi(self, roi: Tuple[int, int, int, int]) -> CaptureResult:
         """Direct capture ROI method for CaptureServiceImpl"""
@@ -424,4 +911,5 @@ class WSLPyAutoGUICapture(ICaptureHandler):
     def cleanup(self) -> None:
         """Clean up resources"""
         self._pyautogui = None
+        self._screenshot = None
         self._initialized = False
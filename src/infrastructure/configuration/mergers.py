@@ -40,6 +40,7 @@ class ConfigurationMerger:
     def __init__(self):
         self._merge_rules: Dict[str, MergeRule] = {}
         self._default_strategy = MergeStrategy.OVERRIDE
+        self._validator = None  # built on first VALIDATE_FIRST merge
         self._initialize_default_rules()
     
     def _initialize_default_rules(self):
@@ -224,8 +225,10 @@ class ConfigurationMerger:
             
             elif strategy == MergeStrategy.VALIDATE_FIRST:
                 # Use first valid value (requires validation)
-                from .validators import ConfigurationValidator
-                validator = ConfigurationValidator()
+                if self._validator is None:
+                    from .validators import ConfigurationValidator
+                    self._validator = ConfigurationValidator()
+                validator = self._validator
                 
                 for i, value in enumerate(values):
                     is_valid, _ = validator.validate_value(key, value)
@@ -9,6 +9,8 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from pathlib import Path
 
+from src.utils import json_codec
+
 
 class IConfigurationSource(Protocol):
     """Interface for configuration sources"""
@@ -53,6 +55,7 @@ class FileConfigurationSource:
         self.priority = priority
         self.writable = writable
         self._name = f"file:{file_path}"
+        self._dir_ready = False  # parent directory created by an earlier save
     
     def load(self) -> Dict[str, Any]:
         """Load configuration from JSON file"""
@@ -60,8 +63,8 @@ class FileConfigurationSource:
             if not self.file_path.exists():
                 return {}
             
-            with open(self.file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(self.file_path, 'rb') as f:
+                return json_codec.loads(f.read())
         except (json.JSONDecodeError, IOError, OSError) as e:
             print(f"Warning: Could not load config from {self.file_path}: {e}")
             return {}
@@ -73,10 +76,12 @@ class FileConfigurationSource:
         
         try:
             # Ensure directory exists
-            self.file_path.parent.mkdir(parents=True, exist_ok=True)
+            if not self._dir_ready:
+                self.file_path.parent.mkdir(parents=True, exist_ok=True)
+                self._dir_ready = True
             
-            with open(self.file_path, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2, sort_keys=True)
+            with open(self.file_path, 'wb') as f:
+                f.write(json_codec.dumps(config, indent=True, sort_keys=True))
             return True
         except (IOError, OSError) as e:
             print(f"Error saving config to {self.file_path}: {e}")
@@ -106,8 +111,8 @@ class FileConfigurationSource:
         try:
             # Test if we can read the file
             if self.file_path.exists():
-                with open(self.file_path, 'r') as f:
-                    json.load(f)
+                with open(self.file_path, 'rb') as f:
+                    json_codec.loads(f.read())
         except Exception as e:
             error = str(e)
             available = False
@@ -148,6 +153,15 @@ class EnvironmentConfigurationSource:
             f"{self.prefix}AUTO_START_MONITORING": "auto_start_monitoring",
             f"{self.prefix}SCREENSHOT_FORMAT": "screenshot_format",
             f"{self.prefix}JPEG_QUALITY": "jpeg_quality",
+            f"{self.prefix}CAPTURE_FORMAT": "capture.format",
+            f"{self.prefix}CAPTURE_JPEG_QUALITY": "capture.jpeg_quality",
+            f"{self.prefix}PNG_COMPRESS_LEVEL": "capture.png_compress_level",
+            f"{self.prefix}PNG_ENCODER": "capture.png_encoder",
+            f"{self.prefix}WSL_TRANSFER_FORMAT": "capture.wsl_transfer_format",
+            f"{self.prefix}ENCODE_WORKERS": "capture.encode_workers",
+            f"{self.prefix}USE_GPU_ENCODE": "capture.use_gpu_encode",
+            f"{self.prefix}PNG_QUANTIZE": "capture.png_quantize",
+            f"{self.prefix}CONFIG_HOT_RELOAD": "config.hot_reload",
             f"{self.prefix}DEFAULT_STRATEGY": "default_strategy",
             
             # Common external env vars
@@ -206,11 +220,13 @@ class EnvironmentConfigurationSource:
         """Parse environment variable value to appropriate type"""
         try:
             # Boolean values
-            if config_key in ['llm_enabled', 'auto_cleanup', 'auto_start_monitoring']:
+            if config_key in ['llm_enabled', 'auto_cleanup', 'auto_start_monitoring',
+                              'capture.use_gpu_encode', 'capture.png_quantize', 'config.hot_reload']:
                 return value.lower() in ('true', '1', 'yes', 'on')
             
             # Integer values
-            elif config_key in ['port', 'max_screenshots', 'jpeg_quality']:
+            elif config_key in ['port', 'max_screenshots', 'jpeg_quality', 'capture.jpeg_quality',
+                                'capture.png_compress_level', 'capture.encode_workers']:
                 return int(value)
             
             # Float values
@@ -235,7 +251,13 @@ class EnvironmentConfigurationSource:
 
 
 class DefaultConfigurationSource:
-    """Configuration source that provides default values"""
+    """Configuration source that provides default values
+    
+    The defaults come from the validation rules, which never change while
+    the process runs, so they are collected once and shared.
+    """
+    
+    _defaults: Optional[Dict[str, Any]] = None
     
     def __init__(self, priority: int = 0):
         self.priority = priority
@@ -243,11 +265,14 @@ class DefaultConfigurationSource:
     
     def load(self) -> Dict[str, Any]:
         """Load default configuration values"""
-        # Import here to avoid circular imports
-        from .validators import ConfigurationValidator
+        if DefaultConfigurationSource._defaults is None:
+            # Import here to avoid circular imports
+            from .validators import ConfigurationValidator
+            
+            DefaultConfigurationSource._defaults = ConfigurationValidator().get_all_defaults()
         
-        validator = ConfigurationValidator()
-        return validator.get_all_defaults()
+        # Callers merge into and mutate what they load
+        return dict(DefaultConfigurationSource._defaults)
     
     def save(self, config: Dict[str, Any]) -> bool:
         """Defaults are not writable"""
@@ -355,6 +380,25 @@ class ConfigurationSourceManager:
         
         return merged
     
+    def get_section(self, section: str) -> Dict[str, Any]:
+        """Get the merged settings of a section, without the section prefix
+        
+        e.g. get_section("capture") turns capture.format into format. The
+        section may also be a nested object, as JsonConfigurationRepository
+        writes dotted keys; dotted keys win over the nested object.
+        """
+        merged = self.get_merged_config()
+        prefix = f"{section}."
+        
+        nested = merged.get(section)
+        settings = dict(nested) if isinstance(nested, dict) else {}
+        settings.update(
+            (key[len(prefix):], value)
+            for key, value in merged.items()
+            if key.startswith(prefix)
+        )
+        return settings
+    
     def save_to_writable_sources(self, config: Dict[str, Any]) -> bool:
         """Save configuration to all writable sources"""
         success = False
@@ -8,6 +8,8 @@ from enum import Enum
 import os
 import re
 
+from src.infrastructure.capture import DEFAULT_PNG_COMPRESS_LEVEL, DEFAULT_JPEG_QUALITY
+
 
 class ValidationError(Exception):
     """Raised when configuration validation fails"""
@@ -177,6 +179,68 @@ class ConfigurationValidator:
                 description="JPEG compression quality",
                 default_value=95
             ),
+            ValidationRule(
+                key="capture.format",
+                config_type=ConfigurationType.ENUM,
+                allowed_values=["png", "jpeg"],
+                description="Encoding produced by the capture handlers (jpeg is much cheaper for previews)",
+                default_value="png"
+            ),
+            ValidationRule(
+                key="capture.jpeg_quality",
+                config_type=ConfigurationType.INTEGER,
+                min_value=1,
+                max_value=100,
+                description="JPEG quality for captures when capture.format is jpeg",
+                default_value=DEFAULT_JPEG_QUALITY
+            ),
+            ValidationRule(
+                key="capture.png_compress_level",
+                config_type=ConfigurationType.INTEGER,
+                min_value=0,
+                max_value=9,
+                description="zlib level for PNG screenshots (1 is fast, 9 is smallest)",
+                default_value=DEFAULT_PNG_COMPRESS_LEVEL
+            ),
+            ValidationRule(
+                key="capture.png_encoder",
+                config_type=ConfigurationType.ENUM,
+                allowed_values=["pil", "fpnge"],
+                description="PNG encoder for captures (fpnge is a much faster SIMD encoder, if installed)",
+                default_value="pil"
+            ),
+            ValidationRule(
+                key="capture.wsl_transfer_format",
+                config_type=ConfigurationType.ENUM,
+                allowed_values=["png", "bmp", "raw"],
+                description="How the WSL PowerShell host sends frames (raw skips the slow .NET PNG encoder)",
+                default_value="png"
+            ),
+            ValidationRule(
+                key="capture.encode_workers",
+                config_type=ConfigurationType.INTEGER,
+                min_value=0,
+                max_value=32,
+                description="Threads that encode captures while the next one is grabbed (unset uses each handler's default)"
+            ),
+            ValidationRule(
+                key="capture.use_gpu_encode",
+                config_type=ConfigurationType.BOOLEAN,
+                description="Encode JPEG captures with nvJPEG on a CUDA GPU when torch/torchvision are installed",
+                default_value=False
+            ),
+            ValidationRule(
+                key="capture.png_quantize",
+                config_type=ConfigurationType.BOOLEAN,
+                description="Store captures with at most 256 colors as palette PNGs (lossless, smaller, slower)",
+                default_value=False
+            ),
+            ValidationRule(
+                key="config.hot_reload",
+                config_type=ConfigurationType.BOOLEAN,
+                description="Reload the configuration file when another process changes it (needs watchfiles)",
+                default_value=False
+            ),
             ValidationRule(
                 key="default_strategy",
                 config_type=ConfigurationType.ENUM,
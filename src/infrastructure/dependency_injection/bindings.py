@@ -86,7 +86,8 @@ class ServiceBindings:
         container.register_instance(IChangeDetectionContext, detection_context)
         
         # Capture service
-        capture_service = CaptureServiceImpl()
+        capture_config = config.get("capture", {})
+        capture_service = CaptureServiceImpl.from_config(capture_config)
         container.register_instance(ICaptureService, capture_service)
         
         # Application services
@@ -137,7 +138,8 @@ class ServiceBindings:
         container.register_instance(IChangeDetectionContext, detection_context)
         
         # Capture service for development
-        capture_service = CaptureServiceImpl()
+        capture_config = config.get("capture", {})
+        capture_service = CaptureServiceImpl.from_config(capture_config)
         container.register_instance(ICaptureService, capture_service)
         
         # Application services
@@ -138,7 +138,9 @@ class DIContainer:
         elif implementation == AnalysisService:
             return implementation(
                 analysis_repository=None,  # TODO: Implement analysis repository
-                event_service=self.get(IEventService)
+                event_service=self.get(IEventService),
+                # Its own detector: the strategy keeps per-baseline state
+                change_detector=HashComparisonDetector()
             )
         elif implementation == FileScreenshotRepository:
             storage_dir = self._configuration.get("storage", {}).get("directory", "screenshots")
@@ -175,8 +177,22 @@ class DIContainer:
         if hasattr(config_repo, '_ensure_config_loaded'):
             await config_repo._ensure_config_loaded()
         
+        self.start_hot_reload(asyncio.get_running_loop())
+        
         logger.info("Async services initialized")
     
+    def start_hot_reload(self, loop: Optional[asyncio.AbstractEventLoop] = None):
+        """Watch the configuration file if the config.hot_reload setting is on
+        
+        Change events are published on loop if given, otherwise on the
+        watcher thread's own loop.
+        """
+        if not self._configuration.get("config", {}).get("hot_reload", False):
+            return
+        config_repo = self.get(IConfigurationRepository)
+        if hasattr(config_repo, 'start_hot_reload'):
+            config_repo.start_hot_reload(self.get(IEventService), loop)
+    
     def dispose(self):
         """Dispose of all services and clean up resources"""
         # Stop any background services
@@ -194,8 +210,44 @@ class ContainerBuilder:
     def __init__(self):
         self.container = DIContainer()
     
+    # Sections of the container configuration that config file and
+    # environment settings (capture.format, config.hot_reload, ...) overlay
+    SETTINGS_SECTIONS = ("capture", "config")
+    
+    @classmethod
+    def _with_settings(cls, config: Dict[str, Any]) -> Dict[str, Any]:
+        """Overlay the settings from the config file and environment on config
+        
+        Dotted settings such as capture.png_compress_level (or
+        SCREENAGENT_PNG_COMPRESS_LEVEL) land in config["capture"]; settings
+        left unset or invalid keep the values in config, then the services'
+        defaults. The settings file is the one the configuration repository
+        uses.
+        """
+        config_file = config.get("config", {}).get(
+            "file", config.get("config_file", "config/screen_agent_config.json")
+        )
+        sources = ConfigurationSourceManager()
+        sources.add_source(FileConfigurationSource(config_file, writable=False))
+        sources.add_source(EnvironmentConfigurationSource())
+        validator = ConfigurationValidator()
+        
+        config = {**config, "config": {**config.get("config", {}), "file": config_file}}
+        for section in cls.SETTINGS_SECTIONS:
+            section_config = dict(config.get(section, {}))
+            for key, value in sources.get_section(section).items():
+                is_valid, error = validator.validate_value(f"{section}.{key}", value)
+                if is_valid:
+                    section_config[key] = value
+                else:
+                    logger.warning(f"Ignoring {section} setting: {error}")
+            config[section] = section_config
+        
+        return config
+    
     def configure_default_services(self, config: Dict[str, Any]) -> 'ContainerBuilder':
         """Configure default service bindings"""
+        config = self._with_settings(config)
         self.container.configure(config)
         
         # Configuration infrastructure
@@ -230,7 +282,8 @@ class ContainerBuilder:
         self.container.register_singleton(IEventService, EventService)
         
         # Capture service
-        capture_service_instance = CaptureServiceImpl()
+        capture_config = config.get("capture", {})
+        capture_service_instance = CaptureServiceImpl.from_config(capture_config)
         self.container.register_instance(ICaptureService, capture_service_instance)
         
         # Storage infrastructure
@@ -343,6 +396,7 @@ def setup_container(config: Dict[str, Any]) -> DIContainer:
     
     builder = ContainerBuilder()
     _container = builder.configure_default_services(config).build()
+    _container.start_hot_reload()
     
     logger.info("Global DI Container set up")
     return _container
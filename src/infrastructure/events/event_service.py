@@ -3,73 +3,156 @@ Event Service Implementation
 Provides event publishing and subscription capabilities
 """
 import asyncio
+import itertools
+import os
+import queue
+import threading
 import uuid
-from typing import Dict, List, Callable, Any, Type, Optional
+from collections import Counter, deque
+from typing import Dict, List, Callable, Any, Type, Optional, Tuple
 import logging
 
 from src.domain.interfaces.event_service import IEventService
 from src.domain.events.screenshot_captured import BaseDomainEvent
 
 
+# SCREENAGENT_EVENT_HISTORY=0 turns off event history for deployments that
+# never read it
+RECORD_HISTORY_DEFAULT = os.getenv('SCREENAGENT_EVENT_HISTORY', '1').lower() not in ('0', 'false', 'no', 'off')
+
+
 class EventService(IEventService):
-    """Concrete implementation of event service"""
+    """Concrete implementation of event service
+    
+    Only the most recent max_history events are kept; older ones are
+    dropped as new events are published. With record_history=False, or a
+    max_history of 0 or less, no history is kept and events are released
+    as soon as they are dispatched.
+    
+    Subscriptions per event type are immutable tuples that subscribe and
+    unsubscribe replace under _lock, so publish reads a consistent snapshot
+    with a single dict lookup and never takes the lock. Whether a handler
+    is a coroutine function is decided once, when it subscribes.
+    """
     
-    def __init__(self):
+    def __init__(self, max_history: int = 1000, record_history: bool = RECORD_HISTORY_DEFAULT):
         self._subscribers: Dict[str, Callable] = {}  # subscription_id -> handler
-        self._type_subscribers: Dict[Type[BaseDomainEvent], List[str]] = {}  # event_type -> subscription_ids
-        self._event_history: List[BaseDomainEvent] = []
+        # event_type -> ((subscription_id, handler, is_coroutine), ...)
+        self._type_subscribers: Dict[Type[BaseDomainEvent], Tuple[Tuple[str, Callable, bool], ...]] = {}
+        self._lock = threading.Lock()  # serializes subscription and history changes
+        self._max_history = max(max_history, 0)
+        self._record_history = record_history and self._max_history > 0
+        self._event_history: deque = deque(maxlen=self._max_history)
+        
+        # Running statistics, kept in step with the history so get_stats
+        # does not scan it
+        self._event_counts: Counter = Counter()  # event_type name -> events in history
+        self._total_published = 0
         self._logger = logging.getLogger(__name__)
+        
+        # publish_nowait queue, drained in batches by one long-lived thread
+        # with its own loop. Callers' loops may be per-request (Flask's
+        # run_async) and never run again, so a task on them could be lost
+        self._pending: queue.SimpleQueue = queue.SimpleQueue()
+        self._drainer: Optional[threading.Thread] = None
     
     async def publish(self, event: BaseDomainEvent) -> None:
         """Publish an event to all subscribers"""
         try:
-            event_type = type(event)
-            subscription_ids = self._type_subscribers.get(event_type, [])
-            
-            # Add to history
-            self._event_history.append(event)
-            
-            self._logger.debug(f"Publishing event {event_type.__name__} to {len(subscription_ids)} subscribers")
-            
-            # Call all subscribers asynchronously
-            tasks = []
-            for subscription_id in subscription_ids:
-                if subscription_id in self._subscribers:
-                    handler = self._subscribers[subscription_id]
-                    if asyncio.iscoroutinefunction(handler):
-                        tasks.append(handler(event))
-                    else:
-                        # Run sync functions in thread pool
-                        tasks.append(asyncio.to_thread(handler, event))
-            
-            if tasks:
-                await asyncio.gather(*tasks, return_exceptions=True)
-                
+            self._record_events((event,))
+            await self._dispatch(event)
         except Exception as e:
             self._logger.error(f"Error publishing event {type(event).__name__}: {e}")
     
     async def publish_batch(self, events: List[BaseDomainEvent]) -> None:
         """Publish multiple events as a batch"""
         try:
-            # Publish each event in sequence
+            # Record the whole batch under one lock, then publish each event in sequence
+            self._record_events(events)
             for event in events:
-                await self.publish(event)
+                await self._dispatch(event)
         except Exception as e:
             self._logger.error(f"Error publishing event batch: {e}")
     
+    def publish_nowait(self, event: BaseDomainEvent) -> None:
+        """Queue an event and return without waiting for its subscribers"""
+        self._pending.put(event)
+        if self._drainer is None:
+            with self._lock:
+                if self._drainer is None:
+                    self._drainer = threading.Thread(
+                        target=self._drain_pending, name='event-drainer', daemon=True
+                    )
+                    self._drainer.start()
+    
+    def _drain_pending(self) -> None:
+        """Publish queued events, taking everything queued since the last pass"""
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        while True:
+            batch = [self._pending.get()]
+            try:
+                while True:
+                    batch.append(self._pending.get_nowait())
+            except queue.Empty:
+                pass
+            try:
+                loop.run_until_complete(self.publish_batch(batch))
+            except Exception as e:
+                self._logger.error(f"Error publishing queued events: {e}")
+    
+    def _record_events(self, events) -> None:
+        """Add events to the history and update the running counts"""
+        with self._lock:
+            if not self._record_history:
+                self._total_published += len(events)
+                return
+            for event in events:
+                if len(self._event_history) == self._max_history:
+                    evicted = self._event_history[0]
+                    self._event_counts[evicted.event_type] -= 1
+                    if not self._event_counts[evicted.event_type]:
+                        del self._event_counts[evicted.event_type]
+                self._event_history.append(event)
+                self._event_counts[event.event_type] += 1
+                self._total_published += 1
+    
+    async def _dispatch(self, event: BaseDomainEvent) -> None:
+        """Call the subscribers of an already recorded event"""
+        subscriptions = self._type_subscribers.get(type(event), ())
+        if not subscriptions:
+            # Most event types have no subscribers; skip building a gather
+            return
+        
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(f"Publishing event {event.event_type} to {len(subscriptions)} subscribers")
+        
+        # Call all subscribers asynchronously
+        tasks = []
+        for _, handler, is_coroutine in subscriptions:
+            if is_coroutine:
+                tasks.append(handler(event))
+            else:
+                # Run sync functions in thread pool
+                tasks.append(asyncio.to_thread(handler, event))
+        
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+    
     def subscribe(self, event_type: Type[BaseDomainEvent], handler: Callable[[BaseDomainEvent], None]) -> str:
         """Subscribe to an event type"""
         try:
             subscription_id = str(uuid.uuid4())
+            entry = (subscription_id, handler, asyncio.iscoroutinefunction(handler))
             
-            # Store handler
-            self._subscribers[subscription_id] = handler
-            
-            # Add to type mapping
-            if event_type not in self._type_subscribers:
-                self._type_subscribers[event_type] = []
-            
-            self._type_subscribers[event_type].append(subscription_id)
+            with self._lock:
+                # Store handler
+                self._subscribers[subscription_id] = handler
+                
+                # Publish a new tuple rather than mutating the one publish may be reading
+                self._type_subscribers[event_type] = (
+                    self._type_subscribers.get(event_type, ()) + (entry,)
+                )
             
             self._logger.debug(f"Subscribed handler to {event_type.__name__} with ID {subscription_id}")
             return subscription_id
@@ -81,17 +164,19 @@ class EventService(IEventService):
     def unsubscribe(self, subscription_id: str) -> bool:
         """Unsubscribe from domain events"""
         try:
-            if subscription_id not in self._subscribers:
-                return False
-            
-            # Remove from subscribers
-            del self._subscribers[subscription_id]
-            
-            # Remove from type mappings
-            for event_type, sub_ids in self._type_subscribers.items():
-                if subscription_id in sub_ids:
-                    sub_ids.remove(subscription_id)
-                    break
+            with self._lock:
+                if subscription_id not in self._subscribers:
+                    return False
+                
+                # Remove from subscribers
+                del self._subscribers[subscription_id]
+                
+                # Remove from type mappings
+                for event_type, subscriptions in self._type_subscribers.items():
+                    remaining = tuple(s for s in subscriptions if s[0] != subscription_id)
+                    if len(remaining) != len(subscriptions):
+                        self._type_subscribers[event_type] = remaining
+                        break
             
             self._logger.debug(f"Unsubscribed {subscription_id}")
             return True
@@ -113,11 +198,16 @@ class EventService(IEventService):
             if event_type:
                 events = [e for e in events if isinstance(e, event_type)]
             
-            # Apply limit if specified
+            # Apply limit if specified. Walk the deque from the newest end
+            # rather than copying all of it to slice off the tail.
             if limit:
+                if isinstance(events, deque):
+                    newest = list(itertools.islice(reversed(events), limit))
+                    newest.reverse()
+                    return newest
                 events = events[-limit:]
             
-            return events
+            return list(events)
             
         except Exception as e:
             self._logger.error(f"Error getting event history: {e}")
@@ -126,7 +216,9 @@ class EventService(IEventService):
     async def clear_event_history(self) -> None:
         """Clear event history"""
         try:
-            self._event_history.clear()
+            with self._lock:
+                self._event_history.clear()
+                self._event_counts.clear()
             self._logger.debug("Cleared event history")
         except Exception as e:
             self._logger.error(f"Error clearing event history: {e}")
@@ -134,26 +226,40 @@ class EventService(IEventService):
     def clear_subscribers(self, event_type: Optional[Type[BaseDomainEvent]] = None) -> None:
         """Clear subscribers for an event type or all events"""
         try:
-            if event_type:
-                # Clear subscribers for specific event type
-                if event_type in self._type_subscribers:
-                    subscription_ids = self._type_subscribers[event_type]
-                    for sub_id in subscription_ids:
+            with self._lock:
+                if event_type:
+                    # Clear subscribers for specific event type
+                    for sub_id, _, _ in self._type_subscribers.pop(event_type, ()):
                         self._subscribers.pop(sub_id, None)
-                    del self._type_subscribers[event_type]
-                self._logger.debug(f"Cleared subscribers for {event_type.__name__}")
-            else:
-                # Clear all subscribers
-                self._subscribers.clear()
-                self._type_subscribers.clear()
-                self._logger.debug("Cleared all event subscribers")
+                    self._logger.debug(f"Cleared subscribers for {event_type.__name__}")
+                else:
+                    # Clear all subscribers
+                    self._subscribers.clear()
+                    self._type_subscribers.clear()
+                    self._logger.debug("Cleared all event subscribers")
                 
         except Exception as e:
             self._logger.error(f"Error clearing subscribers: {e}")
     
     def get_subscriber_count(self, event_type: Type[BaseDomainEvent]) -> int:
         """Get the number of subscribers for an event type"""
-        return len(self._type_subscribers.get(event_type, []))
+        return len(self._type_subscribers.get(event_type, ()))
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get event and subscription statistics"""
+        with self._lock:
+            return {
+                "total_published": self._total_published,
+                "history_size": len(self._event_history),
+                "max_history": self._max_history,
+                "record_history": self._record_history,
+                "event_counts": dict(self._event_counts),
+                "total_subscribers": len(self._subscribers),
+                "subscribers_by_type": {
+                    event_type.__name__: len(subscriptions)
+                    for event_type, subscriptions in self._type_subscribers.items()
+                }
+            }
 
 
 # Optional import for base event
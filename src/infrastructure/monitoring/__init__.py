@@ -1,16 +1,36 @@
 """
 Infrastructure monitoring module - Change detection strategies and context
+
+Exports are loaded on first access, so importing one detector module does
+not pull in the others (and NumPy/PIL with them).
 """
+import importlib
+
+_EXPORTS = {
+    'ThresholdDetector': '.threshold_detector',
+    'PixelDiffDetector': '.pixel_diff_detector',
+    'HashComparisonDetector': '.hash_comparison_detector',
+    'ChangeDetectionContext': '.change_detection_context',
+    'ChangeDetectionStrategyFactory': '.strategy_factory'
+}
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_EXPORTS))
 
-from .threshold_detector import ThresholdDetector
-from .pixel_diff_detector import PixelDiffDetector
-from .hash_comparison_detector import HashComparisonDetector
-from .change_detection_context import ChangeDetectionContext
-from .strategy_factory import ChangeDetectionStrategyFactory
 
 __all__ = [
     'ThresholdDetector',
-    'PixelDiffDetector', 
+    'PixelDiffDetector',
     'HashComparisonDetector',
     'ChangeDetectionContext',
     'ChangeDetectionStrategyFactory'
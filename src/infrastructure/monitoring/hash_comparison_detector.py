@@ -3,23 +3,97 @@ Hash comparison-based change detection strategy
 """
 from typing import Dict, Any, Optional
 import hashlib
+import platform
+import sys
 from PIL import Image
 import io
 from ...domain.interfaces.change_detection_strategy import IChangeDetectionStrategy
 
+try:
+    import blake3  # SIMD, multi-lane hashing
+except ImportError:
+    blake3 = None
+
+try:
+    import xxhash  # non-cryptographic, enough for frame equality
+except ImportError:
+    xxhash = None
+
+
+# Each entry returns the raw digest. xxh3 is preferred when installed: the
+# digest only tells consecutive frames apart, nothing adversarial. Next comes
+# blake3, then sha256 if the CPU has SHA extensions (OpenSSL then beats both
+# md5 and blake2b on multi-megabyte captures), else hashlib's blake2b.
+_HASHERS = {
+    'blake2b': lambda data: hashlib.blake2b(data, digest_size=16).digest(),
+    'sha256': lambda data: hashlib.sha256(data).digest(),
+    'md5': lambda data: hashlib.md5(data).digest()
+}
+if blake3 is not None:
+    _HASHERS['blake3'] = lambda data: blake3.blake3(data).digest()
+if xxhash is not None:
+    _HASHERS['xxh3'] = xxhash.xxh3_64_digest
+
+
+def _cpu_has_sha_extensions() -> bool:
+    """Whether the CPU accelerates SHA-256 (x86 SHA-NI, ARMv8 SHA2)
+    
+    Read from /proc/cpuinfo on Linux. Elsewhere only Apple silicon is known
+    for certain; other platforms are assumed to have them, as CPUs from the
+    last several years do.
+    """
+    if sys.platform.startswith('linux'):
+        try:
+            with open('/proc/cpuinfo', 'r') as cpuinfo:
+                for line in cpuinfo:
+                    if line.startswith(('flags', 'Features')):
+                        flags = line.split(':', 1)[1].split()
+                        return 'sha_ni' in flags or 'sha2' in flags
+        except OSError:
+            pass
+        return True
+    if sys.platform == 'darwin':
+        return platform.machine().lower() == 'arm64'
+    return True
+
+
+def _select_hash_algorithm() -> str:
+    """Fastest available digest for this interpreter and CPU"""
+    if xxhash is not None:
+        return 'xxh3'
+    if blake3 is not None:
+        return 'blake3'
+    return 'sha256' if _cpu_has_sha_extensions() else 'blake2b'
+
+
+DEFAULT_HASH_ALGORITHM = _select_hash_algorithm()
+
 
 class HashComparisonDetector(IChangeDetectionStrategy):
     """
     Change detection based on image hash comparison
     Fast and memory efficient for exact change detection
+    
+    The baseline bytes are kept so same-size frames are compared directly;
+    a byte comparison stops at the first difference and settles identical
+    frames without hashing them.
     """
     
+    PROBE_BYTES = 64  # compared at each end before a full comparison
+    
     def __init__(self):
-        self._baseline_hash: Optional[str] = None
+        self._baseline_hash: Optional[bytes] = None
+        self._baseline_image: Optional[bytes] = None
         self._baseline_size: int = 0
         self._initialized: bool = False
         self._detection_count: int = 0
-        self._hash_algorithm: str = 'md5'
+        self._hash_algorithm: str = DEFAULT_HASH_ALGORITHM
+        
+        # Digest of the last image hashed. Holding the object itself (not
+        # its id) keeps the identity check safe; update_baseline() with the
+        # frame just checked then costs nothing.
+        self._last_image: Optional[bytes] = None
+        self._last_hash: Optional[bytes] = None
     
     def initialize(self, baseline_image: bytes) -> bool:
         """Initialize with baseline image"""
@@ -27,8 +101,9 @@ class HashComparisonDetector(IChangeDetectionStrategy):
             if not baseline_image:
                 return False
             
-            self._baseline_hash = self._calculate_hash(baseline_image)
+            self._baseline_hash = self._hash_cached(baseline_image)
             self._baseline_size = len(baseline_image)
+            self._baseline_image = baseline_image if isinstance(baseline_image, bytes) else None
             self._initialized = True
             self._detection_count = 0
             
@@ -60,18 +135,34 @@ class HashComparisonDetector(IChangeDetectionStrategy):
             }
         
         try:
-            current_hash = self._calculate_hash(current_image)
             current_size = len(current_image)
             
-            # Hash comparison is binary - either identical or different
-            has_changes = current_hash != self._baseline_hash
+            # Hash comparison is binary - either identical or different.
+            # Different sizes cannot be identical, so skip hashing them.
+            baseline = self._baseline_image
+            if current_size != self._baseline_size:
+                current_hash = None
+                has_changes = True
+            elif baseline is not None:
+                # Encoded frames that differ usually differ near the end (the
+                # last chunk CRC), so probe both ends before a full memcmp
+                probe = self.PROBE_BYTES
+                current_hash = None
+                has_changes = (
+                    current_image[:probe] != baseline[:probe]
+                    or current_image[-probe:] != baseline[-probe:]
+                    or current_image != baseline
+                )
+            else:
+                current_hash = self._hash_cached(current_image)
+                has_changes = current_hash != self._baseline_hash
             change_score = 100.0 if has_changes else 0.0
             
             self._detection_count += 1
             
             metadata = {
-                'baseline_hash': self._baseline_hash,
-                'current_hash': current_hash,
+                'baseline_hash': self._baseline_hash.hex(),
+                'current_hash': current_hash.hex() if current_hash is not None else None,
                 'baseline_size': self._baseline_size,
                 'current_size': current_size,
                 'hash_algorithm': self._hash_algorithm,
@@ -99,8 +190,9 @@ class HashComparisonDetector(IChangeDetectionStrategy):
             if not new_baseline:
                 return False
             
-            self._baseline_hash = self._calculate_hash(new_baseline)
+            self._baseline_hash = self._hash_cached(new_baseline)
             self._baseline_size = len(new_baseline)
+            self._baseline_image = new_baseline if isinstance(new_baseline, bytes) else None
             return True
         except Exception:
             return False
@@ -115,7 +207,7 @@ class HashComparisonDetector(IChangeDetectionStrategy):
             'name': self.get_strategy_name(),
             'description': 'Hash-based exact change detection',
             'initialized': self._initialized,
-            'baseline_hash': self._baseline_hash,
+            'baseline_hash': self._baseline_hash.hex() if self._baseline_hash else None,
             'baseline_size': self._baseline_size,
             'hash_algorithm': self._hash_algorithm,
             'detection_count': self._detection_count,
@@ -127,14 +219,17 @@ class HashComparisonDetector(IChangeDetectionStrategy):
         """Reset strategy state"""
         try:
             self._baseline_hash = None
+            self._baseline_image = None
             self._baseline_size = 0
             self._initialized = False
             self._detection_count = 0
+            self._last_image = None
+            self._last_hash = None
             return True
         except Exception:
             return False
     
-    def _calculate_hash(self, image_data: bytes) -> str:
+    def _calculate_hash(self, image_data: bytes) -> bytes:
         """
         Calculate hash of image data
         
@@ -142,27 +237,36 @@ class HashComparisonDetector(IChangeDetectionStrategy):
             image_data: Image bytes to hash
             
         Returns:
-            str: Hexadecimal hash string
+            bytes: Raw digest
         """
-        if self._hash_algorithm == 'md5':
-            return hashlib.md5(image_data).hexdigest()
-        elif self._hash_algorithm == 'sha256':
-            return hashlib.sha256(image_data).hexdigest()
-        else:
-            # Default to MD5
-            return hashlib.md5(image_data).hexdigest()
+        return _HASHERS[self._hash_algorithm](image_data)
+    
+    def _hash_cached(self, image_data: bytes) -> bytes:
+        """Hash image data, reusing the digest if it is the last object hashed"""
+        if image_data is self._last_image:
+            return self._last_hash
+        digest = self._calculate_hash(image_data)
+        if isinstance(image_data, bytes):  # only immutable input can be reused
+            self._last_image = image_data
+            self._last_hash = digest
+        return digest
     
     def set_hash_algorithm(self, algorithm: str) -> bool:
         """
         Set the hash algorithm to use
         
+        Changing the algorithm rehashes nothing, so set it before
+        initialize() or call update_baseline() afterwards.
+        
         Args:
-            algorithm: 'md5' or 'sha256'
+            algorithm: 'xxh3' or 'blake3' (if installed), 'blake2b', 'sha256' or 'md5'
             
         Returns:
             bool: True if algorithm is supported
         """
-        if algorithm in ['md5', 'sha256']:
+        if algorithm in _HASHERS:
             self._hash_algorithm = algorithm
+            self._last_image = None
+            self._last_hash = None
             return True
         return False
@@ -1,12 +1,78 @@
 """
 Pixel difference-based change detection strategy
 """
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from PIL import Image
 import io
+import logging
 import numpy as np
 from ...domain.interfaces.change_detection_strategy import IChangeDetectionStrategy
 
+try:
+    import numba  # fused, multi-threaded diff kernel
+except ImportError:
+    numba = None
+
+try:
+    # Saturating SIMD abs-diff of uint8 arrays in a single pass
+    from cv2 import absdiff as _cv2_absdiff
+except ImportError:
+    _cv2_absdiff = None
+
+logger = logging.getLogger(__name__)
+
+
+# Pure-Python loops are only usable as Numba source; without Numba the
+# vectorized NumPy path is used instead
+prange = numba.prange if numba is not None else range
+
+
+def _diff_stats(current: np.ndarray, baseline: np.ndarray) -> Tuple[int, int]:
+    """
+    Changed-pixel count and summed absolute difference of two HxWxC uint8 images
+    
+    One pass over both images with no temporaries: the abs diff, the per-pixel
+    any-channel test and both reductions are fused, and rows run in parallel.
+    Compiled by Numba below; the plain function is only its source.
+    """
+    height, width, channels = current.shape
+    changed = 0
+    total = 0
+    for y in prange(height):
+        for x in range(width):
+            hit = False
+            for k in range(channels):
+                a = current[y, x, k]
+                b = baseline[y, x, k]
+                d = a - b if a > b else b - a
+                total += d
+                if d > 30:
+                    hit = True
+            if hit:
+                changed += 1
+    return changed, total
+
+
+# Explicit signatures compile the kernel (or load it from Numba's on-disk
+# cache) when this module is imported, so the first monitored frame does not
+# pay for JIT compilation. Contiguous frames get their own specialization;
+# strided views (reversed MSS channels, grayscale with an added axis) use the
+# any-layout one. nogil: the kernel releases the GIL, so detection on a
+# worker thread does not block other Python threads.
+_DIFF_STATS_SIGNATURES = [
+    'UniTuple(int64, 2)(uint8[:, :, ::1], uint8[:, :, ::1])',
+    'UniTuple(int64, 2)(uint8[:, :, :], uint8[:, :, :])'
+]
+
+_fused_diff_stats = None
+if numba is not None:
+    try:
+        _fused_diff_stats = numba.njit(_DIFF_STATS_SIGNATURES, cache=True, nogil=True,
+                                       parallel=True, fastmath=True,
+                                       boundscheck=False)(_diff_stats)
+    except Exception as e:
+        logger.warning(f"Numba diff kernel failed to compile, using NumPy: {e}")
+
 
 class PixelDiffDetector(IChangeDetectionStrategy):
     """
@@ -20,6 +86,13 @@ class PixelDiffDetector(IChangeDetectionStrategy):
         self._initialized: bool = False
         self._detection_count: int = 0
         self._last_change_score: float = 0.0
+        self._fast_path_count: int = 0
+        
+        # Last frame decoded by detect_changes(). update_baseline() is usually
+        # called with that same bytes object, and then reuses the decode.
+        self._last_image: Optional[bytes] = None
+        self._last_pil: Optional[Image.Image] = None
+        self._last_array: Optional[np.ndarray] = None
     
     def initialize(self, baseline_image: bytes) -> bool:
         """Initialize with baseline image"""
@@ -28,11 +101,11 @@ class PixelDiffDetector(IChangeDetectionStrategy):
                 return False
             
             # Convert bytes to PIL Image and then to numpy array
-            baseline_pil = Image.open(io.BytesIO(baseline_image))
-            self._baseline_array = np.array(baseline_pil)
+            self._baseline_array = self._decode_baseline(baseline_image)
             self._baseline_image = baseline_image
             self._initialized = True
             self._detection_count = 0
+            self._fast_path_count = 0
             self._last_change_score = 0.0
             
             return True
@@ -63,50 +136,30 @@ class PixelDiffDetector(IChangeDetectionStrategy):
             }
         
         try:
-            # Convert current image to numpy array
+            # Identical encoded bytes mean identical pixels; most polls of an
+            # idle screen end here without a decode. bytes equality checks
+            # the length first and then runs memcmp.
+            baseline_image = self._baseline_image
+            if current_image is baseline_image or current_image == baseline_image:
+                self._detection_count += 1
+                self._fast_path_count += 1
+                self._last_change_score = 0.0
+                return {
+                    'has_changes': False,
+                    'change_score': 0.0,
+                    'metadata': {
+                        'threshold_used': threshold,
+                        'detection_count': self._detection_count,
+                        'fast_path': 'identical'
+                    }
+                }
+            
+            # Convert current image to numpy array. Image.open is lazy, so a
+            # corrupt frame only fails here; remember the decode once it is whole
             current_pil = Image.open(io.BytesIO(current_image))
             current_array = np.array(current_pil)
-            
-            # Ensure images have same dimensions
-            if current_array.shape != self._baseline_array.shape:
-                # Resize current image to match baseline
-                baseline_pil = Image.fromarray(self._baseline_array)
-                current_pil = current_pil.resize(baseline_pil.size)
-                current_array = np.array(current_pil)
-            
-            # Calculate pixel differences
-            diff_array = np.abs(current_array.astype(float) - self._baseline_array.astype(float))
-            
-            # Calculate percentage of changed pixels
-            if len(diff_array.shape) == 3:  # Color image
-                # Consider a pixel changed if any channel differs significantly
-                pixel_changes = np.any(diff_array > 30, axis=2)  # 30 out of 255
-            else:  # Grayscale
-                pixel_changes = diff_array > 30
-            
-            total_pixels = pixel_changes.size
-            changed_pixels = np.sum(pixel_changes)
-            change_percentage = (changed_pixels / total_pixels) * 100.0
-            
-            has_changes = change_percentage >= threshold
-            self._detection_count += 1
-            self._last_change_score = change_percentage
-            
-            metadata = {
-                'total_pixels': int(total_pixels),
-                'changed_pixels': int(changed_pixels),
-                'change_percentage': float(change_percentage),
-                'threshold_used': threshold,
-                'detection_count': self._detection_count,
-                'image_shape': current_array.shape,
-                'mean_pixel_diff': float(np.mean(diff_array))
-            }
-            
-            return {
-                'has_changes': has_changes,
-                'change_score': min(change_percentage, 100.0),
-                'metadata': metadata
-            }
+            self._last_image, self._last_pil, self._last_array = current_image, current_pil, current_array
+            return self._diff_against_baseline(current_array, threshold)
             
         except Exception as e:
             return {
@@ -116,14 +169,108 @@ class PixelDiffDetector(IChangeDetectionStrategy):
                 'metadata': {}
             }
     
+    def _diff_against_baseline(self, current_array: np.ndarray, threshold: float) -> Dict[str, Any]:
+        """Full-resolution pixel diff of a frame against the baseline array"""
+        # Ensure images have same dimensions
+        if current_array.shape != self._baseline_array.shape:
+            # Resize current image to match the cached baseline array
+            baseline_height, baseline_width = self._baseline_array.shape[:2]
+            current_pil = Image.fromarray(np.ascontiguousarray(current_array))
+            current_array = np.array(current_pil.resize((baseline_width, baseline_height)))
+        
+        image_shape = current_array.shape
+        baseline_array = self._baseline_array
+        if (_fused_diff_stats is not None and current_array.dtype == np.uint8 == baseline_array.dtype
+                and current_array.flags.writeable):
+            # Fused kernel; the signatures only cover writable arrays (the
+            # baseline always is). 2-D grayscale arrays get a channel axis
+            if current_array.ndim == 2:
+                current_array = current_array[..., np.newaxis]
+                baseline_array = baseline_array[..., np.newaxis]
+            changed_pixels, diff_sum = _fused_diff_stats(current_array, baseline_array)
+            total_pixels = current_array.shape[0] * current_array.shape[1]
+            sample_count = current_array.size
+        else:
+            # Calculate pixel differences
+            diff_array = self._abs_diff(current_array, baseline_array)
+            
+            # Calculate percentage of changed pixels
+            pixel_changes = self._changed_mask(diff_array)
+            
+            total_pixels = pixel_changes.size
+            changed_pixels = np.count_nonzero(pixel_changes)
+            diff_sum = diff_array.sum(dtype=np.uint64)
+            sample_count = diff_array.size
+        change_percentage = float(changed_pixels) / total_pixels * 100.0
+        
+        has_changes = change_percentage >= threshold
+        self._detection_count += 1
+        self._last_change_score = change_percentage
+        
+        metadata = {
+            'total_pixels': int(total_pixels),
+            'changed_pixels': int(changed_pixels),
+            'change_percentage': float(change_percentage),
+            'threshold_used': threshold,
+            'detection_count': self._detection_count,
+            'image_shape': image_shape,
+            'mean_pixel_diff': float(diff_sum) / sample_count
+        }
+        
+        return {
+            'has_changes': has_changes,
+            'change_score': min(change_percentage, 100.0),
+            'metadata': metadata
+        }
+    
+    @staticmethod
+    def _changed_mask(diff_array: np.ndarray) -> np.ndarray:
+        """Pixels where any channel differs significantly (30 out of 255)"""
+        if diff_array.ndim == 3:  # Color image
+            # Per-channel ORs on contiguous planes beat np.any(axis=2)
+            # several times over
+            pixel_changes = diff_array[..., 0] > 30
+            for channel in range(1, diff_array.shape[2]):
+                pixel_changes |= diff_array[..., channel] > 30
+            return pixel_changes
+        return diff_array > 30  # Grayscale
+    
+    @staticmethod
+    def _abs_diff(current: np.ndarray, baseline: np.ndarray) -> np.ndarray:
+        """
+        Absolute per-sample difference of two images
+        
+        8-bit images stay 8-bit (max - min cannot wrap), so the working
+        set is the size of the image rather than 8x it as float64. OpenCV's
+        absdiff does the same in one pass when it is installed; it needs
+        contiguous arrays, so strided views keep the NumPy path.
+        """
+        if current.dtype == np.uint8 and baseline.dtype == np.uint8:
+            if (_cv2_absdiff is not None and current.flags.c_contiguous
+                    and baseline.flags.c_contiguous):
+                return _cv2_absdiff(current, baseline)
+            diff = np.maximum(current, baseline)
+            np.subtract(diff, np.minimum(current, baseline), out=diff)
+            return diff
+        # 16-bit and 1-bit modes
+        return np.abs(current.astype(np.int32) - baseline.astype(np.int32))
+    
+    def _decode_baseline(self, image_data: bytes) -> np.ndarray:
+        """Decode a baseline frame, reusing detect_changes()'s decode of the same bytes"""
+        if image_data is self._last_image and isinstance(image_data, bytes):
+            if self._last_array is None:
+                self._last_array = np.array(self._last_pil)
+            return self._last_array
+        
+        return np.array(Image.open(io.BytesIO(image_data)))
+    
     def update_baseline(self, new_baseline: bytes) -> bool:
         """Update baseline image"""
         try:
             if not new_baseline:
                 return False
             
-            baseline_pil = Image.open(io.BytesIO(new_baseline))
-            self._baseline_array = np.array(baseline_pil)
+            self._baseline_array = self._decode_baseline(new_baseline)
             self._baseline_image = new_baseline
             return True
         except Exception:
@@ -144,6 +291,7 @@ class PixelDiffDetector(IChangeDetectionStrategy):
             'baseline_shape': baseline_shape,
             'detection_count': self._detection_count,
             'last_change_score': self._last_change_score,
+            'fast_path_count': self._fast_path_count,
             'fast': False,
             'accuracy': 'high'
         }
@@ -152,9 +300,13 @@ class PixelDiffDetector(IChangeDetectionStrategy):
         """Reset strategy state"""
         try:
             self._baseline_image = None
+            self._last_image = None
+            self._last_pil = None
+            self._last_array = None
             self._baseline_array = None
             self._initialized = False
             self._detection_count = 0
+            self._fast_path_count = 0
             self._last_change_score = 0.0
             return True
         except Exception:
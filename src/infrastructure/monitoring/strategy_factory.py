@@ -5,7 +5,7 @@ from typing import Dict, Type, Optional, Any
 from ...domain.interfaces.change_detection_strategy import IChangeDetectionStrategy
 from .threshold_detector import ThresholdDetector
 from .pixel_diff_detector import PixelDiffDetector
-from .hash_comparison_detector import HashComparisonDetector
+from .hash_comparison_detector import HashComparisonDetector, DEFAULT_HASH_ALGORITHM
 from .change_detection_context import ChangeDetectionContext
 
 
@@ -124,6 +124,19 @@ class ChangeDetectionStrategyFactory:
             }
         }
     
+    @classmethod
+    def get_hash_backend_name(self) -> str:
+        """
+        Get the digest the hash comparison strategy uses by default
+        
+        Chosen at import from the installed libraries and CPU features
+        ('xxh3', 'blake3', 'sha256' or 'blake2b').
+        
+        Returns:
+            str: Hash algorithm name
+        """
+        return DEFAULT_HASH_ALGORITHM
+    
     @classmethod
     def register_strategy(
         self, 
@@ -4,6 +4,7 @@ Stores screenshots as files with JSON metadata
 """
 import json
 import asyncio
+import heapq
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -13,6 +14,7 @@ from src.domain.repositories.screenshot_repository import IScreenshotRepository
 from src.domain.entities.screenshot import Screenshot
 from src.domain.value_objects.timestamp import Timestamp
 from src.domain.value_objects.file_path import FilePath
+from src.utils.image_format import IMAGE_FORMATS
 
 
 logger = logging.getLogger(__name__)
@@ -106,7 +108,7 @@ class FileScreenshotRepository(IScreenshotRepository):
         
         await self._save_metadata(screenshot)
         
-        logger.info(f"Created screenshot record: {screenshot.id}")
+        logger.debug(f"Created screenshot record: {screenshot.id}")
         return screenshot
     
     async def get_by_id(self, screenshot_id: str) -> Optional[Screenshot]:
@@ -123,7 +125,7 @@ class FileScreenshotRepository(IScreenshotRepository):
         
         await self._save_metadata(screenshot)
         
-        logger.info(f"Updated screenshot record: {screenshot.id}")
+        logger.debug(f"Updated screenshot record: {screenshot.id}")
         return screenshot
     
     async def delete(self, screenshot_id: str) -> bool:
@@ -164,10 +166,11 @@ class FileScreenshotRepository(IScreenshotRepository):
                     logger.warning(f"Unknown file_path type: {type(file_path)}")
                 
                 # Also try deleting from the images directory
-                image_file = self.images_directory / f"{screenshot_id}.png"
-                if image_file.exists():
-                    image_file.unlink()
-                    logger.info(f"Deleted image file: {image_file}")
+                for extension, _ in IMAGE_FORMATS.values():
+                    image_file = self.images_directory / f"{screenshot_id}{extension}"
+                    if image_file.exists():
+                        image_file.unlink()
+                        logger.info(f"Deleted image file: {image_file}")
                 
             except Exception as e:
                 logger.error(f"Error deleting image file: {e}")
@@ -190,13 +193,14 @@ class FileScreenshotRepository(IScreenshotRepository):
         """List all screenshots with pagination"""
         await self._ensure_cache_loaded()
         
-        screenshots = list(self._cache.values())
-        # Sort by timestamp (newest first)
-        screenshots.sort(key=lambda s: s.timestamp.value, reverse=True)
+        # Newest first. A page near the top (e.g. the latest capture) only
+        # needs a partial sort rather than sorting every record.
+        if limit:
+            screenshots = heapq.nlargest(offset + limit, self._cache.values(), key=lambda s: s.timestamp.value)
+            return screenshots[offset:]
         
-        # Apply pagination
-        end_index = offset + limit if limit else None
-        return screenshots[offset:end_index]
+        screenshots = sorted(self._cache.values(), key=lambda s: s.timestamp.value, reverse=True)
+        return screenshots[offset:]
     
     async def find_by_session(self, session_id: str) -> List[Screenshot]:
         """Find screenshots by monitoring session ID"""
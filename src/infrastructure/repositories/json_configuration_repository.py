@@ -2,22 +2,57 @@
 JSON Configuration Repository Implementation
 Stores configuration in JSON files with validation and backup
 """
-import json
 import asyncio
+import atexit
+import functools
+import os
 import shutil
+import threading
+import weakref
 from typing import Any, Dict, List, Optional
 from datetime import datetime
 from pathlib import Path
 import logging
 
+from src.domain.events.system_events import ConfigurationChanged
+from src.domain.interfaces.event_service import IEventService
 from src.domain.repositories.configuration_repository import IConfigurationRepository
+from src.utils import json_codec
+
+try:
+    import watchfiles  # OS file change notifications (inotify, FSEvents, ...)
+except ImportError:
+    watchfiles = None
 
 
 logger = logging.getLogger(__name__)
 
+# Pending-change marker for a deleted key
+_DELETED = object()
+
+
+def _flush_at_exit(repository_ref: "weakref.ref[JsonConfigurationRepository]"):
+    """atexit hook; holds the repository weakly so it can still be collected"""
+    repository = repository_ref()
+    if repository is not None:
+        repository.flush()
+
 
 class JsonConfigurationRepository(IConfigurationRepository):
-    """JSON file-based implementation of configuration repository"""
+    """JSON file-based implementation of configuration repository
+    
+    Changes made through set_config, delete_config and update_section are
+    written back after a short delay, so a burst of updates costs one file
+    write and one backup. Call flush() to write immediately; pending changes
+    are also written at interpreter exit or by dispose(). If a delayed write
+    fails, the next change is written immediately and reports the result.
+    
+    start_hot_reload() picks up edits made to the file by other processes.
+    Changes still waiting to be written are reapplied on top of the reloaded
+    file, so neither side's edits are lost.
+    """
+    
+    FLUSH_DELAY = 0.25  # seconds to wait for further changes before writing
     
     def __init__(self, config_file_path: Path):
         self.config_file_path = Path(config_file_path)
@@ -32,6 +67,22 @@ class JsonConfigurationRepository(IConfigurationRepository):
         self._config_loaded = False
         self._lock = asyncio.Lock()
         
+        # Write coalescing. _flush_lock guards _config against the flush
+        # timer thread, which serializes it outside the event loop.
+        self._dirty = False
+        self._pending_changes: Dict[str, Any] = {}  # key -> value (or _DELETED) not yet written
+        self._flush_timer: Optional[threading.Timer] = None
+        self._flush_lock = threading.Lock()
+        self._write_error: Optional[Exception] = None  # last failed write, until one succeeds
+        self._atexit_hook = functools.partial(_flush_at_exit, weakref.ref(self))
+        atexit.register(self._atexit_hook)
+        
+        # Hot reload. _file_mtime_ns is the mtime of the file as last read or
+        # written here, so the watcher can ignore our own writes.
+        self._file_mtime_ns: Optional[int] = None
+        self._watch_thread: Optional[threading.Thread] = None
+        self._watch_stop: Optional[threading.Event] = None
+        
         # Default configuration schema
         self._schema = {
             "screenshot": {
@@ -67,8 +118,10 @@ class JsonConfigurationRepository(IConfigurationRepository):
         async with self._lock:
             try:
                 if self.config_file_path.exists():
-                    with open(self.config_file_path, 'r') as f:
-                        self._config = json.load(f)
+                    mtime_ns = os.stat(self.config_file_path).st_mtime_ns
+                    with open(self.config_file_path, 'rb') as f:
+                        self._config = json_codec.loads(f.read())
+                    self._file_mtime_ns = mtime_ns
                 else:
                     # Create default configuration
                     self._config = self._schema.copy()
@@ -83,22 +136,218 @@ class JsonConfigurationRepository(IConfigurationRepository):
                 self._config_loaded = True
     
     async def _save_config(self):
-        """Save configuration to file"""
+        """Save configuration to file now, superseding any pending flush"""
+        self._cancel_flush()
+        self._write_config()
+    
+    def _write_config(self):
+        """Back up the current file and atomically replace it with _config"""
         try:
-            # Create backup before saving
-            await self._create_backup()
-            
-            with open(self.config_file_path, 'w') as f:
-                json.dump(self._config, f, indent=2, default=str)
+            with self._flush_lock:
+                self._dirty = False
+                self._pending_changes.clear()
+                content = json_codec.dumps(self._config, indent=True, default=str)
+                
+                # Create backup before saving
+                self._backup_file()
+                
+                temp_path = self.config_file_path.with_name(self.config_file_path.name + '.tmp')
+                with open(temp_path, 'wb') as f:
+                    f.write(content)
+                os.replace(temp_path, self.config_file_path)
+                self._file_mtime_ns = os.stat(self.config_file_path).st_mtime_ns
+                self._write_error = None
             
             logger.debug(f"Saved configuration to {self.config_file_path}")
             
         except Exception as e:
             logger.error(f"Failed to save configuration: {e}")
+            with self._flush_lock:
+                # Still unwritten; keep it pending for the next flush
+                self._dirty = True
+                self._write_error = e
             raise
     
+    def _record_change(self, key: str, value: Any) -> bool:
+        """Apply a change to _config and remember it until it is written
+        
+        Call with _flush_lock held.
+        
+        Returns:
+            False if value is _DELETED and key does not exist, True otherwise
+        """
+        if value is _DELETED:
+            if not self._delete_nested_value(self._config, key):
+                return False
+        else:
+            self._set_nested_value(self._config, key, value)
+        # Re-insert so reapplying in order keeps the latest change last
+        self._pending_changes.pop(key, None)
+        self._pending_changes[key] = value
+        return True
+    
+    def _mark_dirty(self) -> bool:
+        """Schedule a coalesced write of _config
+        
+        Changes made while a write is pending join it rather than restarting
+        the delay. After a failed delayed write, writes now instead.
+        
+        Returns:
+            False if writing now was needed and failed, True otherwise
+        """
+        with self._flush_lock:
+            self._dirty = True
+            if self._write_error is None:
+                if self._flush_timer is None:
+                    self._flush_timer = threading.Timer(self.FLUSH_DELAY, self.flush)
+                    self._flush_timer.daemon = True
+                    self._flush_timer.start()
+                return True
+        return self.flush()
+    
+    def _cancel_flush(self):
+        """Drop the pending flush timer, if any"""
+        with self._flush_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+    
+    def flush(self) -> bool:
+        """Write pending configuration changes to disk immediately
+        
+        Returns:
+            False if a pending write failed, True otherwise
+        """
+        self._cancel_flush()
+        if not self._dirty:
+            return True
+        try:
+            self._write_config()
+            return True
+        except Exception:
+            return False
+    
+    def start_hot_reload(self, event_service: Optional[IEventService] = None,
+                         loop: Optional[asyncio.AbstractEventLoop] = None) -> bool:
+        """Reload the configuration when another process changes the file
+        
+        A daemon thread waits on OS change notifications for the file. After
+        each reload a ConfigurationChanged event is published to event_service
+        for every changed section, on loop if given, otherwise on a private
+        loop in the watcher thread.
+        
+        Returns:
+            False if watchfiles is not installed, True otherwise
+        """
+        if watchfiles is None:
+            logger.warning("watchfiles not installed, configuration hot reload disabled")
+            return False
+        
+        if self._watch_thread is not None and self._watch_thread.is_alive():
+            return True
+        
+        self._watch_stop = threading.Event()
+        self._watch_thread = threading.Thread(
+            target=self._watch_config_file,
+            args=(event_service, loop),
+            name="config-hot-reload",
+            daemon=True
+        )
+        self._watch_thread.start()
+        logger.info(f"Watching {self.config_file_path} for changes")
+        return True
+    
+    def stop_hot_reload(self):
+        """Stop the file watcher started by start_hot_reload()"""
+        if self._watch_stop is not None:
+            self._watch_stop.set()
+        if self._watch_thread is not None:
+            self._watch_thread.join(timeout=2.0)
+            self._watch_thread = None
+    
+    def dispose(self):
+        """Stop watching the file and write pending changes"""
+        self.stop_hot_reload()
+        self.flush()
+        atexit.unregister(self._atexit_hook)
+    
+    def _watch_config_file(self, event_service: Optional[IEventService],
+                           loop: Optional[asyncio.AbstractEventLoop]):
+        """Watcher thread body"""
+        # Watch the directory: saves replace the file, which drops a watch on
+        # the old inode. The backups directory is skipped by recursive=False.
+        file_name = self.config_file_path.name
+        try:
+            for _ in watchfiles.watch(
+                self.config_file_path.parent,
+                watch_filter=lambda change, path: os.path.basename(path) == file_name,
+                recursive=False,
+                stop_event=self._watch_stop
+            ):
+                events = self._reload_changed_file()
+                if events and event_service is not None:
+                    self._publish_changes(event_service, loop, events)
+        except Exception as e:
+            logger.error(f"Configuration file watcher stopped: {e}")
+    
+    def _reload_changed_file(self) -> List[ConfigurationChanged]:
+        """Re-read the file if it changed since we last read or wrote it"""
+        try:
+            mtime_ns = os.stat(self.config_file_path).st_mtime_ns
+            if mtime_ns == self._file_mtime_ns:
+                return []
+            with open(self.config_file_path, 'rb') as f:
+                new_config = json_codec.loads(f.read())
+        except Exception as e:
+            # Deleted, or caught half-written by a non-atomic editor; the
+            # next change notification retries
+            logger.warning(f"Could not reload configuration: {e}")
+            return []
+        
+        with self._flush_lock:
+            old_config = self._config
+            # Keep changes made here that the pending flush has not written
+            for key, value in self._pending_changes.items():
+                if value is _DELETED:
+                    self._delete_nested_value(new_config, key)
+                else:
+                    self._set_nested_value(new_config, key, value)
+            self._config = new_config
+            self._config_loaded = True
+            self._file_mtime_ns = mtime_ns
+        
+        logger.info(f"Reloaded configuration from {self.config_file_path}")
+        
+        sections = set(old_config) | set(new_config)
+        return [
+            ConfigurationChanged(
+                config_section=section,
+                old_values=old_config.get(section, {}),
+                new_values=new_config.get(section, {}),
+                changed_by="file"
+            )
+            for section in sorted(sections)
+            if old_config.get(section) != new_config.get(section)
+        ]
+    
+    def _publish_changes(self, event_service: IEventService,
+                         loop: Optional[asyncio.AbstractEventLoop],
+                         events: List[ConfigurationChanged]):
+        """Publish reload events from the watcher thread"""
+        try:
+            if loop is not None:
+                asyncio.run_coroutine_threadsafe(event_service.publish_batch(events), loop)
+            else:
+                asyncio.run(event_service.publish_batch(events))
+        except Exception as e:
+            logger.error(f"Failed to publish configuration changes: {e}")
+    
     async def _create_backup(self) -> str:
         """Create backup of current configuration"""
+        return self._backup_file()
+    
+    def _backup_file(self) -> str:
+        """Copy the configuration file to a timestamped backup"""
         try:
             if not self.config_file_path.exists():
                 return ""
@@ -143,6 +392,22 @@ class JsonConfigurationRepository(IConfigurationRepository):
         # Set the final value
         current[keys[-1]] = value
     
+    def _delete_nested_value(self, config: Dict[str, Any], key: str) -> bool:
+        """Delete nested configuration value using dot notation"""
+        keys = key.split('.')
+        current = config
+        
+        # Navigate to the parent of the target key
+        for k in keys[:-1]:
+            if not isinstance(current, dict) or k not in current:
+                return False
+            current = current[k]
+        
+        if not isinstance(current, dict) or keys[-1] not in current:
+            return False
+        del current[keys[-1]]
+        return True
+    
     async def get_config(self, key: str) -> Optional[Any]:
         """Get configuration value by key"""
         await self._ensure_config_loaded()
@@ -156,8 +421,10 @@ class JsonConfigurationRepository(IConfigurationRepository):
         
         async with self._lock:
             try:
-                self._set_nested_value(self._config, key, value)
-                await self._save_config()
+                with self._flush_lock:
+                    self._record_change(key, value)
+                if not self._mark_dirty():
+                    return False
                 
                 logger.info(f"Set configuration {key} = {value}")
                 return True
@@ -172,24 +439,15 @@ class JsonConfigurationRepository(IConfigurationRepository):
         
         async with self._lock:
             try:
-                keys = key.split('.')
-                current = self._config
-                
-                # Navigate to the parent of the target key
-                for k in keys[:-1]:
-                    if k not in current:
-                        return False
-                    current = current[k]
-                
-                # Delete the final key
-                if keys[-1] in current:
-                    del current[keys[-1]]
-                    await self._save_config()
-                    
-                    logger.info(f"Deleted configuration key: {key}")
-                    return True
+                with self._flush_lock:
+                    deleted = self._record_change(key, _DELETED)
+                if not deleted:
+                    return False
+                if not self._mark_dirty():
+                    return False
                 
-                return False
+                logger.info(f"Deleted configuration key: {key}")
+                return True
                 
             except Exception as e:
                 logger.error(f"Failed to delete configuration {key}: {e}")
@@ -215,8 +473,10 @@ class JsonConfigurationRepository(IConfigurationRepository):
         
         async with self._lock:
             try:
-                self._config[section] = config
-                await self._save_config()
+                with self._flush_lock:
+                    self._record_change(section, config)
+                if not self._mark_dirty():
+                    return False
                 
                 logger.info(f"Updated configuration section: {section}")
                 return True
@@ -259,6 +519,7 @@ class JsonConfigurationRepository(IConfigurationRepository):
     async def backup_config(self) -> str:
         """Create backup of current configuration"""
         await self._ensure_config_loaded()
+        self.flush()  # back up what callers have set, not the last flushed state
         return await self._create_backup()
     
     async def restore_config(self, backup_id: str) -> bool:
@@ -271,8 +532,8 @@ class JsonConfigurationRepository(IConfigurationRepository):
                 return False
             
             # Load backup configuration
-            with open(backup_path, 'r') as f:
-                backup_config = json.load(f)
+            with open(backup_path, 'rb') as f:
+                backup_config = json_codec.loads(f.read())
             
             async with self._lock:
                 self._config = backup_config
@@ -326,6 +587,7 @@ class JsonConfigurationRepository(IConfigurationRepository):
         """Reload configuration from source"""
         try:
             async with self._lock:
+                self.flush()  # don't lose changes still waiting to be written
                 self._config_loaded = False
             
             await self._load_config()
@@ -3,6 +3,7 @@ Memory-based Screenshot Repository Implementation
 Stores screenshots in memory for fast access and testing
 """
 import asyncio
+import heapq
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
 import logging
@@ -66,13 +67,14 @@ class MemoryScreenshotRepository(IScreenshotRepository):
     ) -> List[Screenshot]:
         """List all screenshots with pagination"""
         async with self._lock:
-            screenshots = list(self._screenshots.values())
-            # Sort by timestamp (newest first)
-            screenshots.sort(key=lambda s: s.timestamp.value, reverse=True)
+            # Newest first. A page near the top (e.g. the latest capture) only
+            # needs a partial sort rather than sorting every record.
+            if limit:
+                screenshots = heapq.nlargest(offset + limit, self._screenshots.values(), key=lambda s: s.timestamp.value)
+                return screenshots[offset:]
             
-            # Apply pagination
-            end_index = offset + limit if limit else None
-            return screenshots[offset:end_index]
+            screenshots = sorted(self._screenshots.values(), key=lambda s: s.timestamp.value, reverse=True)
+            return screenshots[offset:]
     
     async def find_by_session(self, session_id: str) -> List[Screenshot]:
         """Find screenshots by monitoring session ID"""
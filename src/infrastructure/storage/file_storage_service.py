@@ -17,6 +17,7 @@ class FileStorageService(IFileStorageService):
     def __init__(self, storage_strategy: IStorageStrategy):
         self._storage_strategy = storage_strategy
         self._logger = logging.getLogger(__name__)
+        self._known_dirs: set = set()  # directories already created by save_metadata
     
     async def save_file(
         self, 
@@ -205,7 +206,9 @@ class FileStorageService(IFileStorageService):
                 path_obj = file_path
                 
             # Ensure parent directory exists
-            path_obj.parent.mkdir(parents=True, exist_ok=True)
+            if path_obj.parent not in self._known_dirs:
+                path_obj.parent.mkdir(parents=True, exist_ok=True)
+                self._known_dirs.add(path_obj.parent)
             
             # Write JSON data synchronously in thread
             def write_json():
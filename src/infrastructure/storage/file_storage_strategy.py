@@ -14,6 +14,7 @@ from ...domain.entities.screenshot import Screenshot
 from ...domain.value_objects.timestamp import Timestamp
 from ...domain.value_objects.file_path import FilePath
 from ...domain.value_objects.coordinates import Coordinates
+from ...utils.image_format import image_format, image_extension
 
 
 class FileStorageStrategy(IStorageStrategy):
@@ -23,9 +24,13 @@ class FileStorageStrategy(IStorageStrategy):
         self.base_path = Path(base_path)
         self.max_screenshots = max_screenshots
         self.metadata_file = self.base_path / "metadata.json"
+        self.images_path = self.base_path / "images"
         
-        # Ensure directory exists
+        # Ensure directories exist. Directories created here or by
+        # save_screenshot are remembered so later writes skip the mkdir.
         self.base_path.mkdir(parents=True, exist_ok=True)
+        self.images_path.mkdir(parents=True, exist_ok=True)
+        self._known_dirs = {self.base_path, self.images_path}
         
         # Load existing metadata
         self._metadata: Dict[str, Dict[str, Any]] = self._load_metadata()
@@ -34,12 +39,8 @@ class FileStorageStrategy(IStorageStrategy):
         """Store screenshot to file system"""
         try:
             # Create filename based on timestamp and ID
-            filename = f"{screenshot.id}.png"
-            file_path = self.base_path / "images" / filename
-            
-            # Create directories if needed
-            image_dir = self.base_path / "images"
-            image_dir.mkdir(parents=True, exist_ok=True)
+            filename = f"{screenshot.id}{image_extension(image_format(screenshot.data, screenshot.format))}"
+            file_path = self.images_path / filename
             
             print(f"💾 Saving screenshot to {file_path}")
             
@@ -314,7 +315,9 @@ class FileStorageStrategy(IStorageStrategy):
         try:
             # Create directory if it doesn't exist
             path = Path(file_path)
-            path.parent.mkdir(parents=True, exist_ok=True)
+            if path.parent not in self._known_dirs:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                self._known_dirs.add(path.parent)
             
             # Write binary content to file
             with open(path, 'wb') as f:
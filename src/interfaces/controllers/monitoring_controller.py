@@ -29,14 +29,14 @@ class MonitoringController:
             # Get active sessions
             active_sessions = await self.monitoring_service.list_active_sessions()
             
-            # Get screenshot count
-            screenshots = await self.screenshot_service.list_screenshots()
-            screenshot_count = len(screenshots)
+            # Get screenshot count; only the newest screenshot is listed
+            screenshot_count = await self.screenshot_service.count_screenshots()
+            latest = await self.screenshot_service.list_screenshots(limit=1)
             
             # Calculate last capture time
             last_capture = None
-            if screenshots:
-                last_capture = screenshots[0].timestamp.value.isoformat()
+            if latest:
+                last_capture = latest[0].timestamp.value.isoformat()
             
             status = {
                 'active': len(active_sessions) > 0,  # Frontend expects 'active' not 'monitoring_active'
@@ -0,0 +1,41 @@
+"""
+Image format helpers for ScreenAgent
+Map the encoded formats the capture chain produces to file extensions and MIME types
+"""
+from typing import Optional
+
+# Format name (as in capture metadata['format']) -> (file extension, MIME type)
+IMAGE_FORMATS = {
+    'png': ('.png', 'image/png'),
+    'jpeg': ('.jpg', 'image/jpeg'),
+}
+
+_JPEG_MAGIC = b'\xff\xd8\xff'
+
+
+def image_format(data: Optional[bytes], declared: Optional[str] = None) -> str:
+    """Format of encoded image data, 'png' or 'jpeg'
+
+    A declared format (e.g. a capture result's metadata['format'] or a
+    Screenshot's format) is trusted when it is one of IMAGE_FORMATS;
+    otherwise the data's signature decides, defaulting to PNG.
+    """
+    if declared:
+        declared = declared.lower()
+        if declared == 'jpg':
+            declared = 'jpeg'
+        if declared in IMAGE_FORMATS:
+            return declared
+    if data and data[:3] == _JPEG_MAGIC:
+        return 'jpeg'
+    return 'png'
+
+
+def image_extension(fmt: str) -> str:
+    """File extension, with the dot, for a format returned by image_format"""
+    return IMAGE_FORMATS[fmt][0]
+
+
+def image_mime_type(fmt: str) -> str:
+    """MIME type for a format returned by image_format"""
+    return IMAGE_FORMATS[fmt][1]
@@ -0,0 +1,39 @@
+"""
+JSON encoding helpers for ScreenAgent
+Uses orjson when installed and falls back to the standard library
+"""
+import json
+from typing import Any, Callable, Optional
+
+try:
+    import orjson  # Rust JSON codec, several times faster than json
+except ImportError:
+    orjson = None
+
+
+def dumps(obj: Any, indent: bool = False, sort_keys: bool = False,
+          default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes
+
+    indent gives the two-space layout used for configuration files.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=default, option=option)
+
+    return json.dumps(obj, indent=2 if indent else None, sort_keys=sort_keys,
+                      default=default, ensure_ascii=False).encode('utf-8')
+
+
+def loads(data: Any) -> Any:
+    """Deserialize JSON from bytes or str
+
+    Decode errors are json.JSONDecodeError with either backend.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
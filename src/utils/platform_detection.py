@@ -4,11 +4,12 @@ Detects WSL, Linux, Windows environments and chooses appropriate screenshot meth
 """
 import os
 import platform
-import subprocess
+from functools import lru_cache
 from typing import Optional
 
+@lru_cache(maxsize=None)
 def is_wsl() -> bool:
-    """Check if running in Windows Subsystem for Linux"""
+    """Check if running in Windows Subsystem for Linux (probed once per process)"""
     try:
         # Check for WSL in kernel version
         with open('/proc/version', 'r') as f:
@@ -19,17 +20,10 @@ def is_wsl() -> bool:
         # Alternative check: WSL environment variable
         if os.environ.get('WSL_DISTRO_NAME'):
             return True
-            
-        # Check if we can run PowerShell (another WSL indicator)
-        try:
-            result = subprocess.run(
-                ['powershell.exe', '-Command', 'echo "test"'], 
-                capture_output=True, 
-                timeout=5
-            )
-            return result.returncode == 0
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            pass
+        
+        # Neither WSL marker, so this is a plain Linux kernel; probing for
+        # powershell.exe would only spawn a process to find it missing
+        return False
             
     except Exception:
         pass
@@ -65,8 +59,9 @@ def get_platform_info() -> dict:
         'python_version': platform.python_version(),
     }
 
+@lru_cache(maxsize=None)
 def get_recommended_screenshot_method() -> str:
-    """Get the recommended screenshot method for the current platform"""
+    """Get the recommended screenshot method for the current platform (probed once per process)"""
     if is_wsl():
         return 'wsl_powershell'
     elif is_windows():
@@ -0,0 +1,41 @@
+"""
+Tests for change detection in the analysis service
+"""
+import asyncio
+
+from src.application.services.analysis_service import AnalysisService
+from src.domain.entities.screenshot import Screenshot
+from src.infrastructure.events.event_service import EventService
+from src.infrastructure.monitoring.hash_comparison_detector import HashComparisonDetector
+
+
+def screenshot(data: bytes) -> Screenshot:
+    return Screenshot(data=data, size_bytes=len(data))
+
+
+def detect(service: AnalysisService, reference: bytes, current: bytes, threshold: float = 20.0):
+    return asyncio.run(service.detect_changes(screenshot(reference), screenshot(current), threshold))
+
+
+class TestDetectChanges:
+    """Frames that differ are judged by the injected detector"""
+
+    def setup_method(self):
+        self.service = AnalysisService(
+            analysis_repository=None,
+            event_service=EventService(),
+            change_detector=HashComparisonDetector()
+        )
+
+    def test_identical_frames_are_unchanged(self):
+        assert detect(self.service, b"frame" * 100, b"frame" * 100) == (False, 0.0)
+
+    def test_equal_size_different_frames_are_changed(self):
+        changed, score = detect(self.service, b"a" * 500, b"a" * 499 + b"b")
+        assert changed
+        assert score == 100.0
+
+    def test_without_detector_sizes_are_compared(self):
+        service = AnalysisService(analysis_repository=None, event_service=EventService())
+        assert detect(service, b"a" * 100, b"b" * 100) == (False, 0.0)
+        assert detect(service, b"a" * 100, b"b" * 50) == (True, 50.0)
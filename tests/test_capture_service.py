@@ -0,0 +1,87 @@
+"""
+Tests for the capture service's use of the capture chain
+"""
+import asyncio
+import threading
+
+from src.domain.value_objects.coordinates import Rectangle
+from src.infrastructure.capture import CaptureResult, ICaptureHandler
+from src.infrastructure.capture.capture_chain import CaptureChainBuilder
+from src.infrastructure.capture.capture_service_impl import CaptureServiceImpl
+
+
+class FakeHandler(ICaptureHandler):
+    """Handler that records where it was initialized and what it captured"""
+
+    def __init__(self, data: bytes = b"", works: bool = True):
+        super().__init__()
+        self._data = data
+        self._works = works
+        self.init_thread = None
+        self.captured = []
+
+    def can_handle(self) -> bool:
+        return True
+
+    def initialize(self) -> bool:
+        self.init_thread = threading.current_thread()
+        self._initialized = self._works
+        return self._works
+
+    def _capture_full_screen(self) -> CaptureResult:
+        return CaptureResult(True, self._data)
+
+    def _capture_roi(self, roi) -> CaptureResult:
+        self.captured.append(roi)
+        return CaptureResult(True, self._data)
+
+    def cleanup(self) -> None:
+        self._initialized = False
+
+
+def service_with_chain(*handlers: ICaptureHandler) -> CaptureServiceImpl:
+    """Capture service whose chain is the given handlers, initialized lazily"""
+    for handler, next_handler in zip(handlers, handlers[1:]):
+        handler.set_next(next_handler)
+    builder = CaptureChainBuilder()
+    builder._chain_cache = handlers[0]
+    service = CaptureServiceImpl()
+    service._capture_chain = builder
+    service._initialized = True
+    return service
+
+
+class TestRegionCapture:
+    """Region captures go through the chain's asynchronous ROI path"""
+
+    def test_deferred_initialize_runs_off_the_loop(self):
+        handler = FakeHandler(b"frame")
+        service = service_with_chain(handler)
+
+        async def capture():
+            return threading.current_thread(), await service.capture_region(Rectangle(10, 20, 110, 70))
+        loop_thread, result = asyncio.run(capture())
+
+        assert result.success and result.data == b"frame"
+        assert handler.captured == [(10, 20, 110, 70)]
+        assert handler.init_thread is not None and handler.init_thread is not loop_thread
+
+    def test_falls_back_along_the_chain(self):
+        broken, fallback = FakeHandler(works=False), FakeHandler(b"fallback")
+        service = service_with_chain(broken, fallback)
+
+        result = asyncio.run(service.capture_roi((0, 0, 50, 50)))
+
+        assert result.data == b"fallback"
+        assert broken.captured == []
+        assert fallback.captured == [(0, 0, 50, 50)]
+
+    def test_scaled_capture_uses_the_blocking_path(self):
+        handler = FakeHandler(b"frame")
+        service = service_with_chain(handler)
+
+        # The fake frame is not an image, so downsampling it fails
+        result = asyncio.run(service.capture_roi((0, 0, 50, 50), scale=0.5))
+
+        assert not result.success
+        assert handler.captured == [(0, 0, 50, 50)]
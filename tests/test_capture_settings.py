@@ -0,0 +1,51 @@
+"""
+Tests for the capture settings reaching the capture service
+"""
+from src.domain.interfaces.capture_service import ICaptureService
+from src.infrastructure.capture import DEFAULT_JPEG_QUALITY, DEFAULT_PNG_COMPRESS_LEVEL
+from src.infrastructure.dependency_injection.container import ContainerBuilder
+
+
+def build_capture_service(config_file):
+    """Capture service from a container configured like main.py does"""
+    builder = ContainerBuilder().configure_default_services({
+        "capture": {"platform": "unknown"},
+        "config_file": str(config_file)
+    })
+    return builder.build().get(ICaptureService)
+
+
+class TestCaptureSettings:
+    """capture.* settings from the config file and environment configure captures"""
+
+    def test_defaults(self, tmp_path):
+        service = build_capture_service(tmp_path / "missing.json")
+        assert service._png_compress_level == DEFAULT_PNG_COMPRESS_LEVEL
+        assert service._output_format == 'png'
+        assert service._jpeg_quality == DEFAULT_JPEG_QUALITY
+
+    def test_environment_overrides_config_file(self, tmp_path, monkeypatch):
+        config_file = tmp_path / "config.json"
+        config_file.write_text('{"capture.png_compress_level": 6, "capture.jpeg_quality": 70}')
+        monkeypatch.setenv("SCREENAGENT_PNG_COMPRESS_LEVEL", "9")
+        monkeypatch.setenv("SCREENAGENT_CAPTURE_FORMAT", "jpeg")
+
+        service = build_capture_service(config_file)
+        assert service._png_compress_level == 9
+        assert service._output_format == 'jpeg'
+        assert service._jpeg_quality == 70
+
+    def test_nested_section_in_config_file(self, tmp_path):
+        # JsonConfigurationRepository.set_config("capture.format", ...) nests the key
+        config_file = tmp_path / "config.json"
+        config_file.write_text('{"capture": {"format": "jpeg", "png_compress_level": 4}}')
+
+        service = build_capture_service(config_file)
+        assert service._output_format == 'jpeg'
+        assert service._png_compress_level == 4
+
+    def test_invalid_setting_is_ignored(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("SCREENAGENT_CAPTURE_FORMAT", "gif")
+
+        service = build_capture_service(tmp_path / "missing.json")
+        assert service._output_format == 'png'
@@ -0,0 +1,59 @@
+"""
+Tests for the in-process event service
+"""
+import asyncio
+import threading
+
+from src.domain.events.screenshot_captured import ScreenshotCaptured, ScreenshotAnalysisStarted
+from src.infrastructure.events.event_service import EventService
+
+
+class TestEventService:
+    """History, statistics and delivery of published events"""
+
+    def test_zero_history_still_delivers(self):
+        service = EventService(max_history=0)
+        received = []
+
+        async def handler(event):
+            received.append(event)
+
+        service.subscribe(ScreenshotCaptured, handler)
+        asyncio.run(service.publish(ScreenshotCaptured(screenshot_id="a")))
+
+        assert [e.screenshot_id for e in received] == ["a"]
+        stats = service.get_stats()
+        assert stats["total_published"] == 1
+        assert stats["history_size"] == 0
+        assert stats["record_history"] is False
+
+    def test_stats_follow_eviction(self):
+        service = EventService(max_history=3, record_history=True)
+        events = [ScreenshotCaptured(), ScreenshotCaptured(), ScreenshotAnalysisStarted(),
+                  ScreenshotAnalysisStarted(), ScreenshotAnalysisStarted()]
+        asyncio.run(service.publish_batch(events))
+
+        stats = service.get_stats()
+        assert stats["total_published"] == 5
+        assert stats["history_size"] == 3
+        assert stats["event_counts"] == {"ScreenshotAnalysisStarted": 3}
+        assert service.get_event_history() == events[2:]
+        assert service.get_event_history(limit=2) == events[3:]
+
+    def test_publish_nowait_delivers_from_drainer_thread(self):
+        service = EventService(record_history=True)
+        delivered = threading.Event()
+        received = []
+
+        def handler(event):
+            received.append(event.screenshot_id)
+            if len(received) == 3:
+                delivered.set()
+
+        service.subscribe(ScreenshotCaptured, handler)
+        for screenshot_id in ("a", "b", "c"):
+            service.publish_nowait(ScreenshotCaptured(screenshot_id=screenshot_id))
+
+        assert delivered.wait(5)
+        assert received == ["a", "b", "c"]
+        assert service.get_stats()["total_published"] == 3
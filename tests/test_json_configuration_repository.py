@@ -0,0 +1,136 @@
+"""
+Tests for the JSON file configuration repository
+"""
+import asyncio
+import json
+import time
+
+from src.infrastructure.dependency_injection.container import ContainerBuilder
+from src.infrastructure.repositories import json_configuration_repository
+from src.infrastructure.repositories.json_configuration_repository import JsonConfigurationRepository
+
+
+def read_config(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+class TestDeferredWrites:
+    """set_config and friends write the file once per burst of changes"""
+
+    def test_burst_is_written_once(self, tmp_path, monkeypatch):
+        config_file = tmp_path / "config.json"
+        config_file.write_text('{"server": {"port": 8000}}')
+        repository = JsonConfigurationRepository(config_file)
+        repository.FLUSH_DELAY = 0.05
+        writes = []
+        write_config = repository._write_config
+
+        def counting_write():
+            writes.append(1)
+            write_config()
+        monkeypatch.setattr(repository, "_write_config", counting_write)
+
+        async def change():
+            await repository._ensure_config_loaded()
+            for port in range(9000, 9010):
+                assert await repository.set_config("server.port", port)
+        asyncio.run(change())
+        assert writes == []
+
+        time.sleep(0.3)
+        assert writes == [1]
+        assert read_config(config_file) == {"server": {"port": 9009}}
+        repository.dispose()
+
+    def test_failed_write_is_reported_by_next_change(self, tmp_path, monkeypatch):
+        config_file = tmp_path / "config.json"
+        config_file.write_text('{"server": {"port": 8000}}')
+        repository = JsonConfigurationRepository(config_file)
+        repository.FLUSH_DELAY = 60
+
+        def fail(src, dst):
+            raise OSError("disk full")
+        monkeypatch.setattr(json_configuration_repository.os, "replace", fail)
+
+        async def change(port):
+            await repository._ensure_config_loaded()
+            return await repository.set_config("server.port", port)
+
+        assert asyncio.run(change(9000))
+        assert not repository.flush()  # the delayed write fails
+        assert not asyncio.run(change(9001))  # written now, and fails again
+
+        monkeypatch.undo()
+        assert asyncio.run(change(9002))
+        assert read_config(config_file) == {"server": {"port": 9002}}
+        repository.dispose()
+
+    def test_dispose_writes_pending_changes(self, tmp_path):
+        config_file = tmp_path / "config.json"
+        config_file.write_text('{"server": {"port": 8000}}')
+        repository = JsonConfigurationRepository(config_file)
+        repository.FLUSH_DELAY = 60
+
+        async def change():
+            await repository._ensure_config_loaded()
+            await repository.update_section("server", {"port": 9000})
+        asyncio.run(change())
+
+        repository.dispose()
+        assert read_config(config_file) == {"server": {"port": 9000}}
+
+
+class TestHotReload:
+    """Reloading the file another process changed"""
+
+    def test_reload_keeps_pending_changes(self, tmp_path):
+        config_file = tmp_path / "config.json"
+        config_file.write_text('{"server": {"port": 8000}, "roi": [0, 0, 10, 10]}')
+        repository = JsonConfigurationRepository(config_file)
+        repository.FLUSH_DELAY = 60  # keep our change pending
+
+        async def change():
+            await repository._ensure_config_loaded()
+            await repository.set_config("server.port", 9000)
+            await repository.delete_config("roi")
+        asyncio.run(change())
+
+        # Another process edits the file before our write
+        config_file.write_text('{"server": {"port": 8000, "host": "0.0.0.0"}, "roi": [1, 1, 5, 5]}')
+        events = repository._reload_changed_file()
+
+        assert repository._config == {"server": {"port": 9000, "host": "0.0.0.0"}}
+        assert [event.config_section for event in events] == ["server"]
+
+        assert repository.flush()
+        assert read_config(config_file) == {"server": {"port": 9000, "host": "0.0.0.0"}}
+        repository.dispose()
+
+    def test_reload_after_write_takes_the_file(self, tmp_path):
+        config_file = tmp_path / "config.json"
+        config_file.write_text('{"server": {"port": 8000}}')
+        repository = JsonConfigurationRepository(config_file)
+
+        async def change():
+            await repository._ensure_config_loaded()
+            await repository.set_config("server.port", 9000)
+        asyncio.run(change())
+        assert repository.flush()
+
+        config_file.write_text('{"server": {"port": 7000}}')
+        repository._reload_changed_file()
+
+        assert repository._config == {"server": {"port": 7000}}
+        repository.dispose()
+
+    def test_hot_reload_setting_reaches_container(self, tmp_path):
+        config_file = tmp_path / "config.json"
+        config_file.write_text('{"config": {"hot_reload": true}}')
+
+        container = ContainerBuilder().configure_default_services({
+            "config_file": str(config_file)
+        }).build()
+
+        assert container._configuration["config"]["hot_reload"] is True
+        assert container._configuration["config"]["file"] == str(config_file)
@@ -0,0 +1,94 @@
+"""
+Tests for the pixel difference change detection strategy
+"""
+import io
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from src.infrastructure.monitoring.pixel_diff_detector import PixelDiffDetector
+
+
+def encode_png(pixels: np.ndarray) -> bytes:
+    """Encode an RGB array as PNG bytes"""
+    buffer = io.BytesIO()
+    Image.fromarray(pixels).save(buffer, format='PNG')
+    return buffer.getvalue()
+
+
+def detect(baseline: np.ndarray, current: np.ndarray, threshold: float = 20.0):
+    """Run the detector on one baseline/current pair"""
+    detector = PixelDiffDetector()
+    assert detector.initialize(encode_png(baseline))
+    result = detector.detect_changes(encode_png(current), threshold)
+    assert 'error' not in result
+    return result
+
+
+def checkerboard(height: int, width: int, amplitude: int) -> np.ndarray:
+    """+amplitude/-amplitude on alternating pixels, all three channels"""
+    signs = np.indices((height, width)).sum(axis=0) % 2 * 2 - 1
+    return np.repeat((signs * amplitude)[..., np.newaxis], 3, axis=2)
+
+
+class TestPixelDiffDetector:
+    """Change scores must come from the pixel diff, never from an estimate"""
+
+    def test_identical_frames_are_unchanged(self):
+        frame = np.full((100, 100, 3), 100, np.uint8)
+
+        result = detect(frame, frame.copy())
+
+        assert result['has_changes'] is False
+        assert result['change_score'] == 0.0
+
+    def test_brightened_pixels_are_counted_exactly(self):
+        baseline = np.full((100, 100, 3), 100, np.uint8)
+        mask = np.random.default_rng(0).random((100, 100)) < 0.4
+        current = baseline.copy()
+        current[mask] += 60
+
+        result = detect(baseline, current)
+
+        assert result['has_changes'] is True
+        assert result['change_score'] == pytest.approx(mask.mean() * 100.0)
+
+    def test_mixed_sign_checkerboard_is_a_full_change(self):
+        baseline = np.full((100, 100, 3), 100, np.uint8)
+        current = (baseline + checkerboard(100, 100, 40)).astype(np.uint8)
+
+        result = detect(baseline, current)
+
+        assert result['has_changes'] is True
+        assert result['change_score'] == 100.0
+
+    def test_mirrored_gradient_within_tolerance_is_unchanged(self):
+        ramp = np.tile(np.linspace(100, 110, 100).astype(np.uint8), (100, 1))
+        baseline = np.dstack([ramp] * 3)
+        current = np.ascontiguousarray(baseline[:, ::-1])
+
+        result = detect(baseline, current)
+
+        assert result['has_changes'] is False
+        assert result['change_score'] == 0.0
+
+    def test_mixed_sign_change_on_a_large_frame_is_not_averaged_away(self):
+        # Large enough for any reduced-resolution pass to apply
+        baseline = np.full((600, 800, 3), 100, np.uint8)
+        current = (baseline + checkerboard(600, 800, 40)).astype(np.uint8)
+
+        result = detect(baseline, current)
+
+        assert result['has_changes'] is True
+        assert result['change_score'] == 100.0
+
+    def test_corrupt_frame_is_not_reused_as_baseline(self):
+        detector = PixelDiffDetector()
+        assert detector.initialize(encode_png(np.full((50, 50, 3), 100, np.uint8)))
+        assert 'error' not in detector.detect_changes(encode_png(np.full((50, 50, 3), 200, np.uint8)))
+
+        # Image.open reads the header only; the truncated data fails to decode
+        corrupt = encode_png(np.random.default_rng(0).integers(0, 255, (50, 50, 3), np.uint8))[:200]
+        assert 'error' in detector.detect_changes(corrupt)
+        assert detector.update_baseline(corrupt) is False
@@ -0,0 +1,70 @@
+"""
+Tests for the WSL PowerShell capture handler that need no PowerShell
+"""
+import struct
+
+import pytest
+
+from src.infrastructure.capture.wsl_capture import WSLPowerShellCapture
+
+
+def raw_frame(width: int, height: int) -> bytearray:
+    """A frame as the host sends it with transfer_format='raw'"""
+    return bytearray(struct.pack('<ii', width, height) + bytes(range(256)) * (width * height * 4 // 256))
+
+
+class TestOutputFormat:
+    """The configured output format is honoured whichever side encodes"""
+
+    @pytest.mark.parametrize('output_format, magic', [('png', b'\x89PNG'), ('jpeg', b'\xff\xd8\xff')])
+    def test_python_side_encode(self, output_format, magic):
+        handler = WSLPowerShellCapture(transfer_format='raw', output_format=output_format)
+        handler._decode_frame = handler._create_frame_decoder()
+        assert handler._encode_frame(raw_frame(16, 8)).startswith(magic)
+
+    def test_host_encodes_jpeg(self):
+        handler = WSLPowerShellCapture(transfer_format='png', output_format='jpeg', jpeg_quality=70)
+        assert handler._host_format == 'Jpeg'
+        assert '[long]70' in handler._roi_script((0, 0, 10, 10))
+
+
+class BrokenHost:
+    """A host process whose pipe breaks on the first request"""
+
+    class stdin:
+        @staticmethod
+        def write(data):
+            raise BrokenPipeError("host exited")
+
+        @staticmethod
+        def close():
+            pass
+
+    @staticmethod
+    def poll():
+        return None
+
+    @staticmethod
+    def wait(timeout=None):
+        return 0
+
+
+class TestHostRestart:
+    """A failed persistent host is restarted by the next capture, not the failing one"""
+
+    def test_failed_host_restarts_on_next_capture(self, monkeypatch):
+        handler = WSLPowerShellCapture()
+        handler._host, handler._host_wanted = BrokenHost(), True
+        starts = []
+        monkeypatch.setattr(handler, '_start_host', lambda: starts.append(1) or False)
+
+        assert handler._host_capture("full", "full screen capture") is None
+        assert handler._host is None
+        assert starts == []
+
+        assert handler._host_capture("full", "full screen capture") is None
+        assert starts == [1]
+
+        # The restart failed, so later captures go straight to one-shot scripts
+        assert handler._host_capture("full", "full screen capture") is None
+        assert starts == [1]